@@ -0,0 +1,103 @@
+"""Compare the memory held by known_clients entries for offline clients.
+
+Builds the same set of synthetic clients twice, once as full UnifiClient
+wrappers around ClientOverview models and once as compact UnifiClientRecord
+snapshots, and reports the memory retained by each with tracemalloc.
+
+Run from the repository root in an environment with Home Assistant installed:
+
+    python benchmarks/known_clients_memory.py --clients 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.unifi_network.api_client.models import ClientOverview
+from custom_components.unifi_network.unifi_client import (
+    UnifiClient,
+    UnifiClientRecord,
+)
+
+
+def _client_payload(index: int) -> dict[str, Any]:
+    """Return a connected client payload shaped like the integration API."""
+    return {
+        "type": "WIRELESS",
+        "id": str(uuid.UUID(int=index)),
+        "name": f"Client {index}",
+        "connectedAt": "2024-01-01T12:00:00Z",
+        "ipAddress": f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}",
+        "macAddress": f"02:00:{index >> 24 & 255:02x}:{index >> 16 & 255:02x}:"
+        f"{index >> 8 & 255:02x}:{index & 255:02x}",
+        "uplinkDeviceId": str(uuid.UUID(int=1_000_000 + index % 64)),
+        "access": {"type": "DEFAULT"},
+    }
+
+
+def _measure(build) -> tuple[int, dict[str, Any]]:
+    """Return the bytes still allocated by the result of build()."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def main() -> None:
+    """Print the memory retained per offline client for both representations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=10_000)
+    args = parser.parse_args()
+
+    payloads = [_client_payload(index) for index in range(args.clients)]
+    last_seen = datetime(2024, 1, 1, tzinfo=UTC)
+
+    def build_full() -> dict[str, Any]:
+        clients = {}
+        for payload in payloads:
+            client = UnifiClient(
+                overview=ClientOverview.from_dict(payload),
+                details=None,
+                last_seen=last_seen,
+            )
+            clients[client.id] = client
+        return clients
+
+    full_size, full_clients = _measure(build_full)
+
+    def build_compact() -> dict[str, Any]:
+        return {
+            client_id: UnifiClientRecord.from_client(client)
+            for client_id, client in full_clients.items()
+        }
+
+    # Records are built from the full clients, which were allocated before
+    # tracing started, so only the records themselves are counted.
+    compact_size, _ = _measure(build_compact)
+
+    print(f"clients:              {args.clients}")
+    print(
+        f"UnifiClient:          {full_size / 1024:10.1f} KiB"
+        f"  ({full_size / args.clients:7.1f} B/client)"
+    )
+    print(
+        f"UnifiClientRecord:    {compact_size / 1024:10.1f} KiB"
+        f"  ({compact_size / args.clients:7.1f} B/client)"
+    )
+    print(f"saved:                {1 - compact_size / full_size:10.1%}")
+
+
+if __name__ == "__main__":
+    main()
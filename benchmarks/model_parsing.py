@@ -0,0 +1,116 @@
+"""Measure memory and parse time of the generated API models.
+
+Parses synthetic ClientOverview and PortOverview payloads with from_dict and
+from_dict_lazy, and reports the memory retained per object with tracemalloc
+and the parse time per object with timeit. Run it against clients generated
+with and without ``lean_models`` (see openapi_client_generator/templates/
+generator_options.jinja) to compare the two modes.
+
+Run from the repository root, Home Assistant does not need to be installed:
+
+    python benchmarks/model_parsing.py --objects 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import timeit
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Import the generated client on its own so Home Assistant is not required
+sys.path.insert(
+    0,
+    str(Path(__file__).resolve().parent.parent / "custom_components" / "unifi_network"),
+)
+
+from api_client.models import ClientOverview, PortOverview
+
+
+def _client_payload(index: int) -> dict[str, Any]:
+    """Return a connected client payload shaped like the integration API."""
+    return {
+        "type": "WIRELESS",
+        "id": str(uuid.UUID(int=index)),
+        "name": f"Client {index}",
+        "connectedAt": "2024-01-01T12:00:00Z",
+        "ipAddress": f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}",
+        "macAddress": f"02:00:{index >> 24 & 255:02x}:{index >> 16 & 255:02x}:"
+        f"{index >> 8 & 255:02x}:{index & 255:02x}",
+        "uplinkDeviceId": str(uuid.UUID(int=1_000_000 + index % 64)),
+        "access": {"type": "DEFAULT"},
+    }
+
+
+def _port_payload(index: int) -> dict[str, Any]:
+    """Return a switch port payload shaped like the integration API."""
+    return {
+        "idx": index % 48 + 1,
+        "state": "UP",
+        "connector": "RJ45",
+        "maxSpeedMbps": 1000,
+        "speedMbps": 1000,
+        "poe": {
+            "standard": "802.3at",
+            "type": 2,
+            "enabled": True,
+            "state": "UP",
+        },
+    }
+
+
+def _retained_bytes(parse: Callable[[Any], Any], payloads: list[Any]) -> int:
+    """Return the bytes still allocated by the objects parsed from payloads."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [parse(payload) for payload in payloads]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def _parse_seconds(parse: Callable[[Any], Any], payloads: list[Any]) -> float:
+    """Return the best time to parse every payload once."""
+    return min(
+        timeit.repeat(
+            lambda: [parse(payload) for payload in payloads], number=1, repeat=5
+        )
+    )
+
+
+def _report(name: str, parse: Callable[[Any], Any], payloads: list[Any]) -> None:
+    """Print the memory and time per object for one parse function."""
+    count = len(payloads)
+    size = _retained_bytes(parse, payloads)
+    seconds = _parse_seconds(parse, payloads)
+    print(
+        f"{name:32} {size / count:8.1f} B/object"
+        f"  {seconds / count * 1_000_000:8.2f} us/object"
+    )
+
+
+def main() -> None:
+    """Print per-object memory and parse time for each model and mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=10_000)
+    args = parser.parse_args()
+
+    clients = [_client_payload(index) for index in range(args.objects)]
+    ports = [_port_payload(index) for index in range(args.objects)]
+
+    print(f"objects: {args.objects}")
+    _report("ClientOverview.from_dict", ClientOverview.from_dict, clients)
+    _report("ClientOverview.from_dict_lazy", ClientOverview.from_dict_lazy, clients)
+    _report("PortOverview.from_dict", PortOverview.from_dict, ports)
+    _report("PortOverview.from_dict_lazy", PortOverview.from_dict_lazy, ports)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,27 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from .const import DOMAIN, PLATFORMS
-from .core import UnifiNetworkCore
+from .const import (
+    DEFAULT_CLIENT_RECONCILIATION_INTERVAL,
+    DEFAULT_DETAILS_UPDATE_INTERVAL,
+    DEFAULT_HTTP2,
+    DEFAULT_INCREMENTAL_CLIENT_POLLING,
+    DEFAULT_KEEP_RAW_PAYLOADS,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_KNOWN_CLIENTS_MAX_SIZE,
+    DEFAULT_KNOWN_CLIENTS_TTL_DAYS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_REQUESTS_PER_SECOND,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_STATE_DEADBAND_PCT,
+    DEFAULT_SUPPRESS_UNCHANGED_STATES,
+    DOMAIN,
+    PLATFORMS,
+)
+from .core import UnifiNetworkCore, known_clients_store
+from .filters import clients_filter_from_options, devices_filter_from_options
 from .services import async_register_services, async_unregister_services
 
 
@@ -19,8 +38,54 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         enable_devices=entry.data.get("enable_devices", True),
         enable_clients=entry.data.get("enable_clients", True),
         verify_ssl=entry.data.get("verify_ssl", True),
-        devices_filter=entry.options.get("devices_filter"),
-        clients_filter=entry.options.get("clients_filter"),
+        devices_filter=devices_filter_from_options(entry.options),
+        clients_filter=clients_filter_from_options(entry.options),
+        max_concurrent_requests=int(
+            entry.options.get(
+                "max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS
+            )
+        ),
+        max_requests_per_second=entry.options.get(
+            "max_requests_per_second", DEFAULT_MAX_REQUESTS_PER_SECOND
+        ),
+        http2=entry.options.get("http2", DEFAULT_HTTP2),
+        max_connections=int(
+            entry.options.get("max_connections", DEFAULT_MAX_CONNECTIONS)
+        ),
+        keepalive_expiry=entry.options.get(
+            "keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY
+        ),
+        details_update_interval=entry.options.get(
+            "details_update_interval", DEFAULT_DETAILS_UPDATE_INTERVAL
+        ),
+        suppress_unchanged_states=entry.options.get(
+            "suppress_unchanged_states", DEFAULT_SUPPRESS_UNCHANGED_STATES
+        ),
+        state_deadband_pct=entry.options.get(
+            "state_deadband_pct", DEFAULT_STATE_DEADBAND_PCT
+        ),
+        known_clients_ttl_days=entry.options.get(
+            "known_clients_ttl_days", DEFAULT_KNOWN_CLIENTS_TTL_DAYS
+        ),
+        known_clients_max_size=int(
+            entry.options.get("known_clients_max_size", DEFAULT_KNOWN_CLIENTS_MAX_SIZE)
+        ),
+        keep_raw_payloads=entry.options.get(
+            "keep_raw_payloads", DEFAULT_KEEP_RAW_PAYLOADS
+        ),
+        incremental_client_polling=entry.options.get(
+            "incremental_client_polling", DEFAULT_INCREMENTAL_CLIENT_POLLING
+        ),
+        client_reconciliation_interval=entry.options.get(
+            "client_reconciliation_interval", DEFAULT_CLIENT_RECONCILIATION_INTERVAL
+        ),
+        min_update_interval=entry.options.get(
+            "min_update_interval", DEFAULT_MIN_UPDATE_INTERVAL
+        ),
+        max_update_interval=entry.options.get(
+            "max_update_interval", DEFAULT_MAX_UPDATE_INTERVAL
+        ),
+        entry_id=entry.entry_id,
     )
     await core.async_init()
 
@@ -37,7 +102,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload integration."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        core = hass.data[DOMAIN].pop(entry.entry_id)
+        await core.async_unload()
 
         # Remove service if this is the last config entry
         if not hass.data[DOMAIN]:
@@ -46,6 +112,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data stored for a deleted config entry."""
+    await known_clients_store(hass, entry.entry_id).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: ConfigEntry, device_entry: DeviceEntry
 ) -> bool:
@@ -8,6 +8,10 @@ from ...types import Response, UNSET
 from ... import errors
 
 from ...models.client_details import ClientDetails
+from ...models.teleport_client_connection_details import TeleportClientConnectionDetails
+from ...models.vpn_client_connection_details import VPNClientConnectionDetails
+from ...models.wired_client_details import WiredClientDetails
+from ...models.wireless_client_details import WirelessClientDetails
 from uuid import UUID
 
 
@@ -28,10 +32,124 @@ def _get_kwargs(
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[ClientDetails]:
+) -> Optional[
+    Union[
+        "ClientDetails",
+        "TeleportClientConnectionDetails",
+        "VPNClientConnectionDetails",
+        "WiredClientDetails",
+        "WirelessClientDetails",
+    ]
+]:
     if response.status_code == 200:
-        response_200 = ClientDetails.from_dict(response.json())
-
+        if client.lazy_models:
+
+            def _parse_response_200(
+                data: object,
+            ) -> Union[
+                "ClientDetails",
+                "TeleportClientConnectionDetails",
+                "VPNClientConnectionDetails",
+                "WiredClientDetails",
+                "WirelessClientDetails",
+            ]:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                discriminator_value = data.get("type")
+                if discriminator_value == "WIRED":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        response_200_type_0 = WiredClientDetails.from_dict_lazy(data)
+
+                        return response_200_type_0
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                if discriminator_value == "WIRELESS":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        response_200_type_1 = WirelessClientDetails.from_dict_lazy(data)
+
+                        return response_200_type_1
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                if discriminator_value == "VPN":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        response_200_type_2 = VPNClientConnectionDetails.from_dict_lazy(
+                            data
+                        )
+
+                        return response_200_type_2
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                if discriminator_value == "TELEPORT":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        response_200_type_3 = (
+                            TeleportClientConnectionDetails.from_dict_lazy(data)
+                        )
+
+                        return response_200_type_3
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                response_200_type_4 = ClientDetails.from_dict_lazy(data)
+
+                return response_200_type_4
+
+            response_200 = _parse_response_200(client.decode_json(response))
+        else:
+
+            def _parse_response_200(
+                data: object,
+            ) -> Union[
+                "ClientDetails",
+                "TeleportClientConnectionDetails",
+                "VPNClientConnectionDetails",
+                "WiredClientDetails",
+                "WirelessClientDetails",
+            ]:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                discriminator_value = data.get("type")
+                if discriminator_value == "WIRED":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        response_200_type_0 = WiredClientDetails.from_dict(data)
+
+                        return response_200_type_0
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                if discriminator_value == "WIRELESS":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        response_200_type_1 = WirelessClientDetails.from_dict(data)
+
+                        return response_200_type_1
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                if discriminator_value == "VPN":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        response_200_type_2 = VPNClientConnectionDetails.from_dict(data)
+
+                        return response_200_type_2
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                if discriminator_value == "TELEPORT":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        response_200_type_3 = TeleportClientConnectionDetails.from_dict(
+                            data
+                        )
+
+                        return response_200_type_3
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                response_200_type_4 = ClientDetails.from_dict(data)
+
+                return response_200_type_4
+
+            response_200 = _parse_response_200(client.decode_json(response))
         return response_200
 
     if client.raise_on_unexpected_status:
@@ -42,10 +160,18 @@ def _parse_response(
 
 def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[ClientDetails]:
+) -> Response[
+    Union[
+        "ClientDetails",
+        "TeleportClientConnectionDetails",
+        "VPNClientConnectionDetails",
+        "WiredClientDetails",
+        "WirelessClientDetails",
+    ]
+]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=response.content if client.retain_response_content else b"",
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -56,7 +182,15 @@ def sync_detailed(
     client_id: UUID,
     *,
     client: Union[AuthenticatedClient, Client],
-) -> Response[ClientDetails]:
+) -> Response[
+    Union[
+        "ClientDetails",
+        "TeleportClientConnectionDetails",
+        "VPNClientConnectionDetails",
+        "WiredClientDetails",
+        "WirelessClientDetails",
+    ]
+]:
     """Get Connected Client Details
 
      Retrieve detailed information about a specific connected client, including name, IP address, MAC
@@ -71,7 +205,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[ClientDetails]
+        Response[Union['ClientDetails', 'TeleportClientConnectionDetails', 'VPNClientConnectionDetails', 'WiredClientDetails', 'WirelessClientDetails']]
     """
 
     kwargs = _get_kwargs(
@@ -91,7 +225,15 @@ def sync(
     client_id: UUID,
     *,
     client: Union[AuthenticatedClient, Client],
-) -> Optional[ClientDetails]:
+) -> Optional[
+    Union[
+        "ClientDetails",
+        "TeleportClientConnectionDetails",
+        "VPNClientConnectionDetails",
+        "WiredClientDetails",
+        "WirelessClientDetails",
+    ]
+]:
     """Get Connected Client Details
 
      Retrieve detailed information about a specific connected client, including name, IP address, MAC
@@ -106,7 +248,7 @@ def sync(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        ClientDetails
+        Union['ClientDetails', 'TeleportClientConnectionDetails', 'VPNClientConnectionDetails', 'WiredClientDetails', 'WirelessClientDetails']
     """
 
     return sync_detailed(
@@ -121,7 +263,15 @@ async def asyncio_detailed(
     client_id: UUID,
     *,
     client: Union[AuthenticatedClient, Client],
-) -> Response[ClientDetails]:
+) -> Response[
+    Union[
+        "ClientDetails",
+        "TeleportClientConnectionDetails",
+        "VPNClientConnectionDetails",
+        "WiredClientDetails",
+        "WirelessClientDetails",
+    ]
+]:
     """Get Connected Client Details
 
      Retrieve detailed information about a specific connected client, including name, IP address, MAC
@@ -136,7 +286,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[ClientDetails]
+        Response[Union['ClientDetails', 'TeleportClientConnectionDetails', 'VPNClientConnectionDetails', 'WiredClientDetails', 'WirelessClientDetails']]
     """
 
     kwargs = _get_kwargs(
@@ -144,9 +294,7 @@ async def asyncio_detailed(
         client_id=client_id,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await client.send_async(kwargs, _build_response)
 
 
 async def asyncio(
@@ -154,7 +302,15 @@ async def asyncio(
     client_id: UUID,
     *,
     client: Union[AuthenticatedClient, Client],
-) -> Optional[ClientDetails]:
+) -> Optional[
+    Union[
+        "ClientDetails",
+        "TeleportClientConnectionDetails",
+        "VPNClientConnectionDetails",
+        "WiredClientDetails",
+        "WirelessClientDetails",
+    ]
+]:
     """Get Connected Client Details
 
      Retrieve detailed information about a specific connected client, including name, IP address, MAC
@@ -169,7 +325,7 @@ async def asyncio(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        ClientDetails
+        Union['ClientDetails', 'TeleportClientConnectionDetails', 'VPNClientConnectionDetails', 'WiredClientDetails', 'WirelessClientDetails']
     """
 
     return (
@@ -30,8 +30,12 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[AdoptedDeviceDetails]:
     if response.status_code == 200:
-        response_200 = AdoptedDeviceDetails.from_dict(response.json())
-
+        if client.lazy_models:
+            response_200 = AdoptedDeviceDetails.from_dict_lazy(
+                client.decode_json(response)
+            )
+        else:
+            response_200 = AdoptedDeviceDetails.from_dict(client.decode_json(response))
         return response_200
 
     if client.raise_on_unexpected_status:
@@ -45,7 +49,7 @@ def _build_response(
 ) -> Response[AdoptedDeviceDetails]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=response.content if client.retain_response_content else b"",
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -144,9 +148,7 @@ async def asyncio_detailed(
         device_id=device_id,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await client.send_async(kwargs, _build_response)
 
 
 async def asyncio(
@@ -1,9 +1,37 @@
+import asyncio
+import functools
+import json
+import random
 import ssl
-from typing import Any, Union, Optional
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar, Union, Optional
 
 from attrs import define, field, evolve
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+T = TypeVar("T")
+
+# Responses kept at most for conditional requests, least recently used dropped first
+MAX_CONDITIONAL_RESPONSES = 1024
+
+# Statuses worth retrying a GET for: rate limited, or the controller is overloaded
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def default_json_decoder(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 @define
 class Client:
@@ -32,9 +60,37 @@ class Client:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        json_decoder: Function used to decode JSON response bodies. Defaults to orjson when it is installed
+            and the standard library json module otherwise.
+        retain_response_content: Whether ``Response.content`` keeps the raw response body. Set to False to
+            drop it once the response has been parsed.
+        lazy_models: Whether response models are built with ``from_dict_lazy``, which wraps the decoded JSON
+            and only converts fields (UUIDs, timestamps, nested models) when they are first accessed.
+        coalesce_requests: Whether a GET request identical to one already in flight waits for that request
+            and shares its response instead of being sent again. Only applies to the async API functions.
+        conditional_requests: Whether GET responses carrying an ``ETag`` or ``Last-Modified`` header are
+            kept, so the next identical request is sent with ``If-None-Match`` / ``If-Modified-Since`` and a 304
+            answer returns the kept response instead of downloading and parsing the body again. Only applies to
+            the async API functions.
+        max_retries: How many times a GET request is retried after a connection error or a 429, 502, 503 or
+            504 response. Retries wait for ``Retry-After`` when the response has one, otherwise for a random
+            delay of up to ``retry_backoff`` doubled on each attempt. Only applies to the async API functions.
+        retry_backoff: Longest delay in seconds before the first retry, doubled on each further retry.
+        retry_max_delay: Longest delay in seconds between retries. A response asking to retry later than this
+            is returned as is.
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    json_decoder: Callable[[bytes], Any] = field(
+        default=default_json_decoder, kw_only=True
+    )
+    retain_response_content: bool = field(default=True, kw_only=True)
+    lazy_models: bool = field(default=False, kw_only=True)
+    coalesce_requests: bool = field(default=False, kw_only=True)
+    conditional_requests: bool = field(default=False, kw_only=True)
+    max_retries: int = field(default=0, kw_only=True)
+    retry_backoff: float = field(default=0.5, kw_only=True)
+    retry_max_delay: float = field(default=30.0, kw_only=True)
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -50,6 +106,137 @@ class Client:
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
+    _in_flight: dict[Any, "asyncio.Future[Any]"] = field(factory=dict, init=False)
+    _conditional: "OrderedDict[Any, tuple[dict[str, str], Any]]" = field(
+        factory=OrderedDict, init=False
+    )
+
+    def decode_json(self, response: httpx.Response) -> Any:
+        """Decode the JSON body of a response with the configured decoder"""
+        return self.json_decoder(response.content)
+
+    async def send_async(
+        self, kwargs: dict[str, Any], build_response: Callable[..., T]
+    ) -> T:
+        """Send a request with the async httpx client and build its response
+
+        With ``coalesce_requests``, a GET identical to one already in flight is not
+        sent again: it waits for that request and gets the same built response.
+        With ``conditional_requests``, a GET whose last response carried validators
+        is revalidated, and a 304 answer returns that last built response.
+        """
+        key = self._request_key(kwargs)
+        if key is None or not self.coalesce_requests:
+            return await self._send_async(kwargs, build_response, key)
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_async(kwargs, build_response, key))
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._request_done, key))
+        # A cancelled caller must not cancel the request others are waiting for
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _request_key(kwargs: dict[str, Any]) -> Optional[tuple[Any, ...]]:
+        """Return what identifies a plain GET request, or None for other requests"""
+        if kwargs.get("method", "").lower() != "get" or kwargs.keys() - {
+            "method",
+            "url",
+            "params",
+        }:
+            return None
+        params = kwargs.get("params") or {}
+        return (
+            kwargs["url"],
+            tuple(sorted((name, repr(value)) for name, value in params.items())),
+        )
+
+    async def _send_async(
+        self,
+        kwargs: dict[str, Any],
+        build_response: Callable[..., T],
+        key: Optional[tuple[Any, ...]],
+    ) -> T:
+        if key is None or not self.conditional_requests:
+            response = await self._request_async(kwargs)
+            return build_response(client=self, response=response)
+
+        cached = self._conditional.get(key)
+        if cached is not None:
+            kwargs = {**kwargs, "headers": cached[0]}
+        response = await self._request_async(kwargs)
+        if cached is not None and response.status_code == 304:
+            self._conditional.move_to_end(key)
+            return cached[1]
+
+        built = build_response(client=self, response=response)
+        validators = {}
+        if "etag" in response.headers:
+            validators["If-None-Match"] = response.headers["etag"]
+        if "last-modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["last-modified"]
+        if response.status_code == 200 and validators:
+            self._conditional[key] = (validators, built)
+            self._conditional.move_to_end(key)
+            if len(self._conditional) > MAX_CONDITIONAL_RESPONSES:
+                self._conditional.popitem(last=False)
+        else:
+            self._conditional.pop(key, None)
+        return built
+
+    async def _request_async(self, kwargs: dict[str, Any]) -> httpx.Response:
+        """Send a request, retrying a failed GET up to ``max_retries`` times"""
+        retry = kwargs.get("method", "").lower() == "get"
+        attempt = 0
+        while True:
+            try:
+                response = await self.get_async_httpx_client().request(**kwargs)
+            except httpx.TransportError:
+                if not retry or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+            else:
+                if (
+                    not retry
+                    or attempt >= self.max_retries
+                    or response.status_code not in RETRY_STATUS_CODES
+                ):
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff_delay(attempt)
+                elif delay > self.retry_max_delay:
+                    return response
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Return a random delay before a retry, with an upper bound doubling per attempt"""
+        return random.uniform(
+            0, min(self.retry_max_delay, self.retry_backoff * 2**attempt)
+        )
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Return the seconds to wait given by a Retry-After header, if any"""
+        value = response.headers.get("retry-after", "").strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _request_done(self, key: Any, task: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the error as retrieved in case every caller was cancelled
+            task.exception()
 
     def with_headers(self, headers: dict[str, str]) -> "Client":
         """Get a new client matching this one with additional headers"""
@@ -165,12 +352,40 @@ class AuthenticatedClient:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        json_decoder: Function used to decode JSON response bodies. Defaults to orjson when it is installed
+            and the standard library json module otherwise.
+        retain_response_content: Whether ``Response.content`` keeps the raw response body. Set to False to
+            drop it once the response has been parsed.
+        lazy_models: Whether response models are built with ``from_dict_lazy``, which wraps the decoded JSON
+            and only converts fields (UUIDs, timestamps, nested models) when they are first accessed.
+        coalesce_requests: Whether a GET request identical to one already in flight waits for that request
+            and shares its response instead of being sent again. Only applies to the async API functions.
+        conditional_requests: Whether GET responses carrying an ``ETag`` or ``Last-Modified`` header are
+            kept, so the next identical request is sent with ``If-None-Match`` / ``If-Modified-Since`` and a 304
+            answer returns the kept response instead of downloading and parsing the body again. Only applies to
+            the async API functions.
+        max_retries: How many times a GET request is retried after a connection error or a 429, 502, 503 or
+            504 response. Retries wait for ``Retry-After`` when the response has one, otherwise for a random
+            delay of up to ``retry_backoff`` doubled on each attempt. Only applies to the async API functions.
+        retry_backoff: Longest delay in seconds before the first retry, doubled on each further retry.
+        retry_max_delay: Longest delay in seconds between retries. A response asking to retry later than this
+            is returned as is.
         token: The token to use for authentication
         prefix: The prefix to use for the Authorization header
         auth_header_name: The name of the Authorization header
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    json_decoder: Callable[[bytes], Any] = field(
+        default=default_json_decoder, kw_only=True
+    )
+    retain_response_content: bool = field(default=True, kw_only=True)
+    lazy_models: bool = field(default=False, kw_only=True)
+    coalesce_requests: bool = field(default=False, kw_only=True)
+    conditional_requests: bool = field(default=False, kw_only=True)
+    max_retries: int = field(default=0, kw_only=True)
+    retry_backoff: float = field(default=0.5, kw_only=True)
+    retry_max_delay: float = field(default=30.0, kw_only=True)
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -186,11 +401,142 @@ class AuthenticatedClient:
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
+    _in_flight: dict[Any, "asyncio.Future[Any]"] = field(factory=dict, init=False)
+    _conditional: "OrderedDict[Any, tuple[dict[str, str], Any]]" = field(
+        factory=OrderedDict, init=False
+    )
 
     token: str
     prefix: str = "Bearer"
     auth_header_name: str = "Authorization"
 
+    def decode_json(self, response: httpx.Response) -> Any:
+        """Decode the JSON body of a response with the configured decoder"""
+        return self.json_decoder(response.content)
+
+    async def send_async(
+        self, kwargs: dict[str, Any], build_response: Callable[..., T]
+    ) -> T:
+        """Send a request with the async httpx client and build its response
+
+        With ``coalesce_requests``, a GET identical to one already in flight is not
+        sent again: it waits for that request and gets the same built response.
+        With ``conditional_requests``, a GET whose last response carried validators
+        is revalidated, and a 304 answer returns that last built response.
+        """
+        key = self._request_key(kwargs)
+        if key is None or not self.coalesce_requests:
+            return await self._send_async(kwargs, build_response, key)
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_async(kwargs, build_response, key))
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._request_done, key))
+        # A cancelled caller must not cancel the request others are waiting for
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _request_key(kwargs: dict[str, Any]) -> Optional[tuple[Any, ...]]:
+        """Return what identifies a plain GET request, or None for other requests"""
+        if kwargs.get("method", "").lower() != "get" or kwargs.keys() - {
+            "method",
+            "url",
+            "params",
+        }:
+            return None
+        params = kwargs.get("params") or {}
+        return (
+            kwargs["url"],
+            tuple(sorted((name, repr(value)) for name, value in params.items())),
+        )
+
+    async def _send_async(
+        self,
+        kwargs: dict[str, Any],
+        build_response: Callable[..., T],
+        key: Optional[tuple[Any, ...]],
+    ) -> T:
+        if key is None or not self.conditional_requests:
+            response = await self._request_async(kwargs)
+            return build_response(client=self, response=response)
+
+        cached = self._conditional.get(key)
+        if cached is not None:
+            kwargs = {**kwargs, "headers": cached[0]}
+        response = await self._request_async(kwargs)
+        if cached is not None and response.status_code == 304:
+            self._conditional.move_to_end(key)
+            return cached[1]
+
+        built = build_response(client=self, response=response)
+        validators = {}
+        if "etag" in response.headers:
+            validators["If-None-Match"] = response.headers["etag"]
+        if "last-modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["last-modified"]
+        if response.status_code == 200 and validators:
+            self._conditional[key] = (validators, built)
+            self._conditional.move_to_end(key)
+            if len(self._conditional) > MAX_CONDITIONAL_RESPONSES:
+                self._conditional.popitem(last=False)
+        else:
+            self._conditional.pop(key, None)
+        return built
+
+    async def _request_async(self, kwargs: dict[str, Any]) -> httpx.Response:
+        """Send a request, retrying a failed GET up to ``max_retries`` times"""
+        retry = kwargs.get("method", "").lower() == "get"
+        attempt = 0
+        while True:
+            try:
+                response = await self.get_async_httpx_client().request(**kwargs)
+            except httpx.TransportError:
+                if not retry or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+            else:
+                if (
+                    not retry
+                    or attempt >= self.max_retries
+                    or response.status_code not in RETRY_STATUS_CODES
+                ):
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff_delay(attempt)
+                elif delay > self.retry_max_delay:
+                    return response
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Return a random delay before a retry, with an upper bound doubling per attempt"""
+        return random.uniform(
+            0, min(self.retry_max_delay, self.retry_backoff * 2**attempt)
+        )
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Return the seconds to wait given by a Retry-After header, if any"""
+        value = response.headers.get("retry-after", "").strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _request_done(self, key: Any, task: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the error as retrieved in case every caller was cancelled
+            task.exception()
+
     def with_headers(self, headers: dict[str, str]) -> "AuthenticatedClient":
         """Get a new client matching this one with additional headers"""
         if self._client is not None:
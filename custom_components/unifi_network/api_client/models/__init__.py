@@ -64,7 +64,11 @@ from .switching_feature_overview import SwitchingFeatureOverview
 from .teleport_client_access_details import TeleportClientAccessDetails
 from .teleport_client_access_overview import TeleportClientAccessOverview
 from .teleport_client_connection_details import TeleportClientConnectionDetails
+from .teleport_client_connection_details_type import TeleportClientConnectionDetailsType
 from .teleport_client_connection_overview import TeleportClientConnectionOverview
+from .teleport_client_connection_overview_type import (
+    TeleportClientConnectionOverviewType,
+)
 from .user_defined_entity_metadata import UserDefinedEntityMetadata
 from .user_defined_or_derived_entity_metadata import UserDefinedOrDerivedEntityMetadata
 from .user_or_derived_or_orchestrated_entity_metadata import (
@@ -78,11 +82,17 @@ from .user_or_system_defined_or_orchestrated_entity_metadata import (
 from .vpn_client_access_details import VPNClientAccessDetails
 from .vpn_client_access_overview import VPNClientAccessOverview
 from .vpn_client_connection_details import VPNClientConnectionDetails
+from .vpn_client_connection_details_type import VPNClientConnectionDetailsType
 from .vpn_client_connection_overview import VPNClientConnectionOverview
+from .vpn_client_connection_overview_type import VPNClientConnectionOverviewType
 from .wired_client_details import WiredClientDetails
+from .wired_client_details_type import WiredClientDetailsType
 from .wired_client_overview import WiredClientOverview
+from .wired_client_overview_type import WiredClientOverviewType
 from .wireless_client_details import WirelessClientDetails
+from .wireless_client_details_type import WirelessClientDetailsType
 from .wireless_client_overview import WirelessClientOverview
+from .wireless_client_overview_type import WirelessClientOverviewType
 from .wireless_radio_overview import WirelessRadioOverview
 from .wireless_radio_overview_wlan_standard import WirelessRadioOverviewWlanStandard
 
@@ -143,7 +153,9 @@ __all__ = (
     "TeleportClientAccessDetails",
     "TeleportClientAccessOverview",
     "TeleportClientConnectionDetails",
+    "TeleportClientConnectionDetailsType",
     "TeleportClientConnectionOverview",
+    "TeleportClientConnectionOverviewType",
     "UserDefinedEntityMetadata",
     "UserDefinedOrDerivedEntityMetadata",
     "UserOrDerivedOrOrchestratedEntityMetadata",
@@ -153,11 +165,17 @@ __all__ = (
     "VPNClientAccessDetails",
     "VPNClientAccessOverview",
     "VPNClientConnectionDetails",
+    "VPNClientConnectionDetailsType",
     "VPNClientConnectionOverview",
+    "VPNClientConnectionOverviewType",
     "WiredClientDetails",
+    "WiredClientDetailsType",
     "WiredClientOverview",
+    "WiredClientOverviewType",
     "WirelessClientDetails",
+    "WirelessClientDetailsType",
     "WirelessClientOverview",
+    "WirelessClientOverviewType",
     "WirelessRadioOverview",
     "WirelessRadioOverviewWlanStandard",
 )
@@ -1,13 +1,15 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from ..models.adopted_device_details_state import AdoptedDeviceDetailsState
-from dateutil.parser import isoparse
+from ..types import parse_datetime
 from typing import cast
 from typing import Union
 from uuid import UUID
@@ -21,6 +23,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="AdoptedDeviceDetails")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class AdoptedDeviceDetails:
@@ -59,9 +63,22 @@ class AdoptedDeviceDetails:
     adopted_at: Union[Unset, datetime.datetime] = UNSET
     provisioned_at: Union[Unset, datetime.datetime] = UNSET
     uplink: Union[Unset, "DeviceUplinkInterfaceOverview"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         from ..models.device_features import DeviceFeatures
         from ..models.device_physical_interfaces import DevicePhysicalInterfaces
         from ..models.device_uplink_interface_overview import (
@@ -140,46 +157,46 @@ class AdoptedDeviceDetails:
             DeviceUplinkInterfaceOverview,
         )
 
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
+        d = src_dict
+        id = UUID(d["id"])
 
-        mac_address = d.pop("macAddress")
+        mac_address = d["macAddress"]
 
-        ip_address = d.pop("ipAddress")
+        ip_address = d["ipAddress"]
 
-        name = d.pop("name")
+        name = d["name"]
 
-        model = d.pop("model")
+        model = d["model"]
 
-        supported = d.pop("supported")
+        supported = d["supported"]
 
-        state = AdoptedDeviceDetailsState(d.pop("state"))
+        state = AdoptedDeviceDetailsState(d["state"])
 
-        firmware_updatable = d.pop("firmwareUpdatable")
+        firmware_updatable = d["firmwareUpdatable"]
 
-        configuration_id = d.pop("configurationId")
+        configuration_id = d["configurationId"]
 
-        features = DeviceFeatures.from_dict(d.pop("features"))
+        features = DeviceFeatures.from_dict(d["features"])
 
-        interfaces = DevicePhysicalInterfaces.from_dict(d.pop("interfaces"))
+        interfaces = DevicePhysicalInterfaces.from_dict(d["interfaces"])
 
-        firmware_version = d.pop("firmwareVersion", UNSET)
+        firmware_version = d.get("firmwareVersion", UNSET)
 
-        _adopted_at = d.pop("adoptedAt", UNSET)
+        _adopted_at = d.get("adoptedAt", UNSET)
         adopted_at: Union[Unset, datetime.datetime]
         if isinstance(_adopted_at, Unset):
             adopted_at = UNSET
         else:
-            adopted_at = isoparse(_adopted_at)
+            adopted_at = parse_datetime(_adopted_at)
 
-        _provisioned_at = d.pop("provisionedAt", UNSET)
+        _provisioned_at = d.get("provisionedAt", UNSET)
         provisioned_at: Union[Unset, datetime.datetime]
         if isinstance(_provisioned_at, Unset):
             provisioned_at = UNSET
         else:
-            provisioned_at = isoparse(_provisioned_at)
+            provisioned_at = parse_datetime(_provisioned_at)
 
-        _uplink = d.pop("uplink", UNSET)
+        _uplink = d.get("uplink", UNSET)
         uplink: Union[Unset, DeviceUplinkInterfaceOverview]
         if isinstance(_uplink, Unset):
             uplink = UNSET
@@ -204,9 +221,219 @@ class AdoptedDeviceDetails:
             uplink=uplink,
         )
 
-        adopted_device_details.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "id",
+                "macAddress",
+                "ipAddress",
+                "name",
+                "model",
+                "supported",
+                "state",
+                "firmwareUpdatable",
+                "configurationId",
+                "features",
+                "interfaces",
+                "firmwareVersion",
+                "adoptedAt",
+                "provisionedAt",
+                "uplink",
+            }
+        }
+
+        if additional_properties:
+            adopted_device_details._additional_properties = additional_properties
         return adopted_device_details
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "id",
+            "macAddress",
+            "ipAddress",
+            "name",
+            "model",
+            "supported",
+            "state",
+            "firmwareUpdatable",
+            "configurationId",
+            "features",
+            "interfaces",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        adopted_device_details = cls.__new__(cls)
+        adopted_device_details._source = src_dict
+        return adopted_device_details
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.device_features import DeviceFeatures
+        from ..models.device_physical_interfaces import DevicePhysicalInterfaces
+        from ..models.device_uplink_interface_overview import (
+            DeviceUplinkInterfaceOverview,
+        )
+
+        if name == "id":
+            id = UUID(d["id"])
+
+            self.id = id
+            return id
+
+        if name == "mac_address":
+            mac_address = d["macAddress"]
+
+            self.mac_address = mac_address
+            return mac_address
+
+        if name == "ip_address":
+            ip_address = d["ipAddress"]
+
+            self.ip_address = ip_address
+            return ip_address
+
+        if name == "name":
+            name = d["name"]
+
+            self.name = name
+            return name
+
+        if name == "model":
+            model = d["model"]
+
+            self.model = model
+            return model
+
+        if name == "supported":
+            supported = d["supported"]
+
+            self.supported = supported
+            return supported
+
+        if name == "state":
+            state = AdoptedDeviceDetailsState(d["state"])
+
+            self.state = state
+            return state
+
+        if name == "firmware_updatable":
+            firmware_updatable = d["firmwareUpdatable"]
+
+            self.firmware_updatable = firmware_updatable
+            return firmware_updatable
+
+        if name == "configuration_id":
+            configuration_id = d["configurationId"]
+
+            self.configuration_id = configuration_id
+            return configuration_id
+
+        if name == "features":
+            features = DeviceFeatures.from_dict_lazy(d["features"])
+
+            self.features = features
+            return features
+
+        if name == "interfaces":
+            interfaces = DevicePhysicalInterfaces.from_dict_lazy(d["interfaces"])
+
+            self.interfaces = interfaces
+            return interfaces
+
+        if name == "firmware_version":
+            firmware_version = d.get("firmwareVersion", UNSET)
+
+            self.firmware_version = firmware_version
+            return firmware_version
+
+        if name == "adopted_at":
+            _adopted_at = d.get("adoptedAt", UNSET)
+            adopted_at: Union[Unset, datetime.datetime]
+            if isinstance(_adopted_at, Unset):
+                adopted_at = UNSET
+            else:
+                adopted_at = parse_datetime(_adopted_at)
+
+            self.adopted_at = adopted_at
+            return adopted_at
+
+        if name == "provisioned_at":
+            _provisioned_at = d.get("provisionedAt", UNSET)
+            provisioned_at: Union[Unset, datetime.datetime]
+            if isinstance(_provisioned_at, Unset):
+                provisioned_at = UNSET
+            else:
+                provisioned_at = parse_datetime(_provisioned_at)
+
+            self.provisioned_at = provisioned_at
+            return provisioned_at
+
+        if name == "uplink":
+            _uplink = d.get("uplink", UNSET)
+            uplink: Union[Unset, DeviceUplinkInterfaceOverview]
+            if isinstance(_uplink, Unset):
+                uplink = UNSET
+            else:
+                uplink = DeviceUplinkInterfaceOverview.from_dict_lazy(_uplink)
+
+            self.uplink = uplink
+            return uplink
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "id",
+                    "macAddress",
+                    "ipAddress",
+                    "name",
+                    "model",
+                    "supported",
+                    "state",
+                    "firmwareUpdatable",
+                    "configurationId",
+                    "features",
+                    "interfaces",
+                    "firmwareVersion",
+                    "adoptedAt",
+                    "provisionedAt",
+                    "uplink",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -215,10 +442,16 @@ class AdoptedDeviceDetails:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
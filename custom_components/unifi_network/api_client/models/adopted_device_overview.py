@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from ..models.adopted_device_overview_features_item import (
     AdoptedDeviceOverviewFeaturesItem,
@@ -20,6 +22,8 @@ from uuid import UUID
 
 T = TypeVar("T", bound="AdoptedDeviceOverview")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class AdoptedDeviceOverview:
@@ -49,9 +53,22 @@ class AdoptedDeviceOverview:
     features: list[AdoptedDeviceOverviewFeaturesItem]
     interfaces: list[AdoptedDeviceOverviewInterfacesItem]
     firmware_version: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         id = str(self.id)
 
         mac_address = self.mac_address
@@ -103,38 +120,38 @@ class AdoptedDeviceOverview:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
+        d = src_dict
+        id = UUID(d["id"])
 
-        mac_address = d.pop("macAddress")
+        mac_address = d["macAddress"]
 
-        ip_address = d.pop("ipAddress")
+        ip_address = d["ipAddress"]
 
-        name = d.pop("name")
+        name = d["name"]
 
-        model = d.pop("model")
+        model = d["model"]
 
-        state = AdoptedDeviceOverviewState(d.pop("state"))
+        state = AdoptedDeviceOverviewState(d["state"])
 
-        supported = d.pop("supported")
+        supported = d["supported"]
 
-        firmware_updatable = d.pop("firmwareUpdatable")
+        firmware_updatable = d["firmwareUpdatable"]
 
         features = []
-        _features = d.pop("features")
+        _features = d["features"]
         for features_item_data in _features:
             features_item = AdoptedDeviceOverviewFeaturesItem(features_item_data)
 
             features.append(features_item)
 
         interfaces = []
-        _interfaces = d.pop("interfaces")
+        _interfaces = d["interfaces"]
         for interfaces_item_data in _interfaces:
             interfaces_item = AdoptedDeviceOverviewInterfacesItem(interfaces_item_data)
 
             interfaces.append(interfaces_item)
 
-        firmware_version = d.pop("firmwareVersion", UNSET)
+        firmware_version = d.get("firmwareVersion", UNSET)
 
         adopted_device_overview = cls(
             id=id,
@@ -150,9 +167,177 @@ class AdoptedDeviceOverview:
             firmware_version=firmware_version,
         )
 
-        adopted_device_overview.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "id",
+                "macAddress",
+                "ipAddress",
+                "name",
+                "model",
+                "state",
+                "supported",
+                "firmwareUpdatable",
+                "features",
+                "interfaces",
+                "firmwareVersion",
+            }
+        }
+
+        if additional_properties:
+            adopted_device_overview._additional_properties = additional_properties
         return adopted_device_overview
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "id",
+            "macAddress",
+            "ipAddress",
+            "name",
+            "model",
+            "state",
+            "supported",
+            "firmwareUpdatable",
+            "features",
+            "interfaces",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        adopted_device_overview = cls.__new__(cls)
+        adopted_device_overview._source = src_dict
+        return adopted_device_overview
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        if name == "id":
+            id = UUID(d["id"])
+
+            self.id = id
+            return id
+
+        if name == "mac_address":
+            mac_address = d["macAddress"]
+
+            self.mac_address = mac_address
+            return mac_address
+
+        if name == "ip_address":
+            ip_address = d["ipAddress"]
+
+            self.ip_address = ip_address
+            return ip_address
+
+        if name == "name":
+            name = d["name"]
+
+            self.name = name
+            return name
+
+        if name == "model":
+            model = d["model"]
+
+            self.model = model
+            return model
+
+        if name == "state":
+            state = AdoptedDeviceOverviewState(d["state"])
+
+            self.state = state
+            return state
+
+        if name == "supported":
+            supported = d["supported"]
+
+            self.supported = supported
+            return supported
+
+        if name == "firmware_updatable":
+            firmware_updatable = d["firmwareUpdatable"]
+
+            self.firmware_updatable = firmware_updatable
+            return firmware_updatable
+
+        if name == "features":
+            features = []
+            _features = d["features"]
+            for features_item_data in _features:
+                features_item = AdoptedDeviceOverviewFeaturesItem(features_item_data)
+
+                features.append(features_item)
+
+            self.features = features
+            return features
+
+        if name == "interfaces":
+            interfaces = []
+            _interfaces = d["interfaces"]
+            for interfaces_item_data in _interfaces:
+                interfaces_item = AdoptedDeviceOverviewInterfacesItem(
+                    interfaces_item_data
+                )
+
+                interfaces.append(interfaces_item)
+
+            self.interfaces = interfaces
+            return interfaces
+
+        if name == "firmware_version":
+            firmware_version = d.get("firmwareVersion", UNSET)
+
+            self.firmware_version = firmware_version
+            return firmware_version
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "id",
+                    "macAddress",
+                    "ipAddress",
+                    "name",
+                    "model",
+                    "state",
+                    "supported",
+                    "firmwareUpdatable",
+                    "features",
+                    "interfaces",
+                    "firmwareVersion",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -161,10 +346,16 @@ class AdoptedDeviceOverview:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,12 +1,14 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
-from dateutil.parser import isoparse
+from ..types import parse_datetime
 from typing import cast
 from typing import Union
 from uuid import UUID
@@ -15,6 +17,8 @@ import datetime
 
 T = TypeVar("T", bound="ClientDetails")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class ClientDetails:
@@ -34,9 +38,22 @@ class ClientDetails:
     access: Any
     connected_at: Union[Unset, datetime.datetime] = UNSET
     ip_address: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         type_ = self.type_
 
         id = str(self.id)
@@ -70,23 +87,23 @@ class ClientDetails:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        type_ = d.pop("type")
+        d = src_dict
+        type_ = d["type"]
 
-        id = UUID(d.pop("id"))
+        id = UUID(d["id"])
 
-        name = d.pop("name")
+        name = d["name"]
 
-        access = d.pop("access")
+        access = d["access"]
 
-        _connected_at = d.pop("connectedAt", UNSET)
+        _connected_at = d.get("connectedAt", UNSET)
         connected_at: Union[Unset, datetime.datetime]
         if isinstance(_connected_at, Unset):
             connected_at = UNSET
         else:
-            connected_at = isoparse(_connected_at)
+            connected_at = parse_datetime(_connected_at)
 
-        ip_address = d.pop("ipAddress", UNSET)
+        ip_address = d.get("ipAddress", UNSET)
 
         client_details = cls(
             type_=type_,
@@ -97,9 +114,124 @@ class ClientDetails:
             ip_address=ip_address,
         )
 
-        client_details.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "type",
+                "id",
+                "name",
+                "access",
+                "connectedAt",
+                "ipAddress",
+            }
+        }
+
+        if additional_properties:
+            client_details._additional_properties = additional_properties
         return client_details
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "type",
+            "id",
+            "name",
+            "access",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        client_details = cls.__new__(cls)
+        client_details._source = src_dict
+        return client_details
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        if name == "type_":
+            type_ = d["type"]
+
+            self.type_ = type_
+            return type_
+
+        if name == "id":
+            id = UUID(d["id"])
+
+            self.id = id
+            return id
+
+        if name == "name":
+            name = d["name"]
+
+            self.name = name
+            return name
+
+        if name == "access":
+            access = d["access"]
+
+            self.access = access
+            return access
+
+        if name == "connected_at":
+            _connected_at = d.get("connectedAt", UNSET)
+            connected_at: Union[Unset, datetime.datetime]
+            if isinstance(_connected_at, Unset):
+                connected_at = UNSET
+            else:
+                connected_at = parse_datetime(_connected_at)
+
+            self.connected_at = connected_at
+            return connected_at
+
+        if name == "ip_address":
+            ip_address = d.get("ipAddress", UNSET)
+
+            self.ip_address = ip_address
+            return ip_address
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "type",
+                    "id",
+                    "name",
+                    "access",
+                    "connectedAt",
+                    "ipAddress",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -108,10 +240,16 @@ class ClientDetails:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
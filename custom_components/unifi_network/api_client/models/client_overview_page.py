@@ -1,19 +1,30 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from typing import cast
+from typing import Union
 
 if TYPE_CHECKING:
+    from ..models.vpn_client_connection_overview import VPNClientConnectionOverview
+    from ..models.teleport_client_connection_overview import (
+        TeleportClientConnectionOverview,
+    )
     from ..models.client_overview import ClientOverview
+    from ..models.wired_client_overview import WiredClientOverview
+    from ..models.wireless_client_overview import WirelessClientOverview
 
 
 T = TypeVar("T", bound="ClientOverviewPage")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class ClientOverviewPage:
@@ -23,18 +34,46 @@ class ClientOverviewPage:
         limit (int):  Example: 25.
         count (int):  Example: 10.
         total_count (int):  Example: 1000.
-        data (list['ClientOverview']):
+        data (list[Union['ClientOverview', 'TeleportClientConnectionOverview', 'VPNClientConnectionOverview',
+            'WiredClientOverview', 'WirelessClientOverview']]):
     """
 
     offset: int
     limit: int
     count: int
     total_count: int
-    data: list["ClientOverview"]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    data: list[
+        Union[
+            "ClientOverview",
+            "TeleportClientConnectionOverview",
+            "VPNClientConnectionOverview",
+            "WiredClientOverview",
+            "WirelessClientOverview",
+        ]
+    ]
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
 
-    def to_dict(self) -> dict[str, Any]:
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
+        from ..models.vpn_client_connection_overview import VPNClientConnectionOverview
+        from ..models.teleport_client_connection_overview import (
+            TeleportClientConnectionOverview,
+        )
         from ..models.client_overview import ClientOverview
+        from ..models.wired_client_overview import WiredClientOverview
+        from ..models.wireless_client_overview import WirelessClientOverview
 
         offset = self.offset
 
@@ -46,7 +85,18 @@ class ClientOverviewPage:
 
         data = []
         for data_item_data in self.data:
-            data_item = data_item_data.to_dict()
+            data_item: dict[str, Any]
+            if isinstance(data_item_data, WiredClientOverview):
+                data_item = data_item_data.to_dict()
+            elif isinstance(data_item_data, WirelessClientOverview):
+                data_item = data_item_data.to_dict()
+            elif isinstance(data_item_data, VPNClientConnectionOverview):
+                data_item = data_item_data.to_dict()
+            elif isinstance(data_item_data, TeleportClientConnectionOverview):
+                data_item = data_item_data.to_dict()
+            else:
+                data_item = data_item_data.to_dict()
+
             data.append(data_item)
 
         field_dict: dict[str, Any] = {}
@@ -65,21 +115,78 @@ class ClientOverviewPage:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.vpn_client_connection_overview import VPNClientConnectionOverview
+        from ..models.teleport_client_connection_overview import (
+            TeleportClientConnectionOverview,
+        )
         from ..models.client_overview import ClientOverview
+        from ..models.wired_client_overview import WiredClientOverview
+        from ..models.wireless_client_overview import WirelessClientOverview
 
-        d = dict(src_dict)
-        offset = d.pop("offset")
+        d = src_dict
+        offset = d["offset"]
 
-        limit = d.pop("limit")
+        limit = d["limit"]
 
-        count = d.pop("count")
+        count = d["count"]
 
-        total_count = d.pop("totalCount")
+        total_count = d["totalCount"]
 
         data = []
-        _data = d.pop("data")
+        _data = d["data"]
         for data_item_data in _data:
-            data_item = ClientOverview.from_dict(data_item_data)
+
+            def _parse_data_item(
+                data: object,
+            ) -> Union[
+                "ClientOverview",
+                "TeleportClientConnectionOverview",
+                "VPNClientConnectionOverview",
+                "WiredClientOverview",
+                "WirelessClientOverview",
+            ]:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                discriminator_value = data.get("type")
+                if discriminator_value == "WIRED":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        data_item_type_0 = WiredClientOverview.from_dict(data)
+
+                        return data_item_type_0
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                if discriminator_value == "WIRELESS":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        data_item_type_1 = WirelessClientOverview.from_dict(data)
+
+                        return data_item_type_1
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                if discriminator_value == "VPN":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        data_item_type_2 = VPNClientConnectionOverview.from_dict(data)
+
+                        return data_item_type_2
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                if discriminator_value == "TELEPORT":
+                    # A record its typed variant rejects is still parsed with the fallback below
+                    try:
+                        data_item_type_3 = TeleportClientConnectionOverview.from_dict(
+                            data
+                        )
+
+                        return data_item_type_3
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                data_item_type_4 = ClientOverview.from_dict(data)
+
+                return data_item_type_4
+
+            data_item = _parse_data_item(data_item_data)
 
             data.append(data_item)
 
@@ -91,9 +198,180 @@ class ClientOverviewPage:
             data=data,
         )
 
-        client_overview_page.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "offset",
+                "limit",
+                "count",
+                "totalCount",
+                "data",
+            }
+        }
+
+        if additional_properties:
+            client_overview_page._additional_properties = additional_properties
+        return client_overview_page
+
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "offset",
+            "limit",
+            "count",
+            "totalCount",
+            "data",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        client_overview_page = cls.__new__(cls)
+        client_overview_page._source = src_dict
         return client_overview_page
 
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.vpn_client_connection_overview import VPNClientConnectionOverview
+        from ..models.teleport_client_connection_overview import (
+            TeleportClientConnectionOverview,
+        )
+        from ..models.client_overview import ClientOverview
+        from ..models.wired_client_overview import WiredClientOverview
+        from ..models.wireless_client_overview import WirelessClientOverview
+
+        if name == "offset":
+            offset = d["offset"]
+
+            self.offset = offset
+            return offset
+
+        if name == "limit":
+            limit = d["limit"]
+
+            self.limit = limit
+            return limit
+
+        if name == "count":
+            count = d["count"]
+
+            self.count = count
+            return count
+
+        if name == "total_count":
+            total_count = d["totalCount"]
+
+            self.total_count = total_count
+            return total_count
+
+        if name == "data":
+            data = []
+            _data = d["data"]
+            for data_item_data in _data:
+
+                def _parse_data_item(
+                    data: object,
+                ) -> Union[
+                    "ClientOverview",
+                    "TeleportClientConnectionOverview",
+                    "VPNClientConnectionOverview",
+                    "WiredClientOverview",
+                    "WirelessClientOverview",
+                ]:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    discriminator_value = data.get("type")
+                    if discriminator_value == "WIRED":
+                        # A record its typed variant rejects is still parsed with the fallback below
+                        try:
+                            data_item_type_0 = WiredClientOverview.from_dict_lazy(data)
+
+                            return data_item_type_0
+                        except (KeyError, TypeError, ValueError):
+                            pass
+                    if discriminator_value == "WIRELESS":
+                        # A record its typed variant rejects is still parsed with the fallback below
+                        try:
+                            data_item_type_1 = WirelessClientOverview.from_dict_lazy(
+                                data
+                            )
+
+                            return data_item_type_1
+                        except (KeyError, TypeError, ValueError):
+                            pass
+                    if discriminator_value == "VPN":
+                        # A record its typed variant rejects is still parsed with the fallback below
+                        try:
+                            data_item_type_2 = (
+                                VPNClientConnectionOverview.from_dict_lazy(data)
+                            )
+
+                            return data_item_type_2
+                        except (KeyError, TypeError, ValueError):
+                            pass
+                    if discriminator_value == "TELEPORT":
+                        # A record its typed variant rejects is still parsed with the fallback below
+                        try:
+                            data_item_type_3 = (
+                                TeleportClientConnectionOverview.from_dict_lazy(data)
+                            )
+
+                            return data_item_type_3
+                        except (KeyError, TypeError, ValueError):
+                            pass
+                    data_item_type_4 = ClientOverview.from_dict_lazy(data)
+
+                    return data_item_type_4
+
+                data_item = _parse_data_item(data_item_data)
+
+                data.append(data_item)
+
+            self.data = data
+            return data
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "offset",
+                    "limit",
+                    "count",
+                    "totalCount",
+                    "data",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -102,10 +380,16 @@ class ClientOverviewPage:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from typing import cast
 from typing import Union
@@ -15,6 +17,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="DeviceFeatures")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class DeviceFeatures:
@@ -26,9 +30,22 @@ class DeviceFeatures:
 
     switching: Union[Unset, "SwitchingFeatureOverview"] = UNSET
     access_point: Union[Unset, Any] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         from ..models.switching_feature_overview import SwitchingFeatureOverview
 
         switching: Union[Unset, dict[str, Any]] = UNSET
@@ -51,24 +68,101 @@ class DeviceFeatures:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.switching_feature_overview import SwitchingFeatureOverview
 
-        d = dict(src_dict)
-        _switching = d.pop("switching", UNSET)
+        d = src_dict
+        _switching = d.get("switching", UNSET)
         switching: Union[Unset, SwitchingFeatureOverview]
         if isinstance(_switching, Unset):
             switching = UNSET
         else:
             switching = SwitchingFeatureOverview.from_dict(_switching)
 
-        access_point = d.pop("accessPoint", UNSET)
+        access_point = d.get("accessPoint", UNSET)
 
         device_features = cls(
             switching=switching,
             access_point=access_point,
         )
 
-        device_features.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "switching",
+                "accessPoint",
+            }
+        }
+
+        if additional_properties:
+            device_features._additional_properties = additional_properties
+        return device_features
+
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        device_features = cls.__new__(cls)
+        device_features._source = src_dict
         return device_features
 
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.switching_feature_overview import SwitchingFeatureOverview
+
+        if name == "switching":
+            _switching = d.get("switching", UNSET)
+            switching: Union[Unset, SwitchingFeatureOverview]
+            if isinstance(_switching, Unset):
+                switching = UNSET
+            else:
+                switching = SwitchingFeatureOverview.from_dict_lazy(_switching)
+
+            self.switching = switching
+            return switching
+
+        if name == "access_point":
+            access_point = d.get("accessPoint", UNSET)
+
+            self.access_point = access_point
+            return access_point
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "switching",
+                    "accessPoint",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -77,10 +171,16 @@ class DeviceFeatures:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
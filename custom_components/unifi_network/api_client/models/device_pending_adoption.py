@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from ..models.device_pending_adoption_features_item import (
     DevicePendingAdoptionFeaturesItem,
@@ -17,6 +19,8 @@ from uuid import UUID
 
 T = TypeVar("T", bound="DevicePendingAdoption")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class DevicePendingAdoption:
@@ -42,9 +46,22 @@ class DevicePendingAdoption:
     features: list[DevicePendingAdoptionFeaturesItem]
     adoption_target_site_ids: list[UUID]
     firmware_version: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         mac_address = self.mac_address
 
         ip_address = self.ip_address
@@ -90,34 +107,34 @@ class DevicePendingAdoption:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        mac_address = d.pop("macAddress")
+        d = src_dict
+        mac_address = d["macAddress"]
 
-        ip_address = d.pop("ipAddress")
+        ip_address = d["ipAddress"]
 
-        model = d.pop("model")
+        model = d["model"]
 
-        state = DevicePendingAdoptionState(d.pop("state"))
+        state = DevicePendingAdoptionState(d["state"])
 
-        supported = d.pop("supported")
+        supported = d["supported"]
 
-        firmware_updatable = d.pop("firmwareUpdatable")
+        firmware_updatable = d["firmwareUpdatable"]
 
         features = []
-        _features = d.pop("features")
+        _features = d["features"]
         for features_item_data in _features:
             features_item = DevicePendingAdoptionFeaturesItem(features_item_data)
 
             features.append(features_item)
 
         adoption_target_site_ids = []
-        _adoption_target_site_ids = d.pop("adoptionTargetSiteIds")
+        _adoption_target_site_ids = d["adoptionTargetSiteIds"]
         for adoption_target_site_ids_item_data in _adoption_target_site_ids:
             adoption_target_site_ids_item = UUID(adoption_target_site_ids_item_data)
 
             adoption_target_site_ids.append(adoption_target_site_ids_item)
 
-        firmware_version = d.pop("firmwareVersion", UNSET)
+        firmware_version = d.get("firmwareVersion", UNSET)
 
         device_pending_adoption = cls(
             mac_address=mac_address,
@@ -131,9 +148,157 @@ class DevicePendingAdoption:
             firmware_version=firmware_version,
         )
 
-        device_pending_adoption.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "macAddress",
+                "ipAddress",
+                "model",
+                "state",
+                "supported",
+                "firmwareUpdatable",
+                "features",
+                "adoptionTargetSiteIds",
+                "firmwareVersion",
+            }
+        }
+
+        if additional_properties:
+            device_pending_adoption._additional_properties = additional_properties
         return device_pending_adoption
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "macAddress",
+            "ipAddress",
+            "model",
+            "state",
+            "supported",
+            "firmwareUpdatable",
+            "features",
+            "adoptionTargetSiteIds",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        device_pending_adoption = cls.__new__(cls)
+        device_pending_adoption._source = src_dict
+        return device_pending_adoption
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        if name == "mac_address":
+            mac_address = d["macAddress"]
+
+            self.mac_address = mac_address
+            return mac_address
+
+        if name == "ip_address":
+            ip_address = d["ipAddress"]
+
+            self.ip_address = ip_address
+            return ip_address
+
+        if name == "model":
+            model = d["model"]
+
+            self.model = model
+            return model
+
+        if name == "state":
+            state = DevicePendingAdoptionState(d["state"])
+
+            self.state = state
+            return state
+
+        if name == "supported":
+            supported = d["supported"]
+
+            self.supported = supported
+            return supported
+
+        if name == "firmware_updatable":
+            firmware_updatable = d["firmwareUpdatable"]
+
+            self.firmware_updatable = firmware_updatable
+            return firmware_updatable
+
+        if name == "features":
+            features = []
+            _features = d["features"]
+            for features_item_data in _features:
+                features_item = DevicePendingAdoptionFeaturesItem(features_item_data)
+
+                features.append(features_item)
+
+            self.features = features
+            return features
+
+        if name == "adoption_target_site_ids":
+            adoption_target_site_ids = []
+            _adoption_target_site_ids = d["adoptionTargetSiteIds"]
+            for adoption_target_site_ids_item_data in _adoption_target_site_ids:
+                adoption_target_site_ids_item = UUID(adoption_target_site_ids_item_data)
+
+                adoption_target_site_ids.append(adoption_target_site_ids_item)
+
+            self.adoption_target_site_ids = adoption_target_site_ids
+            return adoption_target_site_ids
+
+        if name == "firmware_version":
+            firmware_version = d.get("firmwareVersion", UNSET)
+
+            self.firmware_version = firmware_version
+            return firmware_version
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "macAddress",
+                    "ipAddress",
+                    "model",
+                    "state",
+                    "supported",
+                    "firmwareUpdatable",
+                    "features",
+                    "adoptionTargetSiteIds",
+                    "firmwareVersion",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -142,10 +307,16 @@ class DevicePendingAdoption:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from typing import cast
 
@@ -14,6 +16,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="DevicePendingAdoptionPage")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class DevicePendingAdoptionPage:
@@ -31,9 +35,22 @@ class DevicePendingAdoptionPage:
     count: int
     total_count: int
     data: list["DevicePendingAdoption"]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         from ..models.device_pending_adoption import DevicePendingAdoption
 
         offset = self.offset
@@ -67,17 +84,17 @@ class DevicePendingAdoptionPage:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.device_pending_adoption import DevicePendingAdoption
 
-        d = dict(src_dict)
-        offset = d.pop("offset")
+        d = src_dict
+        offset = d["offset"]
 
-        limit = d.pop("limit")
+        limit = d["limit"]
 
-        count = d.pop("count")
+        count = d["count"]
 
-        total_count = d.pop("totalCount")
+        total_count = d["totalCount"]
 
         data = []
-        _data = d.pop("data")
+        _data = d["data"]
         for data_item_data in _data:
             data_item = DevicePendingAdoption.from_dict(data_item_data)
 
@@ -91,9 +108,119 @@ class DevicePendingAdoptionPage:
             data=data,
         )
 
-        device_pending_adoption_page.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "offset",
+                "limit",
+                "count",
+                "totalCount",
+                "data",
+            }
+        }
+
+        if additional_properties:
+            device_pending_adoption_page._additional_properties = additional_properties
+        return device_pending_adoption_page
+
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "offset",
+            "limit",
+            "count",
+            "totalCount",
+            "data",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        device_pending_adoption_page = cls.__new__(cls)
+        device_pending_adoption_page._source = src_dict
         return device_pending_adoption_page
 
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.device_pending_adoption import DevicePendingAdoption
+
+        if name == "offset":
+            offset = d["offset"]
+
+            self.offset = offset
+            return offset
+
+        if name == "limit":
+            limit = d["limit"]
+
+            self.limit = limit
+            return limit
+
+        if name == "count":
+            count = d["count"]
+
+            self.count = count
+            return count
+
+        if name == "total_count":
+            total_count = d["totalCount"]
+
+            self.total_count = total_count
+            return total_count
+
+        if name == "data":
+            data = []
+            _data = d["data"]
+            for data_item_data in _data:
+                data_item = DevicePendingAdoption.from_dict_lazy(data_item_data)
+
+                data.append(data_item)
+
+            self.data = data
+            return data
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "offset",
+                    "limit",
+                    "count",
+                    "totalCount",
+                    "data",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -102,10 +229,16 @@ class DevicePendingAdoptionPage:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from typing import cast
 from typing import Union
@@ -16,6 +18,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="DevicePhysicalInterfaces")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class DevicePhysicalInterfaces:
@@ -27,9 +31,22 @@ class DevicePhysicalInterfaces:
 
     ports: Union[Unset, list["PortOverview"]] = UNSET
     radios: Union[Unset, list["WirelessRadioOverview"]] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         from ..models.port_overview import PortOverview
         from ..models.wireless_radio_overview import WirelessRadioOverview
 
@@ -62,16 +79,16 @@ class DevicePhysicalInterfaces:
         from ..models.port_overview import PortOverview
         from ..models.wireless_radio_overview import WirelessRadioOverview
 
-        d = dict(src_dict)
+        d = src_dict
         ports = []
-        _ports = d.pop("ports", UNSET)
+        _ports = d.get("ports", UNSET)
         for ports_item_data in _ports or []:
             ports_item = PortOverview.from_dict(ports_item_data)
 
             ports.append(ports_item)
 
         radios = []
-        _radios = d.pop("radios", UNSET)
+        _radios = d.get("radios", UNSET)
         for radios_item_data in _radios or []:
             radios_item = WirelessRadioOverview.from_dict(radios_item_data)
 
@@ -82,9 +99,92 @@ class DevicePhysicalInterfaces:
             radios=radios,
         )
 
-        device_physical_interfaces.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "ports",
+                "radios",
+            }
+        }
+
+        if additional_properties:
+            device_physical_interfaces._additional_properties = additional_properties
+        return device_physical_interfaces
+
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        device_physical_interfaces = cls.__new__(cls)
+        device_physical_interfaces._source = src_dict
         return device_physical_interfaces
 
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.port_overview import PortOverview
+        from ..models.wireless_radio_overview import WirelessRadioOverview
+
+        if name == "ports":
+            ports = []
+            _ports = d.get("ports", UNSET)
+            for ports_item_data in _ports or []:
+                ports_item = PortOverview.from_dict_lazy(ports_item_data)
+
+                ports.append(ports_item)
+
+            self.ports = ports
+            return ports
+
+        if name == "radios":
+            radios = []
+            _radios = d.get("radios", UNSET)
+            for radios_item_data in _radios or []:
+                radios_item = WirelessRadioOverview.from_dict_lazy(radios_item_data)
+
+                radios.append(radios_item)
+
+            self.radios = radios
+            return radios
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "ports",
+                    "radios",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -93,10 +193,16 @@ class DevicePhysicalInterfaces:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
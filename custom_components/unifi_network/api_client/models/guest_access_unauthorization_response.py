@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from typing import cast
 
@@ -14,6 +16,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="GuestAccessUnauthorizationResponse")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class GuestAccessUnauthorizationResponse:
@@ -25,9 +29,22 @@ class GuestAccessUnauthorizationResponse:
 
     action: str
     revoked_authorization: "GuestAuthorizationDetails"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         from ..models.guest_authorization_details import GuestAuthorizationDetails
 
         action = self.action
@@ -49,11 +66,11 @@ class GuestAccessUnauthorizationResponse:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.guest_authorization_details import GuestAuthorizationDetails
 
-        d = dict(src_dict)
-        action = d.pop("action")
+        d = src_dict
+        action = d["action"]
 
         revoked_authorization = GuestAuthorizationDetails.from_dict(
-            d.pop("revokedAuthorization")
+            d["revokedAuthorization"]
         )
 
         guest_access_unauthorization_response = cls(
@@ -61,9 +78,91 @@ class GuestAccessUnauthorizationResponse:
             revoked_authorization=revoked_authorization,
         )
 
-        guest_access_unauthorization_response.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "action",
+                "revokedAuthorization",
+            }
+        }
+
+        if additional_properties:
+            guest_access_unauthorization_response._additional_properties = (
+                additional_properties
+            )
         return guest_access_unauthorization_response
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "action",
+            "revokedAuthorization",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        guest_access_unauthorization_response = cls.__new__(cls)
+        guest_access_unauthorization_response._source = src_dict
+        return guest_access_unauthorization_response
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.guest_authorization_details import GuestAuthorizationDetails
+
+        if name == "action":
+            action = d["action"]
+
+            self.action = action
+            return action
+
+        if name == "revoked_authorization":
+            revoked_authorization = GuestAuthorizationDetails.from_dict_lazy(
+                d["revokedAuthorization"]
+            )
+
+            self.revoked_authorization = revoked_authorization
+            return revoked_authorization
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "action",
+                    "revokedAuthorization",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -72,10 +171,16 @@ class GuestAccessUnauthorizationResponse:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,15 +1,17 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from ..models.guest_authorization_details_authorization_method import (
     GuestAuthorizationDetailsAuthorizationMethod,
 )
-from dateutil.parser import isoparse
+from ..types import parse_datetime
 from typing import cast
 from typing import Union
 import datetime
@@ -22,6 +24,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="GuestAuthorizationDetails")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class GuestAuthorizationDetails:
@@ -44,9 +48,22 @@ class GuestAuthorizationDetails:
     rx_rate_limit_kbps: Union[Unset, int] = UNSET
     tx_rate_limit_kbps: Union[Unset, int] = UNSET
     usage: Union[Unset, "GuestAuthorizationUsageDetails"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         from ..models.guest_authorization_usage_details import (
             GuestAuthorizationUsageDetails,
         )
@@ -93,22 +110,22 @@ class GuestAuthorizationDetails:
             GuestAuthorizationUsageDetails,
         )
 
-        d = dict(src_dict)
-        authorized_at = isoparse(d.pop("authorizedAt"))
+        d = src_dict
+        authorized_at = parse_datetime(d["authorizedAt"])
 
         authorization_method = GuestAuthorizationDetailsAuthorizationMethod(
-            d.pop("authorizationMethod")
+            d["authorizationMethod"]
         )
 
-        expires_at = isoparse(d.pop("expiresAt"))
+        expires_at = parse_datetime(d["expiresAt"])
 
-        data_usage_limit_m_bytes = d.pop("dataUsageLimitMBytes", UNSET)
+        data_usage_limit_m_bytes = d.get("dataUsageLimitMBytes", UNSET)
 
-        rx_rate_limit_kbps = d.pop("rxRateLimitKbps", UNSET)
+        rx_rate_limit_kbps = d.get("rxRateLimitKbps", UNSET)
 
-        tx_rate_limit_kbps = d.pop("txRateLimitKbps", UNSET)
+        tx_rate_limit_kbps = d.get("txRateLimitKbps", UNSET)
 
-        _usage = d.pop("usage", UNSET)
+        _usage = d.get("usage", UNSET)
         usage: Union[Unset, GuestAuthorizationUsageDetails]
         if isinstance(_usage, Unset):
             usage = UNSET
@@ -125,9 +142,137 @@ class GuestAuthorizationDetails:
             usage=usage,
         )
 
-        guest_authorization_details.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "authorizedAt",
+                "authorizationMethod",
+                "expiresAt",
+                "dataUsageLimitMBytes",
+                "rxRateLimitKbps",
+                "txRateLimitKbps",
+                "usage",
+            }
+        }
+
+        if additional_properties:
+            guest_authorization_details._additional_properties = additional_properties
         return guest_authorization_details
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "authorizedAt",
+            "authorizationMethod",
+            "expiresAt",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        guest_authorization_details = cls.__new__(cls)
+        guest_authorization_details._source = src_dict
+        return guest_authorization_details
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.guest_authorization_usage_details import (
+            GuestAuthorizationUsageDetails,
+        )
+
+        if name == "authorized_at":
+            authorized_at = parse_datetime(d["authorizedAt"])
+
+            self.authorized_at = authorized_at
+            return authorized_at
+
+        if name == "authorization_method":
+            authorization_method = GuestAuthorizationDetailsAuthorizationMethod(
+                d["authorizationMethod"]
+            )
+
+            self.authorization_method = authorization_method
+            return authorization_method
+
+        if name == "expires_at":
+            expires_at = parse_datetime(d["expiresAt"])
+
+            self.expires_at = expires_at
+            return expires_at
+
+        if name == "data_usage_limit_m_bytes":
+            data_usage_limit_m_bytes = d.get("dataUsageLimitMBytes", UNSET)
+
+            self.data_usage_limit_m_bytes = data_usage_limit_m_bytes
+            return data_usage_limit_m_bytes
+
+        if name == "rx_rate_limit_kbps":
+            rx_rate_limit_kbps = d.get("rxRateLimitKbps", UNSET)
+
+            self.rx_rate_limit_kbps = rx_rate_limit_kbps
+            return rx_rate_limit_kbps
+
+        if name == "tx_rate_limit_kbps":
+            tx_rate_limit_kbps = d.get("txRateLimitKbps", UNSET)
+
+            self.tx_rate_limit_kbps = tx_rate_limit_kbps
+            return tx_rate_limit_kbps
+
+        if name == "usage":
+            _usage = d.get("usage", UNSET)
+            usage: Union[Unset, GuestAuthorizationUsageDetails]
+            if isinstance(_usage, Unset):
+                usage = UNSET
+            else:
+                usage = GuestAuthorizationUsageDetails.from_dict_lazy(_usage)
+
+            self.usage = usage
+            return usage
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "authorizedAt",
+                    "authorizationMethod",
+                    "expiresAt",
+                    "dataUsageLimitMBytes",
+                    "rxRateLimitKbps",
+                    "txRateLimitKbps",
+                    "usage",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -136,10 +281,16 @@ class GuestAuthorizationDetails:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,14 +1,18 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 
 T = TypeVar("T", bound="GuestAuthorizationUsageDetails")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class GuestAuthorizationUsageDetails:
@@ -24,9 +28,22 @@ class GuestAuthorizationUsageDetails:
     rx_bytes: int
     tx_bytes: int
     bytes_: int
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         duration_sec = self.duration_sec
 
         rx_bytes = self.rx_bytes
@@ -50,14 +67,14 @@ class GuestAuthorizationUsageDetails:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        duration_sec = d.pop("durationSec")
+        d = src_dict
+        duration_sec = d["durationSec"]
 
-        rx_bytes = d.pop("rxBytes")
+        rx_bytes = d["rxBytes"]
 
-        tx_bytes = d.pop("txBytes")
+        tx_bytes = d["txBytes"]
 
-        bytes_ = d.pop("bytes")
+        bytes_ = d["bytes"]
 
         guest_authorization_usage_details = cls(
             duration_sec=duration_sec,
@@ -66,9 +83,105 @@ class GuestAuthorizationUsageDetails:
             bytes_=bytes_,
         )
 
-        guest_authorization_usage_details.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "durationSec",
+                "rxBytes",
+                "txBytes",
+                "bytes",
+            }
+        }
+
+        if additional_properties:
+            guest_authorization_usage_details._additional_properties = (
+                additional_properties
+            )
         return guest_authorization_usage_details
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "durationSec",
+            "rxBytes",
+            "txBytes",
+            "bytes",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        guest_authorization_usage_details = cls.__new__(cls)
+        guest_authorization_usage_details._source = src_dict
+        return guest_authorization_usage_details
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        if name == "duration_sec":
+            duration_sec = d["durationSec"]
+
+            self.duration_sec = duration_sec
+            return duration_sec
+
+        if name == "rx_bytes":
+            rx_bytes = d["rxBytes"]
+
+            self.rx_bytes = rx_bytes
+            return rx_bytes
+
+        if name == "tx_bytes":
+            tx_bytes = d["txBytes"]
+
+            self.tx_bytes = tx_bytes
+            return tx_bytes
+
+        if name == "bytes_":
+            bytes_ = d["bytes"]
+
+            self.bytes_ = bytes_
+            return bytes_
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "durationSec",
+                    "rxBytes",
+                    "txBytes",
+                    "bytes",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -77,10 +190,16 @@ class GuestAuthorizationUsageDetails:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from typing import cast
 from uuid import UUID
@@ -15,6 +17,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="IntegrationLocalLagLocalDto")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class IntegrationLocalLagLocalDto:
@@ -28,9 +32,22 @@ class IntegrationLocalLagLocalDto:
     id: UUID
     port_idxs: list[int]
     metadata: "UserDefinedEntityMetadata"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         from ..models.user_defined_entity_metadata import UserDefinedEntityMetadata
 
         id = str(self.id)
@@ -55,12 +72,12 @@ class IntegrationLocalLagLocalDto:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.user_defined_entity_metadata import UserDefinedEntityMetadata
 
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
+        d = src_dict
+        id = UUID(d["id"])
 
-        port_idxs = cast(list[int], d.pop("portIdxs"))
+        port_idxs = cast(list[int], d["portIdxs"])
 
-        metadata = UserDefinedEntityMetadata.from_dict(d.pop("metadata"))
+        metadata = UserDefinedEntityMetadata.from_dict(d["metadata"])
 
         integration_local_lag_local_dto = cls(
             id=id,
@@ -68,9 +85,98 @@ class IntegrationLocalLagLocalDto:
             metadata=metadata,
         )
 
-        integration_local_lag_local_dto.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "id",
+                "portIdxs",
+                "metadata",
+            }
+        }
+
+        if additional_properties:
+            integration_local_lag_local_dto._additional_properties = (
+                additional_properties
+            )
+        return integration_local_lag_local_dto
+
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "id",
+            "portIdxs",
+            "metadata",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        integration_local_lag_local_dto = cls.__new__(cls)
+        integration_local_lag_local_dto._source = src_dict
         return integration_local_lag_local_dto
 
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.user_defined_entity_metadata import UserDefinedEntityMetadata
+
+        if name == "id":
+            id = UUID(d["id"])
+
+            self.id = id
+            return id
+
+        if name == "port_idxs":
+            port_idxs = cast(list[int], d["portIdxs"])
+
+            self.port_idxs = port_idxs
+            return port_idxs
+
+        if name == "metadata":
+            metadata = UserDefinedEntityMetadata.from_dict_lazy(d["metadata"])
+
+            self.metadata = metadata
+            return metadata
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "id",
+                    "portIdxs",
+                    "metadata",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -79,10 +185,16 @@ class IntegrationLocalLagLocalDto:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
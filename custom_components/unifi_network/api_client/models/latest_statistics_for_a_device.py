@@ -1,12 +1,14 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
-from dateutil.parser import isoparse
+from ..types import parse_datetime
 from typing import cast
 from typing import Union
 import datetime
@@ -22,6 +24,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="LatestStatisticsForADevice")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class LatestStatisticsForADevice:
@@ -49,9 +53,22 @@ class LatestStatisticsForADevice:
     cpu_utilization_pct: Union[Unset, float] = UNSET
     memory_utilization_pct: Union[Unset, float] = UNSET
     uplink: Union[Unset, "LatestStatisticsForADeviceUplinkInterface"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         from ..models.latest_statistics_for_a_device_uplink_interface import (
             LatestStatisticsForADeviceUplinkInterface,
         )
@@ -122,36 +139,36 @@ class LatestStatisticsForADevice:
             LatestStatisticsForDeviceInterfaces,
         )
 
-        d = dict(src_dict)
-        interfaces = LatestStatisticsForDeviceInterfaces.from_dict(d.pop("interfaces"))
+        d = src_dict
+        interfaces = LatestStatisticsForDeviceInterfaces.from_dict(d["interfaces"])
 
-        uptime_sec = d.pop("uptimeSec", UNSET)
+        uptime_sec = d.get("uptimeSec", UNSET)
 
-        _last_heartbeat_at = d.pop("lastHeartbeatAt", UNSET)
+        _last_heartbeat_at = d.get("lastHeartbeatAt", UNSET)
         last_heartbeat_at: Union[Unset, datetime.datetime]
         if isinstance(_last_heartbeat_at, Unset):
             last_heartbeat_at = UNSET
         else:
-            last_heartbeat_at = isoparse(_last_heartbeat_at)
+            last_heartbeat_at = parse_datetime(_last_heartbeat_at)
 
-        _next_heartbeat_at = d.pop("nextHeartbeatAt", UNSET)
+        _next_heartbeat_at = d.get("nextHeartbeatAt", UNSET)
         next_heartbeat_at: Union[Unset, datetime.datetime]
         if isinstance(_next_heartbeat_at, Unset):
             next_heartbeat_at = UNSET
         else:
-            next_heartbeat_at = isoparse(_next_heartbeat_at)
+            next_heartbeat_at = parse_datetime(_next_heartbeat_at)
 
-        load_average_1_min = d.pop("loadAverage1Min", UNSET)
+        load_average_1_min = d.get("loadAverage1Min", UNSET)
 
-        load_average_5_min = d.pop("loadAverage5Min", UNSET)
+        load_average_5_min = d.get("loadAverage5Min", UNSET)
 
-        load_average_15_min = d.pop("loadAverage15Min", UNSET)
+        load_average_15_min = d.get("loadAverage15Min", UNSET)
 
-        cpu_utilization_pct = d.pop("cpuUtilizationPct", UNSET)
+        cpu_utilization_pct = d.get("cpuUtilizationPct", UNSET)
 
-        memory_utilization_pct = d.pop("memoryUtilizationPct", UNSET)
+        memory_utilization_pct = d.get("memoryUtilizationPct", UNSET)
 
-        _uplink = d.pop("uplink", UNSET)
+        _uplink = d.get("uplink", UNSET)
         uplink: Union[Unset, LatestStatisticsForADeviceUplinkInterface]
         if isinstance(_uplink, Unset):
             uplink = UNSET
@@ -171,9 +188,174 @@ class LatestStatisticsForADevice:
             uplink=uplink,
         )
 
-        latest_statistics_for_a_device.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "interfaces",
+                "uptimeSec",
+                "lastHeartbeatAt",
+                "nextHeartbeatAt",
+                "loadAverage1Min",
+                "loadAverage5Min",
+                "loadAverage15Min",
+                "cpuUtilizationPct",
+                "memoryUtilizationPct",
+                "uplink",
+            }
+        }
+
+        if additional_properties:
+            latest_statistics_for_a_device._additional_properties = (
+                additional_properties
+            )
         return latest_statistics_for_a_device
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in ("interfaces",):
+            if key not in src_dict:
+                raise KeyError(key)
+        latest_statistics_for_a_device = cls.__new__(cls)
+        latest_statistics_for_a_device._source = src_dict
+        return latest_statistics_for_a_device
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.latest_statistics_for_a_device_uplink_interface import (
+            LatestStatisticsForADeviceUplinkInterface,
+        )
+        from ..models.latest_statistics_for_device_interfaces import (
+            LatestStatisticsForDeviceInterfaces,
+        )
+
+        if name == "interfaces":
+            interfaces = LatestStatisticsForDeviceInterfaces.from_dict_lazy(
+                d["interfaces"]
+            )
+
+            self.interfaces = interfaces
+            return interfaces
+
+        if name == "uptime_sec":
+            uptime_sec = d.get("uptimeSec", UNSET)
+
+            self.uptime_sec = uptime_sec
+            return uptime_sec
+
+        if name == "last_heartbeat_at":
+            _last_heartbeat_at = d.get("lastHeartbeatAt", UNSET)
+            last_heartbeat_at: Union[Unset, datetime.datetime]
+            if isinstance(_last_heartbeat_at, Unset):
+                last_heartbeat_at = UNSET
+            else:
+                last_heartbeat_at = parse_datetime(_last_heartbeat_at)
+
+            self.last_heartbeat_at = last_heartbeat_at
+            return last_heartbeat_at
+
+        if name == "next_heartbeat_at":
+            _next_heartbeat_at = d.get("nextHeartbeatAt", UNSET)
+            next_heartbeat_at: Union[Unset, datetime.datetime]
+            if isinstance(_next_heartbeat_at, Unset):
+                next_heartbeat_at = UNSET
+            else:
+                next_heartbeat_at = parse_datetime(_next_heartbeat_at)
+
+            self.next_heartbeat_at = next_heartbeat_at
+            return next_heartbeat_at
+
+        if name == "load_average_1_min":
+            load_average_1_min = d.get("loadAverage1Min", UNSET)
+
+            self.load_average_1_min = load_average_1_min
+            return load_average_1_min
+
+        if name == "load_average_5_min":
+            load_average_5_min = d.get("loadAverage5Min", UNSET)
+
+            self.load_average_5_min = load_average_5_min
+            return load_average_5_min
+
+        if name == "load_average_15_min":
+            load_average_15_min = d.get("loadAverage15Min", UNSET)
+
+            self.load_average_15_min = load_average_15_min
+            return load_average_15_min
+
+        if name == "cpu_utilization_pct":
+            cpu_utilization_pct = d.get("cpuUtilizationPct", UNSET)
+
+            self.cpu_utilization_pct = cpu_utilization_pct
+            return cpu_utilization_pct
+
+        if name == "memory_utilization_pct":
+            memory_utilization_pct = d.get("memoryUtilizationPct", UNSET)
+
+            self.memory_utilization_pct = memory_utilization_pct
+            return memory_utilization_pct
+
+        if name == "uplink":
+            _uplink = d.get("uplink", UNSET)
+            uplink: Union[Unset, LatestStatisticsForADeviceUplinkInterface]
+            if isinstance(_uplink, Unset):
+                uplink = UNSET
+            else:
+                uplink = LatestStatisticsForADeviceUplinkInterface.from_dict_lazy(
+                    _uplink
+                )
+
+            self.uplink = uplink
+            return uplink
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "interfaces",
+                    "uptimeSec",
+                    "lastHeartbeatAt",
+                    "nextHeartbeatAt",
+                    "loadAverage1Min",
+                    "loadAverage5Min",
+                    "loadAverage15Min",
+                    "cpuUtilizationPct",
+                    "memoryUtilizationPct",
+                    "uplink",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -182,10 +364,16 @@ class LatestStatisticsForADevice:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from ..models.port_overview_connector import PortOverviewConnector
 from ..models.port_overview_state import PortOverviewState
@@ -17,6 +19,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="PortOverview")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class PortOverview:
@@ -36,9 +40,22 @@ class PortOverview:
     max_speed_mbps: int
     speed_mbps: Union[Unset, int] = UNSET
     poe: Union[Unset, "PortPoEOverview"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         from ..models.port_po_e_overview import PortPoEOverview
 
         idx = self.idx
@@ -76,18 +93,18 @@ class PortOverview:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.port_po_e_overview import PortPoEOverview
 
-        d = dict(src_dict)
-        idx = d.pop("idx")
+        d = src_dict
+        idx = d["idx"]
 
-        state = PortOverviewState(d.pop("state"))
+        state = PortOverviewState(d["state"])
 
-        connector = PortOverviewConnector(d.pop("connector"))
+        connector = PortOverviewConnector(d["connector"])
 
-        max_speed_mbps = d.pop("maxSpeedMbps")
+        max_speed_mbps = d["maxSpeedMbps"]
 
-        speed_mbps = d.pop("speedMbps", UNSET)
+        speed_mbps = d.get("speedMbps", UNSET)
 
-        _poe = d.pop("poe", UNSET)
+        _poe = d.get("poe", UNSET)
         poe: Union[Unset, PortPoEOverview]
         if isinstance(_poe, Unset):
             poe = UNSET
@@ -103,9 +120,126 @@ class PortOverview:
             poe=poe,
         )
 
-        port_overview.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "idx",
+                "state",
+                "connector",
+                "maxSpeedMbps",
+                "speedMbps",
+                "poe",
+            }
+        }
+
+        if additional_properties:
+            port_overview._additional_properties = additional_properties
         return port_overview
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "idx",
+            "state",
+            "connector",
+            "maxSpeedMbps",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        port_overview = cls.__new__(cls)
+        port_overview._source = src_dict
+        return port_overview
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from ..models.port_po_e_overview import PortPoEOverview
+
+        if name == "idx":
+            idx = d["idx"]
+
+            self.idx = idx
+            return idx
+
+        if name == "state":
+            state = PortOverviewState(d["state"])
+
+            self.state = state
+            return state
+
+        if name == "connector":
+            connector = PortOverviewConnector(d["connector"])
+
+            self.connector = connector
+            return connector
+
+        if name == "max_speed_mbps":
+            max_speed_mbps = d["maxSpeedMbps"]
+
+            self.max_speed_mbps = max_speed_mbps
+            return max_speed_mbps
+
+        if name == "speed_mbps":
+            speed_mbps = d.get("speedMbps", UNSET)
+
+            self.speed_mbps = speed_mbps
+            return speed_mbps
+
+        if name == "poe":
+            _poe = d.get("poe", UNSET)
+            poe: Union[Unset, PortPoEOverview]
+            if isinstance(_poe, Unset):
+                poe = UNSET
+            else:
+                poe = PortPoEOverview.from_dict_lazy(_poe)
+
+            self.poe = poe
+            return poe
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "idx",
+                    "state",
+                    "connector",
+                    "maxSpeedMbps",
+                    "speedMbps",
+                    "poe",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -114,10 +248,16 @@ class PortOverview:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from ..models.port_po_e_overview_standard import PortPoEOverviewStandard
 from ..models.port_po_e_overview_state import PortPoEOverviewState
@@ -13,6 +15,8 @@ from ..models.port_po_e_overview_type import PortPoEOverviewType
 
 T = TypeVar("T", bound="PortPoEOverview")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class PortPoEOverview:
@@ -28,9 +32,22 @@ class PortPoEOverview:
     type_: PortPoEOverviewType
     enabled: bool
     state: PortPoEOverviewState
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         standard = self.standard.value
 
         type_ = self.type_.value
@@ -54,14 +71,14 @@ class PortPoEOverview:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        standard = PortPoEOverviewStandard(d.pop("standard"))
+        d = src_dict
+        standard = PortPoEOverviewStandard(d["standard"])
 
-        type_ = PortPoEOverviewType(d.pop("type"))
+        type_ = PortPoEOverviewType(d["type"])
 
-        enabled = d.pop("enabled")
+        enabled = d["enabled"]
 
-        state = PortPoEOverviewState(d.pop("state"))
+        state = PortPoEOverviewState(d["state"])
 
         port_po_e_overview = cls(
             standard=standard,
@@ -70,9 +87,103 @@ class PortPoEOverview:
             state=state,
         )
 
-        port_po_e_overview.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "standard",
+                "type",
+                "enabled",
+                "state",
+            }
+        }
+
+        if additional_properties:
+            port_po_e_overview._additional_properties = additional_properties
         return port_po_e_overview
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "standard",
+            "type",
+            "enabled",
+            "state",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        port_po_e_overview = cls.__new__(cls)
+        port_po_e_overview._source = src_dict
+        return port_po_e_overview
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        if name == "standard":
+            standard = PortPoEOverviewStandard(d["standard"])
+
+            self.standard = standard
+            return standard
+
+        if name == "type_":
+            type_ = PortPoEOverviewType(d["type"])
+
+            self.type_ = type_
+            return type_
+
+        if name == "enabled":
+            enabled = d["enabled"]
+
+            self.enabled = enabled
+            return enabled
+
+        if name == "state":
+            state = PortPoEOverviewState(d["state"])
+
+            self.state = state
+            return state
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "standard",
+                    "type",
+                    "enabled",
+                    "state",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -81,10 +192,16 @@ class PortPoEOverview:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class TeleportClientConnectionDetailsType(str, Enum):
+    TELEPORT = "TELEPORT"
+
+    def __str__(self) -> str:
+        return str(self.value)
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class TeleportClientConnectionOverviewType(str, Enum):
+    TELEPORT = "TELEPORT"
+
+    def __str__(self) -> str:
+        return str(self.value)
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class VPNClientConnectionDetailsType(str, Enum):
+    VPN = "VPN"
+
+    def __str__(self) -> str:
+        return str(self.value)
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class WiredClientDetailsType(str, Enum):
+    WIRED = "WIRED"
+
+    def __str__(self) -> str:
+        return str(self.value)
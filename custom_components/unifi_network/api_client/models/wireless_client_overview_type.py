@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class WirelessClientOverviewType(str, Enum):
+    WIRELESS = "WIRELESS"
+
+    def __str__(self) -> str:
+        return str(self.value)
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
 from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING, Generator
+from typing import cast as _cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
+from types import MappingProxyType
 
 from ..models.wireless_radio_overview_wlan_standard import (
     WirelessRadioOverviewWlanStandard,
@@ -14,6 +16,8 @@ from typing import Union
 
 T = TypeVar("T", bound="WirelessRadioOverview")
 
+_NO_ADDITIONAL_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
 
 @_attrs_define
 class WirelessRadioOverview:
@@ -29,9 +33,22 @@ class WirelessRadioOverview:
     frequency_g_hz: float
     channel_width_m_hz: int
     channel: Union[Unset, int] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(
+        init=False, default=None
+    )
+    _source: Optional[Mapping[str, Any]] = _attrs_field(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def to_dict(self, *, reuse_source: bool = False) -> dict[str, Any]:
+        """Serialize the model to a JSON-compatible dict
+
+        With reuse_source, a model built by from_dict_lazy returns the mapping it was decoded from as is,
+        without copying or re-encoding it. Only use it for models that were not modified after decoding,
+        and don't modify the returned mapping.
+        """
+        if reuse_source and self._source is not None:
+            return _cast(dict[str, Any], self._source)
         wlan_standard = self.wlan_standard.value
 
         frequency_g_hz = self.frequency_g_hz
@@ -56,14 +73,14 @@ class WirelessRadioOverview:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        wlan_standard = WirelessRadioOverviewWlanStandard(d.pop("wlanStandard"))
+        d = src_dict
+        wlan_standard = WirelessRadioOverviewWlanStandard(d["wlanStandard"])
 
-        frequency_g_hz = d.pop("frequencyGHz")
+        frequency_g_hz = d["frequencyGHz"]
 
-        channel_width_m_hz = d.pop("channelWidthMHz")
+        channel_width_m_hz = d["channelWidthMHz"]
 
-        channel = d.pop("channel", UNSET)
+        channel = d.get("channel", UNSET)
 
         wireless_radio_overview = cls(
             wlan_standard=wlan_standard,
@@ -72,9 +89,102 @@ class WirelessRadioOverview:
             channel=channel,
         )
 
-        wireless_radio_overview.additional_properties = d
+        additional_properties = {
+            prop_name: prop_dict
+            for prop_name, prop_dict in d.items()
+            if prop_name
+            not in {
+                "wlanStandard",
+                "frequencyGHz",
+                "channelWidthMHz",
+                "channel",
+            }
+        }
+
+        if additional_properties:
+            wireless_radio_overview._additional_properties = additional_properties
         return wireless_radio_overview
 
+    @classmethod
+    def from_dict_lazy(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        """Wrap src_dict without decoding it, fields are decoded on first access
+
+        Like from_dict, raises KeyError when a required key is missing, so a
+        malformed payload is rejected when it is parsed rather than when it is read.
+        """
+        for key in (
+            "wlanStandard",
+            "frequencyGHz",
+            "channelWidthMHz",
+        ):
+            if key not in src_dict:
+                raise KeyError(key)
+        wireless_radio_overview = cls.__new__(cls)
+        wireless_radio_overview._source = src_dict
+        return wireless_radio_overview
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for fields of a from_dict_lazy instance that are not decoded yet
+        if name == "_source":
+            raise AttributeError(name)
+        d = self._source
+        if d is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        if name == "wlan_standard":
+            wlan_standard = WirelessRadioOverviewWlanStandard(d["wlanStandard"])
+
+            self.wlan_standard = wlan_standard
+            return wlan_standard
+
+        if name == "frequency_g_hz":
+            frequency_g_hz = d["frequencyGHz"]
+
+            self.frequency_g_hz = frequency_g_hz
+            return frequency_g_hz
+
+        if name == "channel_width_m_hz":
+            channel_width_m_hz = d["channelWidthMHz"]
+
+            self.channel_width_m_hz = channel_width_m_hz
+            return channel_width_m_hz
+
+        if name == "channel":
+            channel = d.get("channel", UNSET)
+
+            self.channel = channel
+            return channel
+
+        if name == "_additional_properties":
+            additional_properties = {
+                prop_name: prop_dict
+                for prop_name, prop_dict in d.items()
+                if prop_name
+                not in {
+                    "wlanStandard",
+                    "frequencyGHz",
+                    "channelWidthMHz",
+                    "channel",
+                }
+            }
+
+            self._additional_properties = additional_properties or None
+            return self._additional_properties
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def additional_properties(self) -> Mapping[str, Any]:
+        """Keys not described by the spec, read-only and empty unless the payload had any"""
+        return self._additional_properties or _NO_ADDITIONAL_PROPERTIES
+
+    @additional_properties.setter
+    def additional_properties(self, value: Mapping[str, Any]) -> None:
+        self._additional_properties = dict(value) if value else None
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -83,10 +193,16 @@ class WirelessRadioOverview:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        self._additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+        if not self._additional_properties:
+            self._additional_properties = None
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
@@ -1,10 +1,13 @@
 """Contains some shared types for properties"""
 
+import datetime
 from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
 from http import HTTPStatus
 from typing import BinaryIO, Generic, Optional, TypeVar, Literal, Union, IO
 
 from attrs import define
+from dateutil.parser import isoparse
 
 
 class Unset:
@@ -14,6 +17,17 @@ class Unset:
 
 UNSET: Unset = Unset()
 
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime.datetime:
+    """Parse an ISO-8601 timestamp, memoizing results since most repeat between polls"""
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        # fromisoformat is much faster but not as lenient as isoparse
+        return isoparse(value)
+
+
 # The types that `httpx.Client(files=)` can accept, copied from that library.
 FileContent = Union[IO[bytes], bytes, str]
 FileTypes = Union[
@@ -51,4 +65,12 @@ class Response(Generic[T]):
     parsed: Optional[T]
 
 
-__all__ = ["UNSET", "File", "FileTypes", "RequestFiles", "Response", "Unset"]
+__all__ = [
+    "UNSET",
+    "File",
+    "FileTypes",
+    "RequestFiles",
+    "Response",
+    "Unset",
+    "parse_datetime",
+]
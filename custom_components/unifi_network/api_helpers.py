@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from http import HTTPStatus
@@ -12,15 +13,40 @@ _LOGGER = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+def _get_page_data(response: Any) -> tuple[list[Any], int]:
+    """Validate a page response and return its items and total count."""
+    if response is None or response.status_code != HTTPStatus.OK:
+        raise ValueError(
+            f"API returned status {getattr(response, 'status_code', None)}"
+        )
+
+    if not response.parsed:
+        raise ValueError("No parsed response from API")
+
+    page_data = getattr(response.parsed, "data", None) or []
+    total_count = getattr(response.parsed, "total_count", 0)
+    return page_data, total_count
+
+
 async def fetch_all_pages(
-    fetch_func: Callable[..., Awaitable[Any]], page_size: int = 100, **kwargs: Any
+    fetch_func: Callable[..., Awaitable[Any]],
+    page_size: int = 100,
+    max_concurrency: int = 1,
+    **kwargs: Any,
 ) -> list[T]:
     """
     Fetch all items from a paginated API endpoint.
 
+    The first page is always fetched on its own. With ``max_concurrency`` above
+    1, its ``total_count`` is then used to request every remaining offset
+    concurrently, with at most ``max_concurrency`` requests in flight. Pages are
+    reassembled in offset order either way.
+
     Args:
         fetch_func: The asyncio_detailed function from the API client
         page_size: Number of items to fetch per page (default: 100)
+        max_concurrency: Maximum number of pages requested at once (default: 1,
+            which walks pages sequentially)
         **kwargs: Additional arguments to pass to the fetch function
 
     Returns:
@@ -33,29 +59,27 @@ async def fetch_all_pages(
             site_id=site_id
         )
     """
-    all_items = []
-    offset = 0
-
-    while True:
-        response = await fetch_func(offset=offset, limit=page_size, **kwargs)
-
-        if response is None or response.status_code != HTTPStatus.OK:
-            raise ValueError(
-                f"API returned status {getattr(response, 'status_code', None)}"
+    response = await fetch_func(offset=0, limit=page_size, **kwargs)
+    page_data, total_count = _get_page_data(response)
+    all_items = list(page_data)
+
+    if max_concurrency > 1 and len(all_items) < total_count:
+        all_items.extend(
+            await _fetch_remaining_pages(
+                fetch_func, page_size, total_count, max_concurrency, **kwargs
             )
-
-        if not response.parsed:
-            raise ValueError("No parsed response from API")
-
-        page_data = getattr(response.parsed, "data", None) or []
-        all_items.extend(page_data)
-
-        # Check if we've fetched all items
-        total_count = getattr(response.parsed, "total_count", 0)
-        if offset + len(page_data) >= total_count:
-            break
-
-        offset += page_size
+        )
+    elif len(all_items) < total_count:
+        offset = 0
+        while True:
+            offset += page_size
+            response = await fetch_func(offset=offset, limit=page_size, **kwargs)
+            page_data, total_count = _get_page_data(response)
+            all_items.extend(page_data)
+
+            # Check if we've fetched all items
+            if offset + len(page_data) >= total_count:
+                break
 
     _LOGGER.debug(
         "Fetched %d items across %d pages",
@@ -63,3 +87,43 @@ async def fetch_all_pages(
         (len(all_items) + page_size - 1) // page_size,
     )
     return all_items
+
+
+async def fetch_total_count(
+    fetch_func: Callable[..., Awaitable[Any]], **kwargs: Any
+) -> int:
+    """Return how many items a paginated endpoint has, fetching a single item."""
+    response = await fetch_func(offset=0, limit=1, **kwargs)
+    _, total_count = _get_page_data(response)
+    return total_count
+
+
+async def _fetch_remaining_pages(
+    fetch_func: Callable[..., Awaitable[Any]],
+    page_size: int,
+    total_count: int,
+    max_concurrency: int,
+    **kwargs: Any,
+) -> list[Any]:
+    """Fetch every page after the first concurrently and return items in order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch_page(offset: int) -> list[Any]:
+        async with semaphore:
+            response = await fetch_func(offset=offset, limit=page_size, **kwargs)
+        page_data, _ = _get_page_data(response)
+        return page_data
+
+    tasks = [
+        asyncio.ensure_future(_fetch_page(offset))
+        for offset in range(page_size, total_count, page_size)
+    ]
+    try:
+        pages = await asyncio.gather(*tasks)
+    except BaseException:
+        # Don't leave sibling requests running once one page has failed
+        for task in tasks:
+            task.cancel()
+        raise
+
+    return [item for page_data in pages for item in page_data]
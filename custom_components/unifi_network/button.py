@@ -54,7 +54,7 @@ class UnifiDevicePortPoeButton(CoordinatorEntity, ButtonEntity):
         port_idx: int,
     ) -> None:
         """Initialize the Unifi device port POE button."""
-        CoordinatorEntity.__init__(self, coordinator)
+        CoordinatorEntity.__init__(self, coordinator, (device_id, "details"))
         self.entity_description = description
         self.device_id = device_id
         self.port_idx = port_idx
@@ -80,25 +80,15 @@ class UnifiDevicePortPoeButton(CoordinatorEntity, ButtonEntity):
 
         # Check if port exists and has POE capability
         device = self.coordinator.get_device(self.device_id)
-        if not device or not device.details:
-            return False
-
-        interfaces_obj = getattr(device.details, "interfaces", None)
-        if not interfaces_obj:
+        if not device:
             return False
 
-        ports = getattr(interfaces_obj, "ports", [])
-        if not ports or ports is UNSET:
+        port = device.get_port(self.port_idx)
+        if port is None:
             return False
 
-        for port in ports:
-            port_idx = getattr(port, "idx", None)
-            if port_idx == self.port_idx:
-                # Check if port has POE capability
-                poe_obj = getattr(port, "poe", None)
-                return poe_obj is not None and poe_obj is not UNSET
-
-        return False
+        poe_obj = getattr(port, "poe", None)
+        return poe_obj is not None and poe_obj is not UNSET
 
     async def async_press(self) -> None:
         """Handle the button press to trigger power cycle."""
@@ -132,7 +122,8 @@ class UnifiDevicePortPoeButton(CoordinatorEntity, ButtonEntity):
                     self.device_id,
                     self.port_idx,
                 )
-                # Refresh device data after action
+                # Refresh device data, including the port details, after action
+                self.coordinator.invalidate_details(self.device_id)
                 await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error(
@@ -163,7 +154,7 @@ class UnifiDeviceActionButton(CoordinatorEntity, ButtonEntity):
         description: UnifiDeviceActionButtonDescription,
     ) -> None:
         """Initialize the Unifi device action button."""
-        CoordinatorEntity.__init__(self, coordinator)
+        CoordinatorEntity.__init__(self, coordinator, (device_id, "overview"))
         self.entity_description = description
         self.device_id = device_id
         self.action = description.action
@@ -18,7 +18,31 @@ from homeassistant.helpers import selector
 from .api_client import Client
 from .api_client.api.sites import get_site_overview_page
 from .api_helpers import fetch_all_pages
-from .const import DOMAIN
+from .const import (
+    DEFAULT_CLIENT_RECONCILIATION_INTERVAL,
+    DEFAULT_DETAILS_UPDATE_INTERVAL,
+    DEFAULT_HTTP2,
+    DEFAULT_INCREMENTAL_CLIENT_POLLING,
+    DEFAULT_KEEP_RAW_PAYLOADS,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_KNOWN_CLIENTS_MAX_SIZE,
+    DEFAULT_KNOWN_CLIENTS_TTL_DAYS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_REQUESTS_PER_SECOND,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_STATE_DEADBAND_PCT,
+    DEFAULT_SUPPRESS_UNCHANGED_STATES,
+    DOMAIN,
+)
+from .filters import (
+    CLIENT_FILTER_PROPERTIES,
+    CLIENT_TYPES,
+    DEVICE_FILTER_PROPERTIES,
+    FilterError,
+    validate_filter,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -168,25 +192,173 @@ class OptionsFlowHandler(OptionsFlowWithReload):
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Optional step: user sets filters for devices and clients."""
+        """Optional step: user sets filters, request limits and polling cadence."""
 
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(data=user_input)
+            for key, properties in (
+                ("devices_filter", DEVICE_FILTER_PROPERTIES),
+                ("clients_filter", CLIENT_FILTER_PROPERTIES),
+            ):
+                if not user_input.get(key):
+                    continue
+                try:
+                    validate_filter(user_input[key], properties)
+                except FilterError as err:
+                    _LOGGER.debug("Invalid %s %r: %s", key, user_input[key], err)
+                    errors[key] = "invalid_filter"
+            if user_input.get(
+                "min_update_interval", DEFAULT_MIN_UPDATE_INTERVAL
+            ) > user_input.get("max_update_interval", DEFAULT_MAX_UPDATE_INTERVAL):
+                errors["max_update_interval"] = "invalid_update_interval"
+            if not errors:
+                return self.async_create_entry(data=user_input)
 
         schema = vol.Schema(
             {
+                vol.Optional("devices_models"): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[], multiple=True, custom_value=True
+                    )
+                ),
+                vol.Optional("clients_types"): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=list(CLIENT_TYPES), multiple=True
+                    )
+                ),
                 vol.Optional("devices_filter"): selector.TextSelector(
                     selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
                 ),
                 vol.Optional("clients_filter"): selector.TextSelector(
                     selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
                 ),
+                vol.Optional(
+                    "max_concurrent_requests", default=DEFAULT_MAX_CONCURRENT_REQUESTS
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1, max=50, step=1, mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(
+                    "max_requests_per_second", default=DEFAULT_MAX_REQUESTS_PER_SECOND
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=100, step=0.5, mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(
+                    "http2", default=DEFAULT_HTTP2
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    "max_connections", default=DEFAULT_MAX_CONNECTIONS
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1, max=100, step=1, mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(
+                    "keepalive_expiry", default=DEFAULT_KEEPALIVE_EXPIRY
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=600,
+                        step=5,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    "min_update_interval", default=DEFAULT_MIN_UPDATE_INTERVAL
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=5,
+                        max=600,
+                        step=5,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    "max_update_interval", default=DEFAULT_MAX_UPDATE_INTERVAL
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=5,
+                        max=600,
+                        step=5,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    "details_update_interval", default=DEFAULT_DETAILS_UPDATE_INTERVAL
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=3600,
+                        step=30,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    "suppress_unchanged_states",
+                    default=DEFAULT_SUPPRESS_UNCHANGED_STATES,
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    "state_deadband_pct", default=DEFAULT_STATE_DEADBAND_PCT
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=50,
+                        step=0.1,
+                        unit_of_measurement="%",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    "known_clients_ttl_days", default=DEFAULT_KNOWN_CLIENTS_TTL_DAYS
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=3650,
+                        step=1,
+                        unit_of_measurement="d",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    "known_clients_max_size", default=DEFAULT_KNOWN_CLIENTS_MAX_SIZE
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=1000000, step=1, mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(
+                    "incremental_client_polling",
+                    default=DEFAULT_INCREMENTAL_CLIENT_POLLING,
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    "client_reconciliation_interval",
+                    default=DEFAULT_CLIENT_RECONCILIATION_INTERVAL,
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=60,
+                        max=3600,
+                        step=30,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    "keep_raw_payloads", default=DEFAULT_KEEP_RAW_PAYLOADS
+                ): selector.BooleanSelector(),
             }
         )
 
         return self.async_show_form(
             step_id="init",
             data_schema=self.add_suggested_values_to_schema(
-                schema, self.config_entry.options
+                schema, user_input or self.config_entry.options
             ),
+            errors=errors,
         )
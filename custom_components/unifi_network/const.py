@@ -1,6 +1,38 @@
 DOMAIN = "unifi_network"
 PLATFORMS = ["sensor", "device_tracker", "button", "update"]
 DEFAULT_UPDATE_INTERVAL = 30  # seconds
+DEFAULT_MIN_UPDATE_INTERVAL = 30  # seconds, below the maximum to adapt the interval
+DEFAULT_MAX_UPDATE_INTERVAL = 30  # seconds, above the minimum to adapt the interval
+DEFAULT_DETAILS_UPDATE_INTERVAL = (
+    0  # seconds between device details refreshes, 0 = every refresh
+)
+STATS_MAX_AGE = 300  # seconds statistics are reused at most while awaiting a heartbeat
+STALE_SECTION_MAX_AGE = 900  # seconds a section is kept past due while fetches fail
+DEFAULT_PAGE_CONCURRENCY = 4  # pages requested at once after the first one
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10  # API requests in flight per config entry
+DEFAULT_MAX_REQUESTS_PER_SECOND = 0  # 0 disables rate limiting
+REQUEST_MAX_RETRIES = 2  # retries of a failed GET before the refresh gives up
+REQUEST_RETRY_BACKOFF = 0.5  # seconds, upper bound of the first retry delay
+REQUEST_RETRY_MAX_DELAY = 10  # seconds waited at most between retries
+CIRCUIT_BREAKER_THRESHOLD = 3  # failed refreshes in a row before polling pauses
+CIRCUIT_BREAKER_COOLDOWN = 30  # seconds polling pauses at first, doubled while failing
+CIRCUIT_BREAKER_MAX_COOLDOWN = 600  # seconds polling pauses at most
+DEGRADED_REFRESH_FRACTION = 0.5  # share of failed device requests counted as a failure
+DEFAULT_HTTP2 = False  # multiplex requests over one connection, needs the h2 package
+DEFAULT_MAX_CONNECTIONS = 10  # pooled connections to the controller per config entry
+DEFAULT_KEEPALIVE_EXPIRY = 60  # seconds idle connections are kept between refreshes
+DEFAULT_SUPPRESS_UNCHANGED_STATES = False  # skip sensor writes when nothing changed
+DEFAULT_STATE_DEADBAND_PCT = 0  # relative change below which metrics are not written
+DEFAULT_KNOWN_CLIENTS_TTL_DAYS = 0  # days an offline client is remembered, 0 = forever
+DEFAULT_KNOWN_CLIENTS_MAX_SIZE = 0  # known clients kept at most, 0 = unlimited
+DEFAULT_INCREMENTAL_CLIENT_POLLING = False  # only fetch newly connected clients
+DEFAULT_CLIENT_RECONCILIATION_INTERVAL = 300  # seconds between full client sweeps
+INCREMENTAL_MAX_MISMATCHES = 2  # count mismatches in a row before polling pauses
+DEFAULT_KEEP_RAW_PAYLOADS = False  # keep the decoded API items of the last refresh
+KNOWN_CLIENTS_EVICTION_BATCH = 500  # known clients evicted at most per refresh
+KNOWN_CLIENTS_STORAGE_VERSION = 1
+KNOWN_CLIENTS_SAVE_DELAY = 60  # seconds changes are batched before writing to disk
+KNOWN_CLIENTS_MAX_SAVE_AGE = 900  # seconds before last_seen values are written anyway
 
 ATTR_MANUFACTURER = "Ubiquiti Networks"
 
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable, Coroutine
-from datetime import timedelta
+import time
+from collections.abc import Callable, Coroutine, Iterable, Mapping
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
@@ -17,14 +19,40 @@ from .api_client.api.uni_fi_devices import (
     get_adopted_device_latest_statistics,
     get_adopted_device_overview_page,
 )
+from .api_client.models import AdoptedDeviceDetails, LatestStatisticsForADevice
 from .api_client.types import UNSET
-from .api_helpers import fetch_all_pages
-from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN
-from .unifi_client import UnifiClient
+from .api_helpers import fetch_all_pages, fetch_total_count
+from .const import (
+    DEFAULT_CLIENT_RECONCILIATION_INTERVAL,
+    DEFAULT_DETAILS_UPDATE_INTERVAL,
+    DEFAULT_INCREMENTAL_CLIENT_POLLING,
+    DEFAULT_KNOWN_CLIENTS_MAX_SIZE,
+    DEFAULT_KNOWN_CLIENTS_TTL_DAYS,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_PAGE_CONCURRENCY,
+    DEFAULT_STATE_DEADBAND_PCT,
+    DEFAULT_SUPPRESS_UNCHANGED_STATES,
+    DEFAULT_UPDATE_INTERVAL,
+    DEGRADED_REFRESH_FRACTION,
+    DOMAIN,
+    INCREMENTAL_MAX_MISMATCHES,
+    KNOWN_CLIENTS_EVICTION_BATCH,
+    KNOWN_CLIENTS_MAX_SAVE_AGE,
+    KNOWN_CLIENTS_SAVE_DELAY,
+    STALE_SECTION_MAX_AGE,
+    STATS_MAX_AGE,
+)
+from .filters import CLIENT_FILTER_PROPERTIES, all_of, condition
+from .scheduler import AdaptiveInterval, CircuitBreaker, RequestScheduler
+from .unifi_client import KnownClient, UnifiClient, UnifiClientRecord
 from .unifi_device import UnifiDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# UnifiDevice fields that are diffed separately between refreshes
+DEVICE_SECTIONS = ("overview", "latest_statistics", "details")
+
 
 class UnifiCoordinator(DataUpdateCoordinator):
     """Manages data updates from Unifi Network API."""
@@ -37,13 +65,23 @@ class UnifiCoordinator(DataUpdateCoordinator):
         filter_: str | None,
         name: str,
         update_method: Callable[[], Coroutine[Any, Any, Any]],
+        *,
+        scheduler: RequestScheduler | None = None,
+        keep_raw_payloads: bool = False,
+        min_update_interval: float = DEFAULT_MIN_UPDATE_INTERVAL,
+        max_update_interval: float = DEFAULT_MAX_UPDATE_INTERVAL,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
         """Initialize the coordinator."""
+        # Adapts the interval between refreshes when the bounds allow it
+        self.poll_interval = AdaptiveInterval(
+            DEFAULT_UPDATE_INTERVAL, min_update_interval, max_update_interval
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{name}",
-            update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            update_interval=timedelta(seconds=self.poll_interval.interval),
         )
         self.client = client
         self.site_id = site_id
@@ -51,11 +89,90 @@ class UnifiCoordinator(DataUpdateCoordinator):
             self.filter_ = UNSET
         else:
             self.filter_ = filter_
+        # Shared with the other coordinators of the config entry when provided
+        self.scheduler = scheduler or RequestScheduler()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
         self._update_method = update_method
+        # Page items of the last refresh as decoded from the API, by id
+        self.keep_raw_payloads = keep_raw_payloads
+        self.raw_payloads: dict[str, Mapping[str, Any]] = {}
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API endpoint."""
-        return await self._update_method()
+        """Fetch data from API endpoint and adapt the interval to the result."""
+        if not self.circuit_breaker.allow():
+            raise UpdateFailed(
+                "Controller is unavailable, polling paused for "
+                f"{self.circuit_breaker.retry_in():.0f} seconds"
+            )
+
+        # Let through while the breaker is open, this refresh is its probe
+        probe = self.circuit_breaker.is_open
+        previous = self.data if self.last_update_success else None
+        started = time.monotonic()
+        try:
+            data = await self._update_method()
+        except Exception:
+            self.circuit_breaker.record_failure()
+            self._adapt_update_interval(time.monotonic() - started, failed=True)
+            raise
+        except BaseException:
+            # A cancelled probe says nothing about the controller, allow another
+            if probe:
+                self.circuit_breaker.cancel_probe()
+            raise
+        if self._refresh_degraded():
+            # Cached data hides most requests failing, the controller still is
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+        latency = time.monotonic() - started
+        changed_fraction = None
+        if previous is not None:
+            changed = self._count_changes(previous, data)
+            changed_fraction = changed / max(1, len(previous.keys() | data.keys()))
+        self._adapt_update_interval(latency, changed_fraction=changed_fraction)
+        return data
+
+    def _refresh_degraded(self) -> bool:
+        """Return whether the last refresh counts as failed despite returning data."""
+        return False
+
+    def _count_changes(self, previous: dict[str, Any], current: dict[str, Any]) -> int:
+        """Return how many items appeared, disappeared or changed."""
+        return len(previous.keys() ^ current.keys())
+
+    def _adapt_update_interval(
+        self,
+        latency: float,
+        *,
+        failed: bool = False,
+        changed_fraction: float | None = None,
+    ) -> None:
+        """Set the interval until the next refresh from the last one."""
+        if not self.poll_interval.adaptive:
+            return
+        interval = self.poll_interval.record(
+            latency, failed=failed, changed_fraction=changed_fraction
+        )
+        if interval != self.update_interval.total_seconds():
+            _LOGGER.debug("%s: polling every %.0f seconds", self.name, interval)
+            self.update_interval = timedelta(seconds=interval)
+
+    def _store_raw_payloads(self, items: Iterable[Any], *, merge: bool = False) -> None:
+        """Keep the raw payloads of the fetched page items when enabled.
+
+        The models are never modified, so the mappings they were decoded from
+        are reused as is instead of being rebuilt with to_dict. With ``merge``
+        the items are added to the payloads kept so far instead of replacing
+        them.
+        """
+        if self.keep_raw_payloads:
+            payloads = {str(item.id): item.to_dict(reuse_source=True) for item in items}
+            if merge:
+                self.raw_payloads.update(payloads)
+            else:
+                self.raw_payloads = payloads
 
 
 class UnifiDeviceCoordinator(UnifiCoordinator):
@@ -64,6 +181,27 @@ class UnifiDeviceCoordinator(UnifiCoordinator):
     This class fetches the device overview page and then retrieves the latest
     statistics for each device concurrently, storing both in UnifiDevice objects
     in a dict mapping device_id to UnifiDevice.
+
+    The controller only refreshes a device's statistics when the device sends a
+    heartbeat, so statistics are refetched once the ``next_heartbeat_at`` they
+    announced has passed, or sooner when the device overview shows a state or
+    firmware change. Device details, which hold port and PoE state, are
+    refetched on every refresh unless ``details_update_interval`` is set, in
+    which case they are refetched once it has elapsed or the same overview
+    check fails.
+
+    Requests for statistics or details that fail, by raising or by returning
+    no data on an error status, are retried once within the same refresh when
+    the API client does not retry requests itself (``max_retries`` is 0). If
+    the request still fails, the device keeps the section fetched last, until
+    ``STALE_SECTION_MAX_AGE`` seconds after it was due. A refresh in which
+    more than ``DEGRADED_REFRESH_FRACTION`` of these requests fail counts as a
+    failure for the circuit breaker.
+
+    After each refresh the new snapshot is diffed against the previous one, and
+    only listeners whose context is a changed ``device_id`` or
+    ``(device_id, section)`` pair are notified. Listeners without a context are
+    always notified.
     """
 
     def __init__(
@@ -72,6 +210,15 @@ class UnifiDeviceCoordinator(UnifiCoordinator):
         client: Client,
         site_id: str,
         filter_: str | None = None,
+        *,
+        scheduler: RequestScheduler | None = None,
+        details_update_interval: float = DEFAULT_DETAILS_UPDATE_INTERVAL,
+        suppress_unchanged_states: bool = DEFAULT_SUPPRESS_UNCHANGED_STATES,
+        state_deadband_pct: float = DEFAULT_STATE_DEADBAND_PCT,
+        keep_raw_payloads: bool = False,
+        min_update_interval: float = DEFAULT_MIN_UPDATE_INTERVAL,
+        max_update_interval: float = DEFAULT_MAX_UPDATE_INTERVAL,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
         super().__init__(
             hass=hass,
@@ -80,53 +227,296 @@ class UnifiDeviceCoordinator(UnifiCoordinator):
             filter_=filter_,
             name="devices",
             update_method=self._fetch_and_merge,
+            scheduler=scheduler,
+            keep_raw_payloads=keep_raw_payloads,
+            min_update_interval=min_update_interval,
+            max_update_interval=max_update_interval,
+            circuit_breaker=circuit_breaker,
         )
+        self.details_update_interval = details_update_interval
+        # State write suppression settings read by the device sensors
+        self.suppress_unchanged_states = suppress_unchanged_states
+        self.state_deadband_pct = state_deadband_pct
+        # device_id -> (details, monotonic fetch time, overview fingerprint)
+        self._details_cache: dict[
+            str, tuple[AdoptedDeviceDetails, float, tuple[Any, ...]]
+        ] = {}
+        # device_id -> (statistics, monotonic fetch time, overview fingerprint)
+        self._stats_cache: dict[
+            str, tuple[LatestStatisticsForADevice, float, tuple[Any, ...]]
+        ] = {}
+        # Listener contexts changed by the last refresh, None to notify everyone
+        self._changed_contexts: set[Any] | None = None
+        # Share of the per-device requests that failed in the last refresh
+        self._failed_fraction = 0.0
 
     def get_device(self, device_id: str) -> UnifiDevice | None:
         """Return the cached UnifiDevice by id, if present."""
         data = self.data or {}
         return data.get(device_id)
 
+    async def _async_update_data(self) -> dict[str, UnifiDevice]:
+        """Fetch devices and record which of them changed since the last refresh."""
+        self._changed_contexts = None
+        self._failed_fraction = 0.0
+        return await super()._async_update_data()
+
+    def _refresh_degraded(self) -> bool:
+        """Return whether most per-device requests failed in the last refresh."""
+        return self._failed_fraction > DEGRADED_REFRESH_FRACTION
+
+    def _count_changes(
+        self, previous: dict[str, UnifiDevice], current: dict[str, UnifiDevice]
+    ) -> int:
+        """Record the changed listener contexts and count changed devices.
+
+        Statistics change on every refresh, so only devices whose overview
+        changed, appeared or disappeared count towards the change rate.
+        """
+        self._changed_contexts = self._diff_devices(previous, current)
+        return sum(
+            1
+            for context in self._changed_contexts
+            if isinstance(context, tuple) and context[1] == "overview"
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners of devices that changed in the last refresh."""
+        changed = self._changed_contexts
+        self._changed_contexts = None
+        if changed is None:
+            super().async_update_listeners()
+            return
+
+        _LOGGER.debug("Devices changed in last refresh: %s", changed)
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    @staticmethod
+    def _diff_devices(
+        previous: dict[str, UnifiDevice], current: dict[str, UnifiDevice]
+    ) -> set[Any]:
+        """Return the listener contexts affected between two device snapshots."""
+        changed: set[Any] = set()
+        for device_id in previous.keys() | current.keys():
+            old = previous.get(device_id)
+            new = current.get(device_id)
+            if old is None or new is None:
+                sections = DEVICE_SECTIONS
+            else:
+                sections = tuple(
+                    section
+                    for section in DEVICE_SECTIONS
+                    if UnifiDeviceCoordinator._section_changed(
+                        getattr(old, section), getattr(new, section)
+                    )
+                )
+            if sections:
+                changed.add(device_id)
+                changed.update((device_id, section) for section in sections)
+        return changed
+
+    @staticmethod
+    def _section_changed(old: Any, new: Any) -> bool:
+        """Return whether a device section differs between two snapshots.
+
+        Models built by from_dict_lazy are compared by the payloads they wrap,
+        as comparing their fields would decode every one of them.
+        """
+        if old is new:
+            return False
+        old_source = getattr(old, "_source", None)
+        new_source = getattr(new, "_source", None)
+        if isinstance(old_source, Mapping) and isinstance(new_source, Mapping):
+            return old_source != new_source
+        return old != new
+
+    def invalidate_details(self, device_id: str) -> None:
+        """Refetch the details and statistics of a device on the next refresh."""
+        self._details_cache.pop(device_id, None)
+        self._stats_cache.pop(device_id, None)
+
+    @staticmethod
+    def _details_fingerprint(device_overview: Any) -> tuple[Any, ...]:
+        """Return the overview fields whose change means details are outdated."""
+        return (
+            getattr(device_overview, "state", None),
+            getattr(device_overview, "firmware_version", None),
+            getattr(device_overview, "firmware_updatable", None),
+        )
+
+    def _details_due(self, device_overview: Any, now: float) -> bool:
+        """Return whether the details of a device need to be refetched."""
+        cached = self._details_cache.get(str(device_overview.id))
+        if cached is None:
+            return True
+        _, fetched_at, fingerprint = cached
+        return (
+            now - fetched_at >= self.details_update_interval
+            or fingerprint != self._details_fingerprint(device_overview)
+        )
+
+    def _stats_due(self, device_overview: Any, now: float, utcnow: datetime) -> bool:
+        """Return whether the statistics of a device may have changed."""
+        cached = self._stats_cache.get(str(device_overview.id))
+        if cached is None:
+            return True
+        stats, fetched_at, fingerprint = cached
+        next_heartbeat_at = getattr(stats, "next_heartbeat_at", None)
+        if isinstance(next_heartbeat_at, datetime) and next_heartbeat_at.tzinfo is None:
+            # The API reports UTC, a timestamp without an offset is taken as such
+            next_heartbeat_at = next_heartbeat_at.replace(tzinfo=UTC)
+        return (
+            not isinstance(next_heartbeat_at, datetime)
+            or utcnow >= next_heartbeat_at
+            # Don't trust a heartbeat announced too far ahead, e.g. on clock skew
+            or now - fetched_at >= STATS_MAX_AGE
+            or fingerprint != self._details_fingerprint(device_overview)
+        )
+
+    def _merge_cached(
+        self,
+        section: str,
+        device_id: str,
+        result: Any,
+        cache: dict[str, tuple[Any, float, tuple[Any, ...]]],
+        *,
+        fetched_at: float | None,
+        fingerprint: tuple[Any, ...],
+    ) -> Any:
+        """Return a fetched or cached device section and keep it in cache.
+
+        ``fetched_at`` is None when result is the cache entry of a section that
+        was not due, otherwise result is what the request returned. When the
+        request failed, the section fetched last is kept if it is recent enough.
+        """
+        if fetched_at is None:
+            cache[device_id] = result
+            return result[0]
+        if self._request_failed(result):
+            if section == "details":
+                previous = self._details_cache.get(device_id)
+                max_age = self.details_update_interval + STALE_SECTION_MAX_AGE
+            else:
+                previous = self._stats_cache.get(device_id)
+                max_age = STATS_MAX_AGE + STALE_SECTION_MAX_AGE
+            if previous is None or fetched_at - previous[1] > max_age:
+                _LOGGER.debug(
+                    "Failed to fetch %s for device %s: %s",
+                    section,
+                    device_id,
+                    result or "error status",
+                )
+                return None
+            _LOGGER.debug(
+                "Failed to fetch %s for device %s, keeping the copy from %.0fs ago: %s",
+                section,
+                device_id,
+                fetched_at - previous[1],
+                result or "error status",
+            )
+            cache[device_id] = previous
+            return previous[0]
+        _LOGGER.debug("Fetched %s for device %s", section, device_id)
+        cache[device_id] = (result, fetched_at, fingerprint)
+        return result
+
+    @staticmethod
+    def _request_failed(result: Any) -> bool:
+        """Return whether a per-device request raised or got an error status.
+
+        The generated API functions return None instead of raising when the
+        controller answers with a status they do not parse.
+        """
+        return result is None or isinstance(result, Exception)
+
+    async def _fetch_device_sections(
+        self, requests: list[tuple[Callable[..., Coroutine[Any, Any, Any]], Any]]
+    ) -> list[Any]:
+        """Run per-device requests and retry the failed ones once.
+
+        The failed requests are only retried here when the client has no
+        retries of its own, which already back off and honour Retry-After.
+        Returns the result or exception of each ``(api_call, device_id)`` request.
+        """
+
+        def _run(api_call: Callable[..., Coroutine[Any, Any, Any]], device_id: Any):
+            return self.scheduler.run(
+                api_call, site_id=self.site_id, device_id=device_id, client=self.client
+            )
+
+        results = await asyncio.gather(
+            *(_run(*request) for request in requests), return_exceptions=True
+        )
+        failed = [
+            index
+            for index, result in enumerate(results)
+            if self._request_failed(result)
+        ]
+        if failed and not self.client.max_retries:
+            _LOGGER.debug("Retrying %d failed device requests", len(failed))
+            retried = await asyncio.gather(
+                *(_run(*requests[index]) for index in failed), return_exceptions=True
+            )
+            for index, result in zip(failed, retried, strict=True):
+                results[index] = result
+        if results:
+            failures = sum(map(self._request_failed, results))
+            self._failed_fraction = failures / len(results)
+        return results
+
     async def _fetch_and_merge(self) -> dict[str, UnifiDevice]:
         """Fetch devices and their latest statistics, merge and return dict."""
         try:
             # Fetch all devices using pagination helper
             device_overviews = await fetch_all_pages(
-                get_adopted_device_overview_page.asyncio_detailed,
+                self.scheduler.wrap(get_adopted_device_overview_page.asyncio_detailed),
+                max_concurrency=DEFAULT_PAGE_CONCURRENCY,
                 client=self.client,
                 site_id=self.site_id,
                 filter_=self.filter_,
             )
+            self._store_raw_payloads(device_overviews)
+
+            # Interleave statistics and details requests per device so both
+            # fan-outs share the scheduler instead of running as two waves.
+            # Both are only requested for devices whose cached copy is due.
+            now = time.monotonic()
+            utcnow = dt_util.utcnow()
+            requests = []
+            stats_due = []
+            details_due = []
+            for device_overview in device_overviews:
+                due = self._stats_due(device_overview, now, utcnow)
+                stats_due.append(due)
+                if due:
+                    requests.append(
+                        (
+                            get_adopted_device_latest_statistics.asyncio,
+                            device_overview.id,
+                        )
+                    )
+                due = self._details_due(device_overview, now)
+                details_due.append(due)
+                if due:
+                    requests.append(
+                        (get_adopted_device_details.asyncio, device_overview.id)
+                    )
 
-            # Prepare tasks to fetch statistics and details for each device concurrently
-            stats_tasks = [
-                get_adopted_device_latest_statistics.asyncio(
-                    site_id=self.site_id,
-                    device_id=device_overview.id,
-                    client=self.client,
-                )
-                for device_overview in device_overviews
-            ]
-
-            details_tasks = [
-                get_adopted_device_details.asyncio(
-                    site_id=self.site_id,
-                    device_id=device_overview.id,
-                    client=self.client,
-                )
-                for device_overview in device_overviews
-            ]
-
-            stats_results = await asyncio.gather(*stats_tasks, return_exceptions=True)
-            details_results = await asyncio.gather(
-                *details_tasks, return_exceptions=True
-            )
+            results = iter(await self._fetch_device_sections(requests))
 
             # Create UnifiDevice objects combining overview, statistics, and details
             unifi_devices = {}
-            for device_overview, stats_res, details_res in zip(
-                device_overviews, stats_results, details_results, strict=False
+            stats_cache = {}
+            details_cache = {}
+            for device_overview, stats_fetched, details_fetched in zip(
+                device_overviews, stats_due, details_due, strict=True
             ):
+                stats_res = next(results) if stats_fetched else None
+                details_res = next(results) if details_fetched else None
+
                 if not hasattr(device_overview, "id") or device_overview.id is None:
                     _LOGGER.warning("Device without id found, skipping")
                     continue
@@ -137,29 +527,31 @@ class UnifiDeviceCoordinator(UnifiCoordinator):
                     details=None,
                 )
                 device_id = device.id  # Always a string via the property
+                fingerprint = self._details_fingerprint(device_overview)
+
+                device.latest_statistics = self._merge_cached(
+                    "latest_statistics",
+                    device_id,
+                    stats_res if stats_fetched else self._stats_cache[device_id],
+                    stats_cache,
+                    fetched_at=now if stats_fetched else None,
+                    fingerprint=fingerprint,
+                )
+                device.details = self._merge_cached(
+                    "details",
+                    device_id,
+                    details_res if details_fetched else self._details_cache[device_id],
+                    details_cache,
+                    fetched_at=now if details_fetched else None,
+                    fingerprint=fingerprint,
+                )
 
-                if isinstance(stats_res, Exception):
-                    _LOGGER.debug(
-                        "Failed to fetch stats for device %s: %s", device_id, stats_res
-                    )
-                    device.latest_statistics = None
-                else:
-                    _LOGGER.debug("Fetched stats for device %s", device_id)
-                    device.latest_statistics = stats_res
-
-                if isinstance(details_res, Exception):
-                    _LOGGER.debug(
-                        "Failed to fetch details for device %s: %s",
-                        device_id,
-                        details_res,
-                    )
-                    device.details = None
-                else:
-                    _LOGGER.debug("Fetched details for device %s", device_id)
-                    device.details = details_res
-
+                device.build_indexes()
                 unifi_devices[device_id] = device
 
+            # Only keep cached copies for devices that are still reported
+            self._stats_cache = stats_cache
+            self._details_cache = details_cache
             return unifi_devices
 
         except Exception as err:
@@ -172,6 +564,25 @@ class UnifiClientCoordinator(UnifiCoordinator):
     This class fetches the client overview page and then retrieves the details
     for each client concurrently, storing both in UnifiClient objects
     in a dict mapping client_id to UnifiClient.
+
+    Every client seen is kept in ``known_clients``, ordered from least to most
+    recently seen. Connected clients keep their full UnifiClient; once a client
+    disconnects it is replaced by a compact UnifiClientRecord. Offline clients
+    unseen for ``known_clients_ttl_days``, or beyond ``known_clients_max_size``
+    entries, are evicted from the least recently seen end during refresh.
+
+    When a ``store`` is given, known clients are restored from it on the first
+    refresh and saved back, debounced, whenever clients appear, disconnect or are
+    evicted. Offline records are serialized once and reused for every save.
+
+    With ``incremental_polling``, refreshes between full sweeps only request
+    clients whose ``connectedAt`` is at or after the newest one already seen,
+    plus a single-item page whose total count reveals disconnects. A full sweep
+    runs when that count does not match, and at least every
+    ``reconciliation_interval`` seconds to pick up changes to clients that
+    stayed connected. When the count keeps mismatching, e.g. because new
+    clients report no ``connectedAt``, incremental polling pauses for one
+    ``reconciliation_interval``.
     """
 
     def __init__(
@@ -180,6 +591,17 @@ class UnifiClientCoordinator(UnifiCoordinator):
         client: Client,
         site_id: str,
         filter_: str | None = None,
+        *,
+        scheduler: RequestScheduler | None = None,
+        known_clients_ttl_days: float = DEFAULT_KNOWN_CLIENTS_TTL_DAYS,
+        known_clients_max_size: int = DEFAULT_KNOWN_CLIENTS_MAX_SIZE,
+        store: Store | None = None,
+        keep_raw_payloads: bool = False,
+        incremental_polling: bool = DEFAULT_INCREMENTAL_CLIENT_POLLING,
+        reconciliation_interval: float = DEFAULT_CLIENT_RECONCILIATION_INTERVAL,
+        min_update_interval: float = DEFAULT_MIN_UPDATE_INTERVAL,
+        max_update_interval: float = DEFAULT_MAX_UPDATE_INTERVAL,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
         super().__init__(
             hass=hass,
@@ -188,24 +610,95 @@ class UnifiClientCoordinator(UnifiCoordinator):
             filter_=filter_,
             name="clients",
             update_method=self._fetch_and_merge,
+            scheduler=scheduler,
+            keep_raw_payloads=keep_raw_payloads,
+            min_update_interval=min_update_interval,
+            max_update_interval=max_update_interval,
+            circuit_breaker=circuit_breaker,
         )
-        # Keep track of all clients ever seen
-        self.known_clients: dict[str, UnifiClient] = {}
-
-    def get_client(self, client_id: str) -> UnifiClient | None:
+        # Keep track of all clients seen, least recently seen first
+        self.known_clients: dict[str, KnownClient] = {}
+        self.known_clients_ttl_days = known_clients_ttl_days
+        self.known_clients_max_size = known_clients_max_size
+        self._store = store
+        self._known_clients_loaded = False
+        # Stored representation of offline records, reused across saves
+        self._stored_clients: dict[str, dict[str, Any]] = {}
+        self._save_pending = False
+        self._last_save_scheduled = time.monotonic()
+        self.incremental_polling = incremental_polling
+        self.reconciliation_interval = reconciliation_interval
+        # Newest connectedAt seen and when the last full sweep completed
+        self._connected_watermark: datetime | None = None
+        self._last_full_sweep: float | None = None
+        # Incremental refreshes in a row whose count mismatched, and when
+        # incremental polling resumes after pausing on repeated mismatches
+        self._mismatches = 0
+        self._incremental_resume_at: float | None = None
+
+    def get_client(self, client_id: str) -> KnownClient | None:
         """Return the cached UnifiClient by id, even if offline."""
         return self.known_clients.get(client_id)
 
+    async def _async_load_known_clients(self) -> None:
+        """Restore the known clients saved before the last restart."""
+        self._known_clients_loaded = True
+        if self._store is None:
+            return
+
+        try:
+            data = await self._store.async_load()
+        except Exception:
+            _LOGGER.warning("Could not load stored known clients", exc_info=True)
+            return
+        if not data:
+            return
+
+        for client_id, stored in data.get("clients", {}).items():
+            if client_id not in self.known_clients:
+                self.known_clients[client_id] = UnifiClientRecord.from_dict(
+                    client_id, stored
+                )
+                self._stored_clients[client_id] = stored
+        _LOGGER.debug("Restored %d known clients", len(self._stored_clients))
+
+    def _known_clients_to_store(self) -> dict[str, Any]:
+        """Return the data written to the store, least recently seen first."""
+        self._save_pending = False
+        clients = {}
+        for client_id, known_client in self.known_clients.items():
+            stored = self._stored_clients.get(client_id)
+            if stored is None:
+                # Connected clients are serialized at save time for a fresh last_seen
+                stored = UnifiClientRecord.from_client(known_client).as_dict()
+            clients[client_id] = stored
+        return {"clients": clients}
+
+    def _schedule_save_known_clients(self, dirty: bool) -> None:
+        """Schedule a debounced save when known clients changed or got stale."""
+        if self._store is None or self._save_pending:
+            return
+        now = time.monotonic()
+        if not dirty and now - self._last_save_scheduled < KNOWN_CLIENTS_MAX_SAVE_AGE:
+            return
+        self._save_pending = True
+        self._last_save_scheduled = now
+        self._store.async_delay_save(
+            self._known_clients_to_store, KNOWN_CLIENTS_SAVE_DELAY
+        )
+
+    async def async_save_known_clients(self) -> None:
+        """Write known clients to the store immediately."""
+        if self._store is not None and self._known_clients_loaded:
+            await self._store.async_save(self._known_clients_to_store())
+
     async def _fetch_and_merge(self) -> dict[str, UnifiClient]:
         """Fetch clients and their details, merge and return dict."""
+        if not self._known_clients_loaded:
+            await self._async_load_known_clients()
+
         try:
-            # Fetch all clients using pagination helper
-            client_overviews = await fetch_all_pages(
-                get_connected_client_overview_page.asyncio_detailed,
-                client=self.client,
-                site_id=self.site_id,
-                filter_=self.filter_,
-            )
+            client_overviews = await self._fetch_client_overviews()
 
             # Prepare tasks to fetch details for each client concurrently
             # tasks = [
@@ -222,6 +715,7 @@ class UnifiClientCoordinator(UnifiCoordinator):
             # Create UnifiClient objects combining overview and details
             unifi_clients: dict[str, UnifiClient] = {}
             now = dt_util.now()
+            dirty = False
 
             # for client_overview, res in zip(client_overviews, results, strict=False):
             for client_overview in client_overviews:
@@ -245,13 +739,160 @@ class UnifiClientCoordinator(UnifiCoordinator):
 
                 unifi_clients[client_id] = client
 
-                # Merge into known_clients
-                if client_id in self.known_clients:
-                    self.known_clients[client_id].update(client)
+                # Merge into known_clients, moving the client to the recent end
+                known_client = self.known_clients.pop(client_id, None)
+                if isinstance(known_client, UnifiClient):
+                    known_client.update(client)
+                    self.known_clients[client_id] = known_client
                 else:
+                    # New or reconnected client
                     self.known_clients[client_id] = client
-
+                    self._stored_clients.pop(client_id, None)
+                    dirty = True
+
+            # Clients that disconnected since the last refresh keep a compact record
+            for client_id in (self.data or {}).keys() - unifi_clients.keys():
+                known_client = self.known_clients.get(client_id)
+                if isinstance(known_client, UnifiClient):
+                    record = UnifiClientRecord.from_client(known_client)
+                    self.known_clients[client_id] = record
+                    self._stored_clients[client_id] = record.as_dict()
+                    dirty = True
+
+            if self._evict_known_clients(now, unifi_clients):
+                dirty = True
+            self._schedule_save_known_clients(dirty)
             return unifi_clients
 
         except Exception as err:
             raise UpdateFailed("Error fetching clients or details") from err
+
+    async def _fetch_client_overviews(self) -> list[Any]:
+        """Return the overviews of every connected client.
+
+        Only new connections are requested when incremental polling applies,
+        and the overviews of clients still connected are carried over from the
+        previous refresh.
+        """
+        fetch = self.scheduler.wrap(get_connected_client_overview_page.asyncio_detailed)
+        if self._incremental_refresh_due():
+            watermark = self._connected_watermark
+            new_overviews = await fetch_all_pages(
+                fetch,
+                max_concurrency=DEFAULT_PAGE_CONCURRENCY,
+                client=self.client,
+                site_id=self.site_id,
+                filter_=all_of(
+                    self.filter_ or None,
+                    condition(CLIENT_FILTER_PROPERTIES, "connectedAt", "ge", watermark),
+                ),
+            )
+            total_count = await fetch_total_count(
+                fetch, client=self.client, site_id=self.site_id, filter_=self.filter_
+            )
+            new_ids = {str(overview.id) for overview in new_overviews}
+            connected_ids = new_ids | self.data.keys()
+            if total_count == len(connected_ids):
+                self._mismatches = 0
+                self._store_raw_payloads(new_overviews, merge=True)
+                self._advance_watermark(new_overviews)
+                return new_overviews + [
+                    client.overview
+                    for client_id, client in self.data.items()
+                    if client_id not in new_ids
+                ]
+            _LOGGER.debug(
+                "%d clients connected, %d expected, reconciling",
+                total_count,
+                len(connected_ids),
+            )
+            self._mismatches += 1
+            if self._mismatches >= INCREMENTAL_MAX_MISMATCHES:
+                _LOGGER.debug(
+                    "Incremental polling missed clients %d times in a row, "
+                    "fetching every client for %.0f seconds",
+                    self._mismatches,
+                    self.reconciliation_interval,
+                )
+                self._mismatches = 0
+                self._incremental_resume_at = (
+                    time.monotonic() + self.reconciliation_interval
+                )
+
+        client_overviews = await fetch_all_pages(
+            fetch,
+            max_concurrency=DEFAULT_PAGE_CONCURRENCY,
+            client=self.client,
+            site_id=self.site_id,
+            filter_=self.filter_,
+        )
+        self._store_raw_payloads(client_overviews)
+        self._connected_watermark = None
+        self._advance_watermark(client_overviews)
+        self._last_full_sweep = time.monotonic()
+        return client_overviews
+
+    def _incremental_refresh_due(self) -> bool:
+        """Return whether this refresh may fetch only new connections."""
+        return (
+            self.incremental_polling
+            and self.data is not None
+            and self.last_update_success
+            and self._connected_watermark is not None
+            and self._last_full_sweep is not None
+            and time.monotonic() - self._last_full_sweep < self.reconciliation_interval
+            and (
+                self._incremental_resume_at is None
+                or time.monotonic() >= self._incremental_resume_at
+            )
+        )
+
+    def _advance_watermark(self, overviews: Iterable[Any]) -> None:
+        """Move the watermark to the newest connectedAt in overviews."""
+        for overview in overviews:
+            try:
+                connected_at = getattr(overview, "connected_at", None)
+            except (KeyError, TypeError, ValueError):
+                # Lazy models decode on read, a malformed timestamp is skipped
+                continue
+            if isinstance(connected_at, datetime) and (
+                self._connected_watermark is None
+                or connected_at > self._connected_watermark
+            ):
+                self._connected_watermark = connected_at
+
+    def _evict_known_clients(
+        self, now: datetime, connected_clients: dict[str, UnifiClient]
+    ) -> int:
+        """Evict expired or excess offline clients, least recently seen first.
+
+        Connected clients are moved to the end of known_clients on every refresh,
+        so only its front needs to be checked. At most
+        KNOWN_CLIENTS_EVICTION_BATCH clients are evicted per refresh; any backlog
+        is worked off over the following refreshes. Returns the number evicted.
+        """
+        ttl = (
+            timedelta(days=self.known_clients_ttl_days)
+            if self.known_clients_ttl_days
+            else None
+        )
+        evicted = 0
+        while self.known_clients and evicted < KNOWN_CLIENTS_EVICTION_BATCH:
+            client_id = next(iter(self.known_clients))
+            if client_id in connected_clients:
+                break
+            last_seen = self.known_clients[client_id].last_seen
+            expired = ttl is not None and (last_seen is None or now - last_seen > ttl)
+            oversized = (
+                self.known_clients_max_size > 0
+                and len(self.known_clients) > self.known_clients_max_size
+            )
+            if not expired and not oversized:
+                break
+            del self.known_clients[client_id]
+            self._stored_clients.pop(client_id, None)
+            evicted += 1
+
+        if evicted:
+            _LOGGER.debug("Evicted %d known clients", evicted)
+        return evicted
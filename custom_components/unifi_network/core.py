@@ -2,11 +2,75 @@
 
 from __future__ import annotations
 
+import importlib.util
+import logging
+
+import httpx
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.httpx_client import create_async_httpx_client
+from homeassistant.helpers.storage import Store
+from homeassistant.util.ssl import client_context, create_no_verify_ssl_context
 
 from .api_client import Client
+from .const import (
+    DEFAULT_CLIENT_RECONCILIATION_INTERVAL,
+    DEFAULT_DETAILS_UPDATE_INTERVAL,
+    DEFAULT_HTTP2,
+    DEFAULT_INCREMENTAL_CLIENT_POLLING,
+    DEFAULT_KEEP_RAW_PAYLOADS,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_KNOWN_CLIENTS_MAX_SIZE,
+    DEFAULT_KNOWN_CLIENTS_TTL_DAYS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_REQUESTS_PER_SECOND,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_STATE_DEADBAND_PCT,
+    DEFAULT_SUPPRESS_UNCHANGED_STATES,
+    DOMAIN,
+    KNOWN_CLIENTS_STORAGE_VERSION,
+    REQUEST_MAX_RETRIES,
+    REQUEST_RETRY_BACKOFF,
+    REQUEST_RETRY_MAX_DELAY,
+)
 from .coordinator import UnifiClientCoordinator, UnifiDeviceCoordinator
+from .scheduler import CircuitBreaker, RequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def known_clients_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the known clients of a config entry."""
+    return Store(
+        hass, KNOWN_CLIENTS_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.known_clients"
+    )
+
+
+def create_transport(
+    verify_ssl: bool,
+    *,
+    http2: bool = DEFAULT_HTTP2,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+) -> httpx.AsyncHTTPTransport:
+    """Return the pooled transport used for every request to the controller.
+
+    Home Assistant's helper always applies its own pool limits, so a tuned
+    pool can only be handed to it as the client's transport.
+    """
+    if http2 and importlib.util.find_spec("h2") is None:
+        _LOGGER.warning("HTTP/2 requires the h2 package, using HTTP/1.1 instead")
+        http2 = False
+    return httpx.AsyncHTTPTransport(
+        verify=client_context() if verify_ssl else create_no_verify_ssl_context(),
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
 
 
 class UnifiNetworkCore:
@@ -23,38 +87,112 @@ class UnifiNetworkCore:
         verify_ssl: bool = True,
         devices_filter: str | None = None,
         clients_filter: str | None = None,
+        *,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_requests_per_second: float = DEFAULT_MAX_REQUESTS_PER_SECOND,
+        http2: bool = DEFAULT_HTTP2,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        details_update_interval: float = DEFAULT_DETAILS_UPDATE_INTERVAL,
+        suppress_unchanged_states: bool = DEFAULT_SUPPRESS_UNCHANGED_STATES,
+        state_deadband_pct: float = DEFAULT_STATE_DEADBAND_PCT,
+        known_clients_ttl_days: float = DEFAULT_KNOWN_CLIENTS_TTL_DAYS,
+        known_clients_max_size: int = DEFAULT_KNOWN_CLIENTS_MAX_SIZE,
+        keep_raw_payloads: bool = DEFAULT_KEEP_RAW_PAYLOADS,
+        incremental_client_polling: bool = DEFAULT_INCREMENTAL_CLIENT_POLLING,
+        client_reconciliation_interval: float = DEFAULT_CLIENT_RECONCILIATION_INTERVAL,
+        min_update_interval: float = DEFAULT_MIN_UPDATE_INTERVAL,
+        max_update_interval: float = DEFAULT_MAX_UPDATE_INTERVAL,
+        entry_id: str | None = None,
     ) -> None:
         """Initialize Unifi Network core."""
         self.hass = hass
         self.site_id = site_id
 
-        # Create httpx client using Home Assistant helper to avoid SSL blocking
+        # Create httpx client using Home Assistant helper to avoid SSL blocking.
+        # Its connections are pooled and kept alive between refreshes, so the
+        # request fan-out reuses them instead of handshaking new ones.
         async_httpx_client = create_async_httpx_client(
             hass,
             verify_ssl=verify_ssl,
             base_url=base_url,
+            transport=create_transport(
+                verify_ssl,
+                http2=http2,
+                max_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
         )
 
         # Add API headers to the client
         if api_key:
             async_httpx_client.headers.update({"X-API-Key": api_key})
 
-        # Initialize API client and set httpx client
-        self.client = Client(base_url=base_url)
+        # Initialize API client and set httpx client. Only parsed responses are
+        # used, so the raw response bodies are not kept around, and models only
+        # decode the fields the integration actually reads. Identical reads
+        # issued at the same time by coordinators, entities and services share
+        # one request, and unchanged responses are revalidated rather than
+        # downloaded again when the controller sends validators. Reads that
+        # fail on a connection error or an overloaded controller are retried
+        # with backoff before the refresh fails. Each retry, and the wait before
+        # it, holds the request's scheduler slot.
+        self.client = Client(
+            base_url=base_url,
+            retain_response_content=False,
+            lazy_models=True,
+            coalesce_requests=True,
+            conditional_requests=True,
+            max_retries=REQUEST_MAX_RETRIES,
+            retry_backoff=REQUEST_RETRY_BACKOFF,
+            retry_max_delay=REQUEST_RETRY_MAX_DELAY,
+        )
         self.client.set_async_httpx_client(async_httpx_client)
 
+        # All coordinators of this config entry share one request budget
+        self.scheduler = RequestScheduler(
+            max_concurrent_requests=max_concurrent_requests,
+            max_requests_per_second=max_requests_per_second,
+        )
+        # and pause polling together while the controller keeps failing
+        self.circuit_breaker = CircuitBreaker()
+
         # Initialize coordinators based on enabled features
         self.device_coordinator = None
         self.client_coordinator = None
 
         if enable_devices:
             self.device_coordinator = UnifiDeviceCoordinator(
-                hass=hass, client=self.client, site_id=site_id, filter_=devices_filter
+                hass=hass,
+                client=self.client,
+                site_id=site_id,
+                filter_=devices_filter,
+                scheduler=self.scheduler,
+                details_update_interval=details_update_interval,
+                suppress_unchanged_states=suppress_unchanged_states,
+                state_deadband_pct=state_deadband_pct,
+                keep_raw_payloads=keep_raw_payloads,
+                min_update_interval=min_update_interval,
+                max_update_interval=max_update_interval,
+                circuit_breaker=self.circuit_breaker,
             )
 
         if enable_clients:
             self.client_coordinator = UnifiClientCoordinator(
-                hass=hass, client=self.client, site_id=site_id, filter_=clients_filter
+                hass=hass,
+                client=self.client,
+                site_id=site_id,
+                filter_=clients_filter,
+                scheduler=self.scheduler,
+                known_clients_ttl_days=known_clients_ttl_days,
+                known_clients_max_size=known_clients_max_size,
+                store=known_clients_store(hass, entry_id) if entry_id else None,
+                keep_raw_payloads=keep_raw_payloads,
+                incremental_polling=incremental_client_polling,
+                reconciliation_interval=client_reconciliation_interval,
+                min_update_interval=min_update_interval,
+                max_update_interval=max_update_interval,
+                circuit_breaker=self.circuit_breaker,
             )
 
     async def async_init(self) -> None:
@@ -63,3 +201,8 @@ class UnifiNetworkCore:
             await self.device_coordinator.async_config_entry_first_refresh()
         if self.client_coordinator:
             await self.client_coordinator.async_config_entry_first_refresh()
+
+    async def async_unload(self) -> None:
+        """Flush state that must survive a reload or restart."""
+        if self.client_coordinator:
+            await self.client_coordinator.async_save_known_clients()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
@@ -9,7 +10,6 @@ from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api_client.types import UNSET
 from .const import DOMAIN
 from .coordinator import UnifiClientCoordinator, UnifiDeviceCoordinator
 
@@ -25,14 +25,17 @@ async def async_setup_entry(
     # Keep track of client IDs that already got entities
     tracked_clients: set[str] = set()
 
-    def _discover_new_clients() -> None:
-        """Check coordinator data and add entities for new clients."""
-        if not coordinator.data:
-            return
+    def _discover_new_clients(client_ids: Iterable[str] | None = None) -> None:
+        """Add entities for clients that don't have one yet.
+
+        Defaults to the clients connected in the last refresh.
+        """
+        if client_ids is None:
+            client_ids = coordinator.data or {}
 
         new_entities = []
 
-        for client_id in coordinator.data:
+        for client_id in client_ids:
             if client_id in tracked_clients:
                 continue
 
@@ -44,8 +47,9 @@ async def async_setup_entry(
         if new_entities:
             async_add_entities(new_entities)
 
-    # Add initial clients
-    _discover_new_clients()
+    # Add every known client, so offline clients restored from storage keep
+    # their tracker across restarts
+    _discover_new_clients(coordinator.known_clients)
 
     # Add new clients whenever coordinator updates
     coordinator.async_add_listener(_discover_new_clients)
@@ -78,7 +82,7 @@ class UnifiClientTracker(CoordinatorEntity, TrackerEntity):
     @property
     def state(self) -> str:
         # coordinator.data is a dict of client wrappers; presence implies connected
-        client = self.coordinator.data.get(self.client_id)
+        client = (self.coordinator.data or {}).get(self.client_id)
         return "home" if client else "not_home"
 
     @property
@@ -113,8 +117,7 @@ class UnifiClientTracker(CoordinatorEntity, TrackerEntity):
                 attrs["uplink_mac"] = uplink_device.mac
                 attrs["uplink_device_name"] = uplink_device.name
 
-        connected_at = getattr(client.overview, "connected_at", None)
-        if connected_at is not None and connected_at is not UNSET:
-            attrs["connected_at"] = connected_at
+        if client.connected_at is not None:
+            attrs["connected_at"] = client.connected_at
 
         return attrs
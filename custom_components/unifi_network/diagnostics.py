@@ -0,0 +1,58 @@
+"""Diagnostics support for the UniFi Network integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import UnifiCoordinator
+
+# Credentials, and the keys identifying people's devices on the network
+TO_REDACT = {
+    "api_key",
+    "base_url",
+    "macAddress",
+    "ipAddress",
+    # Filter options can name specific clients, devices or addresses
+    "devices_filter",
+    "clients_filter",
+    "devices_models",
+    "clients_types",
+}
+
+
+def _coordinator_diagnostics(
+    coordinator: UnifiCoordinator | None,
+) -> dict[str, Any] | None:
+    """Return the polling state of a coordinator and the payloads it kept."""
+    if coordinator is None:
+        return None
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "update_interval": coordinator.update_interval.total_seconds(),
+        "circuit_breaker_open": coordinator.circuit_breaker.is_open,
+        "items": len(coordinator.data or {}),
+        # Only kept when the keep_raw_payloads option is enabled
+        "raw_payloads": coordinator.raw_payloads
+        if coordinator.keep_raw_payloads
+        else None,
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    core = hass.data[DOMAIN][entry.entry_id]
+    return async_redact_data(
+        {
+            "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+            "devices": _coordinator_diagnostics(core.device_coordinator),
+            "clients": _coordinator_diagnostics(core.client_coordinator),
+        },
+        TO_REDACT,
+    )
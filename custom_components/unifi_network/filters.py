@@ -0,0 +1,247 @@
+"""Build and validate server-side filter expressions for the UniFi API.
+
+The integration API filters list endpoints with expressions such as
+``and(type.in('WIRED', 'WIRELESS'), not(ipAddress.eq('192.168.1.5')))``.
+Only the properties and functions documented for each endpoint are accepted,
+so expressions are checked here before they are sent to the controller.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+
+class FilterError(ValueError):
+    """Raised when a filter expression is not valid for an endpoint."""
+
+
+@dataclass(frozen=True, slots=True)
+class FilterProperty:
+    """A filterable property and the functions it supports."""
+
+    type: str
+    functions: frozenset[str]
+
+
+def _property(type_: str, functions: str) -> FilterProperty:
+    return FilterProperty(type_, frozenset(functions.split()))
+
+
+_EQUALITY = "eq ne in notIn"
+_NULLABLE = "isNull isNotNull"
+_ORDERED = "gt ge lt le"
+_SET = "isEmpty contains containsAny containsAll containsExactly"
+
+# Filterable properties of get_adopted_device_overview_page
+DEVICE_FILTER_PROPERTIES: dict[str, FilterProperty] = {
+    "id": _property("UUID", _EQUALITY),
+    "macAddress": _property("STRING", _EQUALITY),
+    "ipAddress": _property("STRING", _EQUALITY),
+    "name": _property("STRING", f"{_EQUALITY} like"),
+    "model": _property("STRING", _EQUALITY),
+    "state": _property("STRING", _EQUALITY),
+    "supported": _property("BOOLEAN", "eq ne"),
+    "firmwareVersion": _property("STRING", f"{_NULLABLE} {_EQUALITY} {_ORDERED} like"),
+    "firmwareUpdatable": _property("BOOLEAN", "eq ne"),
+    "features": _property("SET(STRING)", _SET),
+    "interfaces": _property("SET(STRING)", _SET),
+}
+
+# Filterable properties of get_connected_client_overview_page
+CLIENT_FILTER_PROPERTIES: dict[str, FilterProperty] = {
+    "id": _property("UUID", _EQUALITY),
+    "type": _property("STRING", _EQUALITY),
+    "macAddress": _property("STRING", f"{_NULLABLE} {_EQUALITY}"),
+    "ipAddress": _property("STRING", f"{_NULLABLE} {_EQUALITY}"),
+    "connectedAt": _property("TIMESTAMP", f"{_NULLABLE} eq ne {_ORDERED}"),
+    "access.type": _property("STRING", _EQUALITY),
+    "access.authorized": _property("BOOLEAN", f"{_NULLABLE} eq ne"),
+}
+
+CLIENT_TYPES = ("WIRED", "WIRELESS", "VPN", "TELEPORT")
+
+_NO_ARGUMENTS = frozenset({"isNull", "isNotNull", "isEmpty"})
+_MANY_ARGUMENTS = frozenset(
+    {"in", "notIn", "containsAny", "containsAll", "containsExactly"}
+)
+_LOGICAL = {"and": 2, "or": 2, "not": 1}  # least number of expressions
+_PUNCTUATION = frozenset("(),")
+
+_TOKEN = re.compile(r"\s*(?:('(?:[^'\\]|\\.)*')|([(),])|([^\s(),']+))")
+
+
+def _format_value(prop: str, filter_property: FilterProperty, value: Any) -> str:
+    """Return value written the way the API expects for the property type."""
+    if filter_property.type == "BOOLEAN":
+        if not isinstance(value, bool):
+            raise FilterError(f"{prop} expects a boolean, got {value!r}")
+        return "true" if value else "false"
+    if filter_property.type == "TIMESTAMP":
+        if isinstance(value, datetime):
+            value = value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return str(value)
+    if filter_property.type == "UUID":
+        return str(value)
+
+    text = str(value)
+    # The controller stores MAC addresses in lower case and matches exactly
+    if prop == "macAddress":
+        text = text.lower()
+    return "'" + text.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def condition(
+    properties: Mapping[str, FilterProperty], prop: str, function: str, *values: Any
+) -> str:
+    """Return a single property condition such as ``type.eq('WIRED')``."""
+    filter_property = properties.get(prop)
+    if filter_property is None:
+        raise FilterError(f"{prop} is not a filterable property")
+    if function not in filter_property.functions:
+        raise FilterError(f"{prop} does not support {function}")
+    _check_arity(f"{prop}.{function}", function, len(values))
+
+    arguments = ", ".join(
+        _format_value(prop, filter_property, value) for value in values
+    )
+    return f"{prop}.{function}({arguments})"
+
+
+def all_of(*expressions: str | None) -> str | None:
+    """Return an expression matching when every given expression matches."""
+    return _combine("and", expressions)
+
+
+def any_of(*expressions: str | None) -> str | None:
+    """Return an expression matching when any given expression matches."""
+    return _combine("or", expressions)
+
+
+def negate(expression: str) -> str:
+    """Return an expression matching when expression does not match."""
+    return f"not({expression})"
+
+
+def _combine(operator: str, expressions: Iterable[str | None]) -> str | None:
+    """Join the non-empty expressions with a logical operator."""
+    present = [expression for expression in expressions if expression]
+    if not present:
+        return None
+    if len(present) == 1:
+        return present[0]
+    return f"{operator}({', '.join(present)})"
+
+
+def _check_arity(name: str, function: str, count: int) -> None:
+    """Raise FilterError if function is called with the wrong number of values."""
+    if function in _NO_ARGUMENTS:
+        valid, expected = count == 0, "no values"
+    elif function in _MANY_ARGUMENTS:
+        valid, expected = count >= 1, "at least one value"
+    else:
+        valid, expected = count == 1, "exactly one value"
+    if not valid:
+        raise FilterError(f"{name} takes {expected}, got {count}")
+
+
+def validate_filter(expression: str, properties: Mapping[str, FilterProperty]) -> None:
+    """Raise FilterError if expression is not a valid filter for properties."""
+    tokens: list[str] = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None or match.end() == position:
+            raise FilterError(f"Unexpected character at position {position}")
+        tokens.append(next(group for group in match.groups() if group is not None))
+        position = match.end()
+
+    end = _parse_expression(tokens, 0, properties)
+    if end != len(tokens):
+        raise FilterError(f"Unexpected {tokens[end]!r} after the expression")
+
+
+def _parse_expression(
+    tokens: list[str], index: int, properties: Mapping[str, FilterProperty]
+) -> int:
+    """Check the expression starting at index and return the index after it."""
+    if index >= len(tokens) or tokens[index] in _PUNCTUATION:
+        raise FilterError("Expected a condition")
+    name = tokens[index]
+    if index + 1 >= len(tokens) or tokens[index + 1] != "(":
+        raise FilterError(f"Expected '(' after {name!r}")
+
+    if name in _LOGICAL:
+        index, count = _parse_arguments(
+            tokens,
+            index + 2,
+            lambda index: _parse_expression(tokens, index, properties),
+        )
+        if name == "not" and count != 1:
+            raise FilterError("not takes exactly one expression")
+        if count < _LOGICAL[name]:
+            raise FilterError(f"{name} takes at least two expressions")
+        return index
+
+    prop, _, function = name.rpartition(".")
+    filter_property = properties.get(prop)
+    if filter_property is None:
+        raise FilterError(f"{prop or name} is not a filterable property")
+    if function not in filter_property.functions:
+        raise FilterError(f"{prop} does not support {function}")
+
+    def _parse_value(index: int) -> int:
+        if index >= len(tokens) or tokens[index] in _PUNCTUATION:
+            raise FilterError(f"Expected a value for {name}")
+        return index + 1
+
+    index, count = _parse_arguments(tokens, index + 2, _parse_value, allow_empty=True)
+    _check_arity(name, function, count)
+    return index
+
+
+def _parse_arguments(
+    tokens: list[str],
+    index: int,
+    parse_argument: Callable[[int], int],
+    *,
+    allow_empty: bool = False,
+) -> tuple[int, int]:
+    """Check a comma separated argument list up to the closing parenthesis.
+
+    Returns the index after the parenthesis and the number of arguments.
+    """
+    if allow_empty and index < len(tokens) and tokens[index] == ")":
+        return index + 1, 0
+
+    count = 0
+    while True:
+        index = parse_argument(index)
+        count += 1
+        if index >= len(tokens) or tokens[index] not in ",)":
+            raise FilterError("Expected ',' or ')'")
+        index += 1
+        if tokens[index - 1] == ")":
+            return index, count
+
+
+def devices_filter_from_options(options: Mapping[str, Any]) -> str | None:
+    """Return the devices filter composed from the config entry options."""
+    models = options.get("devices_models") or []
+    return all_of(
+        condition(DEVICE_FILTER_PROPERTIES, "model", "in", *models) if models else None,
+        options.get("devices_filter"),
+    )
+
+
+def clients_filter_from_options(options: Mapping[str, Any]) -> str | None:
+    """Return the clients filter composed from the config entry options."""
+    types = options.get("clients_types") or []
+    return all_of(
+        condition(CLIENT_FILTER_PROPERTIES, "type", "in", *types) if types else None,
+        options.get("clients_filter"),
+    )
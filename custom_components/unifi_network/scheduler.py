@@ -0,0 +1,245 @@
+"""Request scheduling shared by the UniFi Network coordinators."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from .const import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_MAX_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+)
+
+T = TypeVar("T")
+
+
+class RequestScheduler:
+    """Bound the number and rate of requests sent to the UniFi controller.
+
+    A semaphore caps how many requests are in flight at once. When
+    ``max_requests_per_second`` is set, a token bucket additionally spaces out
+    request starts so bursts never exceed that rate.
+
+    An API call keeps its slot while the client retries it, including the
+    backoff between attempts, so retries count against the concurrency limit
+    and an overloaded controller sees fewer requests, not more.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_requests_per_second: float = 0,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.max_concurrent_requests = max(1, int(max_concurrent_requests))
+        self.max_requests_per_second = max(0.0, float(max_requests_per_second))
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        self._rate_lock = asyncio.Lock()
+        self._tokens = max(1.0, self.max_requests_per_second)
+        self._last_refill: float | None = None
+
+    async def run(
+        self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run an API call once a request slot is available."""
+        async with self._semaphore:
+            await self._acquire_token()
+            return await func(*args, **kwargs)
+
+    def wrap(self, func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        """Return a version of an API call that is routed through the scheduler."""
+
+        @functools.wraps(func)
+        async def _scheduled(*args: Any, **kwargs: Any) -> T:
+            return await self.run(func, *args, **kwargs)
+
+        return _scheduled
+
+    async def _acquire_token(self) -> None:
+        """Wait until the token bucket allows another request to start."""
+        rate = self.max_requests_per_second
+        if not rate:
+            return
+
+        async with self._rate_lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._last_refill is not None:
+                self._tokens = min(
+                    max(1.0, rate), self._tokens + (now - self._last_refill) * rate
+                )
+            self._last_refill = now
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / rate)
+                self._tokens = 1.0
+                self._last_refill = loop.time()
+
+            self._tokens -= 1
+
+
+class AdaptiveInterval:
+    """Pick the next poll interval from change rate, latency and errors.
+
+    The interval halves while a refresh changes at least ``CHURN_FRACTION`` of
+    the items, grows by a quarter while nothing changes, and backs off when a
+    refresh fails or the smoothed latency rises to twice the best seen. After
+    failures, refreshes that would hold the interval halve it instead until it
+    is back to where the backoff started. It always stays within
+    ``[min_interval, max_interval]``.
+    """
+
+    CHURN_FRACTION = 0.05
+    QUIET_FACTOR = 1.25
+    SLOW_FACTOR = 1.5
+    ERROR_FACTOR = 2.0
+    RECOVERY_FACTOR = 0.5
+    LATENCY_SMOOTHING = 0.3
+    SLOW_LATENCY_RATIO = 2.0
+    MIN_SLOW_LATENCY = 1.0  # seconds, faster refreshes never count as slow
+
+    def __init__(
+        self, initial: float, min_interval: float, max_interval: float
+    ) -> None:
+        """Initialize the interval."""
+        self.min_interval = max(1.0, float(min_interval))
+        self.max_interval = max(self.min_interval, float(max_interval))
+        self.interval = self._clamp(initial)
+        self.latency: float | None = None
+        self._best_latency: float | None = None
+        # Interval before the failures that backed it off, until it recovers
+        self._baseline: float | None = None
+
+    @property
+    def adaptive(self) -> bool:
+        """Return whether the bounds leave the interval any room to move."""
+        return self.min_interval < self.max_interval
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def record(
+        self,
+        latency: float,
+        *,
+        failed: bool = False,
+        changed_fraction: float | None = None,
+    ) -> float:
+        """Record a refresh and return the interval until the next one.
+
+        ``changed_fraction`` is the share of items that appeared, disappeared
+        or changed, or None when there was no previous snapshot to compare.
+        """
+        if not failed:
+            self.latency = (
+                latency
+                if self.latency is None
+                else self.latency + self.LATENCY_SMOOTHING * (latency - self.latency)
+            )
+            if self._best_latency is None or self.latency < self._best_latency:
+                self._best_latency = self.latency
+
+        if failed:
+            if self._baseline is None:
+                self._baseline = self.interval
+            factor = self.ERROR_FACTOR
+        elif self._slow():
+            factor = self.SLOW_FACTOR
+        elif changed_fraction is None:
+            factor = 1.0
+        elif changed_fraction >= self.CHURN_FRACTION:
+            factor = 0.5
+        elif changed_fraction == 0:
+            factor = self.QUIET_FACTOR
+        else:
+            factor = 1.0
+
+        interval = self.interval * factor
+        if not failed and self._baseline is not None:
+            if factor == 1.0:
+                # Small changes never shrink the interval, undo the backoff
+                interval = max(self._baseline, interval * self.RECOVERY_FACTOR)
+            if interval <= self._baseline or factor == self.QUIET_FACTOR:
+                self._baseline = None
+        self.interval = self._clamp(interval)
+        return self.interval
+
+    def _slow(self) -> bool:
+        """Return whether the smoothed latency rose well above the best seen."""
+        return (
+            self.latency is not None
+            and self._best_latency is not None
+            and self.latency >= self.MIN_SLOW_LATENCY
+            and self.latency >= self.SLOW_LATENCY_RATIO * self._best_latency
+        )
+
+
+class CircuitBreaker:
+    """Pause polling of a controller that keeps failing.
+
+    After ``threshold`` refreshes in a row fail, the breaker opens and refreshes
+    are skipped for ``cooldown`` seconds. Then a single refresh is let through
+    as a probe: if it succeeds the breaker closes, otherwise it opens again for
+    twice as long, up to ``max_cooldown``.
+    """
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        cooldown: float = CIRCUIT_BREAKER_COOLDOWN,
+        max_cooldown: float = CIRCUIT_BREAKER_MAX_COOLDOWN,
+    ) -> None:
+        """Initialize the breaker."""
+        self.threshold = max(1, int(threshold))
+        self.cooldown = float(cooldown)
+        self.max_cooldown = max(self.cooldown, float(max_cooldown))
+        self.failures = 0
+        self._open_for = self.cooldown
+        self._open_until: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether refreshes are currently being skipped."""
+        return self._open_until is not None
+
+    def retry_in(self) -> float:
+        """Return the seconds until the next refresh is let through."""
+        if self._open_until is None:
+            return 0.0
+        return max(0.0, self._open_until - time.monotonic())
+
+    def allow(self) -> bool:
+        """Return whether a refresh may contact the controller now."""
+        if self._open_until is None:
+            return True
+        if self._probing or time.monotonic() < self._open_until:
+            return False
+        self._probing = True
+        return True
+
+    def cancel_probe(self) -> None:
+        """Let another refresh probe the controller after one was cancelled."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful refresh."""
+        self.failures = 0
+        self._open_for = self.cooldown
+        self._open_until = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed refresh and open the breaker when needed."""
+        self.failures += 1
+        if self._probing:
+            self._open_for = min(self.max_cooldown, self._open_for * 2)
+        elif self.failures < self.threshold or self._open_until is not None:
+            return
+        self._probing = False
+        self._open_until = time.monotonic() + self._open_for
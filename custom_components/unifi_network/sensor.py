@@ -12,7 +12,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfDataRate
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -36,6 +36,7 @@ class UnifiSensorEntityDescription(SensorEntityDescription):
     """Extended sensor entity description with sensor_type reference."""
 
     sensor_type: type[UnifiDeviceSensor]  # reference to the class to instantiate
+    deadband: bool = False  # metric may skip writes within the state deadband
 
 
 class UnifiDeviceSensor(CoordinatorEntity, SensorEntity):
@@ -43,6 +44,10 @@ class UnifiDeviceSensor(CoordinatorEntity, SensorEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # UnifiDevice section the value is read from; None listens to any change
+    _device_section: str | None = None
+    # (available, native_value, extra_state_attributes) of the last state write
+    _last_written_state: tuple[Any, Any, Any] | None = None
 
     def __init__(
         self,
@@ -51,7 +56,10 @@ class UnifiDeviceSensor(CoordinatorEntity, SensorEntity):
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the Unifi device sensor."""
-        CoordinatorEntity.__init__(self, coordinator)
+        context = (
+            (device_id, self._device_section) if self._device_section else device_id
+        )
+        CoordinatorEntity.__init__(self, coordinator, context)
         self.entity_description = description
         self.device_id = device_id
         self._attr_unique_id = f"unifi_device_{device_id}_{description.key}"
@@ -65,10 +73,47 @@ class UnifiDeviceSensor(CoordinatorEntity, SensorEntity):
 
         return device.device_info
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state, skipping writes that would not change it if enabled."""
+        if self.coordinator.suppress_unchanged_states:
+            state = (self.available, self.native_value, self.extra_state_attributes)
+            if self._last_written_state is not None and self._is_unchanged(
+                self._last_written_state, state
+            ):
+                return
+            self._last_written_state = state
+        super()._handle_coordinator_update()
+
+    def _is_unchanged(
+        self, previous: tuple[Any, Any, Any], current: tuple[Any, Any, Any]
+    ) -> bool:
+        """Return whether the state equals, or is within the deadband of, the last write."""
+        if previous == current:
+            return True
+        if previous[0] != current[0] or previous[2] != current[2]:
+            return False
+
+        deadband_pct = self.coordinator.state_deadband_pct
+        old, new = previous[1], current[1]
+        if (
+            not deadband_pct
+            or not self.entity_description.deadband
+            or not isinstance(old, (int, float))
+            or not isinstance(new, (int, float))
+            or isinstance(old, bool)
+            or isinstance(new, bool)
+        ):
+            return False
+        # Measured against the last written value so slow drift is still reported
+        return abs(new - old) <= abs(old) * deadband_pct / 100
+
 
 class UnifiDeviceStatisticSensor(UnifiDeviceSensor):
     """Represents a base level statistic for a Unifi device."""
 
+    _device_section = "latest_statistics"
+
     @property
     def native_value(self) -> float | int | str | None:
         """Return the state of the sensor."""
@@ -85,6 +130,8 @@ class UnifiDeviceStatisticSensor(UnifiDeviceSensor):
 class UnifiDeviceStateSensor(UnifiDeviceSensor):
     """Represents the state of a Unifi device."""
 
+    _device_section = "overview"
+
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
@@ -103,6 +150,8 @@ class UnifiDeviceStateSensor(UnifiDeviceSensor):
 class UnifiDeviceUptimeSensor(UnifiDeviceSensor):
     """Represents an uptime sensor for a Unifi device."""
 
+    _device_section = "latest_statistics"
+
     @property
     def native_value(self) -> float | int | str | None:
         """Return the state of the sensor."""
@@ -121,6 +170,8 @@ class UnifiDeviceUptimeSensor(UnifiDeviceSensor):
 class UnifiDeviceUplinkSensor(UnifiDeviceSensor):
     """Represents an uplink statistic for a Unifi device."""
 
+    _device_section = "latest_statistics"
+
     @property
     def native_value(self) -> float | int | str | None:
         """Return the state of the sensor."""
@@ -140,6 +191,8 @@ class UnifiDeviceUplinkSensor(UnifiDeviceSensor):
 class UnifiDeviceRadioSensor(UnifiDeviceSensor):
     """Represents a radio statistic for a Unifi device."""
 
+    _device_section = "latest_statistics"
+
     def __init__(
         self,
         coordinator: UnifiDeviceCoordinator,
@@ -160,17 +213,12 @@ class UnifiDeviceRadioSensor(UnifiDeviceSensor):
         """Return the state of the sensor."""
         # Access UnifiDevice from coordinator accessor
         device = self.coordinator.get_device(self.device_id)
-        if not device or not device.latest_statistics:
+        if not device:
             return None
-        interfaces_obj = getattr(device.latest_statistics, "interfaces", None)
-        if not interfaces_obj:
+        radio = device.get_radio(self._frequency_ghz)
+        if radio is None:
             return None
-        value = None
-        for radio in getattr(interfaces_obj, "radios", []):
-            frequency_ghz = getattr(radio, "frequency_g_hz", None)
-            if frequency_ghz == self._frequency_ghz:
-                # Found the matching radio
-                value = getattr(radio, self.entity_description.key, None)
+        value = getattr(radio, self.entity_description.key, None)
         if value is None or value is UNSET:
             return None
         return value
@@ -179,6 +227,8 @@ class UnifiDeviceRadioSensor(UnifiDeviceSensor):
 class UnifiDevicePortSensor(UnifiDeviceSensor):
     """Represents a port sensor for a Unifi device."""
 
+    _device_section = "details"
+
     def __init__(
         self,
         coordinator: UnifiDeviceCoordinator,
@@ -207,19 +257,9 @@ class UnifiDevicePortSensor(UnifiDeviceSensor):
 
     def _get_port(self) -> PortOverview | None:
         device = self.coordinator.get_device(self.device_id)
-        if not device or not device.details:
-            return None
-        interfaces_obj = getattr(device.details, "interfaces", None)
-        if not interfaces_obj:
-            return None
-        ports = getattr(interfaces_obj, "ports", [])
-        if not ports or ports is UNSET:
+        if not device:
             return None
-        for port in ports:
-            port_idx = getattr(port, "idx", None)
-            if port_idx == self._port_idx:
-                return port
-        return None
+        return device.get_port(self._port_idx)
 
 
 class UnifiDevicePortStateSensor(UnifiDevicePortSensor):
@@ -349,6 +389,7 @@ DEVICE_SENSOR_DESCRIPTIONS: tuple[UnifiSensorEntityDescription, ...] = (
         translation_key="load_average_1_min",
         native_unit_of_measurement=None,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
     ),
     UnifiSensorEntityDescription(
         sensor_type=UnifiDeviceStatisticSensor,
@@ -356,6 +397,7 @@ DEVICE_SENSOR_DESCRIPTIONS: tuple[UnifiSensorEntityDescription, ...] = (
         translation_key="load_average_5_min",
         native_unit_of_measurement=None,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
     ),
     UnifiSensorEntityDescription(
         sensor_type=UnifiDeviceStatisticSensor,
@@ -363,6 +405,7 @@ DEVICE_SENSOR_DESCRIPTIONS: tuple[UnifiSensorEntityDescription, ...] = (
         translation_key="load_average_15_min",
         native_unit_of_measurement=None,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
     ),
     UnifiSensorEntityDescription(
         sensor_type=UnifiDeviceStatisticSensor,
@@ -370,6 +413,7 @@ DEVICE_SENSOR_DESCRIPTIONS: tuple[UnifiSensorEntityDescription, ...] = (
         translation_key="cpu_utilization_pct",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
     ),
     UnifiSensorEntityDescription(
         sensor_type=UnifiDeviceStatisticSensor,
@@ -377,6 +421,7 @@ DEVICE_SENSOR_DESCRIPTIONS: tuple[UnifiSensorEntityDescription, ...] = (
         translation_key="memory_utilization_pct",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
     ),
     UnifiSensorEntityDescription(
         sensor_type=UnifiDeviceUplinkSensor,
@@ -386,6 +431,7 @@ DEVICE_SENSOR_DESCRIPTIONS: tuple[UnifiSensorEntityDescription, ...] = (
         suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
         device_class=SensorDeviceClass.DATA_RATE,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
     ),
     UnifiSensorEntityDescription(
         sensor_type=UnifiDeviceUplinkSensor,
@@ -395,6 +441,7 @@ DEVICE_SENSOR_DESCRIPTIONS: tuple[UnifiSensorEntityDescription, ...] = (
         suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
         device_class=SensorDeviceClass.DATA_RATE,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
     ),
 )
 # Define sensor descriptions after the sensor classes so referenced classes exist
@@ -405,6 +452,7 @@ DEVICE_RADIO_SENSOR_DESCRIPTIONS: tuple[UnifiSensorEntityDescription, ...] = (
         translation_key="tx_retries_pct",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
     ),
 )
 
@@ -1,21 +1,123 @@
-from dataclasses import dataclass
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, TypeVar
 
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import DeviceInfo
 
-from .api_client.models import ClientDetails, ClientOverview
+from .api_client.models import (
+    ClientDetails,
+    ClientOverview,
+    TeleportClientConnectionDetails,
+    TeleportClientConnectionOverview,
+    VPNClientConnectionDetails,
+    VPNClientConnectionOverview,
+    WiredClientDetails,
+    WiredClientOverview,
+    WirelessClientDetails,
+    WirelessClientOverview,
+)
 from .api_client.types import Unset
 from .const import DOMAIN
 
+T = TypeVar("T")
 
-@dataclass
+# Client pages decode into the variant matching each client's type, falling
+# back to the untyped models for types the API spec does not know yet.
+AnyClientOverview = (
+    WiredClientOverview
+    | WirelessClientOverview
+    | VPNClientConnectionOverview
+    | TeleportClientConnectionOverview
+    | ClientOverview
+)
+AnyClientDetails = (
+    WiredClientDetails
+    | WirelessClientDetails
+    | VPNClientConnectionDetails
+    | TeleportClientConnectionDetails
+    | ClientDetails
+)
+
+# Variants that carry the MAC address and uplink device as typed fields
+_NETWORK_CLIENT_MODELS = (
+    WiredClientOverview,
+    WirelessClientOverview,
+    WiredClientDetails,
+    WirelessClientDetails,
+)
+
+
+def _model_field(src: Any, name: str) -> Any:
+    """Return a model field, or None when it is unset or cannot be decoded.
+
+    Lazy models only decode a field when it is first read, so a malformed
+    payload raises there rather than when the page was parsed.
+    """
+    try:
+        value = getattr(src, name, None)
+    except (KeyError, TypeError, ValueError):
+        return None
+    return None if isinstance(value, Unset) else value
+
+
+def _additional_property(src: Any, key: str) -> Any:
+    """Return a field the model only kept in additional_properties."""
+    additional = getattr(src, "additional_properties", None)
+    if isinstance(additional, Mapping):
+        return additional.get(key)
+    return None
+
+
+def _client_device_info(
+    client_id: str,
+    name: str | None,
+    model: Any,
+    vendor: str | None,
+    mac: str | None,
+) -> DeviceInfo:
+    """Return DeviceInfo for a UniFi client with vendor as manufacturer."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, client_id)},
+        name=name,
+        model=model,
+        manufacturer=vendor,
+        connections={(CONNECTION_NETWORK_MAC, mac)} if mac else set(),
+    )
+
+
+@dataclass(slots=True)
 class UnifiClient:
-    """Represents a Unifi client with its overview and details."""
+    """Represents a Unifi client with its overview and details.
+
+    Derived values (MAC, uplink device, DeviceInfo) are computed once per
+    overview/details snapshot and cached until either object is replaced.
+    """
 
-    overview: ClientOverview
-    details: ClientDetails | None
+    overview: AnyClientOverview
+    details: AnyClientDetails | None
     last_seen: datetime | None = None
+    vendor: str | None = None
+    _cache: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _cache_sources: tuple[Any, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def _cached(self, name: str, compute: Callable[[], T]) -> T:
+        """Return a derived value, recomputing it when the snapshot changed."""
+        sources = (self.overview, self.details, self.vendor)
+        if not self._cache_sources or any(
+            source is not cached
+            for source, cached in zip(sources, self._cache_sources, strict=True)
+        ):
+            self._cache.clear()
+            self._cache_sources = sources
+        if name not in self._cache:
+            self._cache[name] = compute()
+        return self._cache[name]
 
     @property
     def id(self) -> str:
@@ -25,67 +127,80 @@ class UnifiClient:
     @property
     def name(self) -> str | None:
         """Return the client name, or None if unset."""
-        name = getattr(self.overview, "name", None)
-        if name is not None and isinstance(name, Unset):
-            return None
-        return name
+        return _model_field(self.overview, "name")
 
     @property
     def ip(self) -> str | None:
         """Return the client IP address, or None if unset."""
-        ip = getattr(self.overview, "ip_address", None)
-        if ip is not None and isinstance(ip, Unset):
-            return None
-        return ip
+        return _model_field(self.overview, "ip_address")
+
+    @property
+    def type_(self) -> str | None:
+        """Return the client type (WIRED, WIRELESS, VPN, ...), or None if unset."""
+        type_ = _model_field(self.overview, "type_")
+        return None if type_ is None else str(type_)
+
+    @property
+    def connected_at(self) -> datetime | None:
+        """Return when the client connected, or None if unset."""
+        return _model_field(self.overview, "connected_at")
 
     @property
     def mac(self) -> str | None:
         """Return the MAC address for this client, or None if unset.
 
-        The OpenAPI models keep unrecognized fields in `additional_properties`.
-        UniFi currently exposes the MAC under the key "macAddress".
+        Wired and wireless clients have it as `mac_address`. Models of other
+        client types keep it in `additional_properties` under "macAddress".
         """
+        return self._cached("mac", self._compute_mac)
+
+    def _compute_mac(self) -> str | None:
         # Prefer value from overview, then fall back to details if present
         for src in (self.overview, self.details):
             if not src:
                 continue
-            additional = getattr(src, "additional_properties", None)
-            if isinstance(additional, dict):
-                mac = additional.get("macAddress")
-                if mac is not None and isinstance(mac, Unset):
-                    return None
-                if mac:
-                    return mac
+            if isinstance(src, _NETWORK_CLIENT_MODELS):
+                mac = _model_field(src, "mac_address")
+            else:
+                mac = _additional_property(src, "macAddress")
+            if mac is not None and isinstance(mac, Unset):
+                return None
+            if mac:
+                return mac
         return None
 
     @property
     def uplink_device_id(self) -> str | None:
         """Return the uplink device ID for this client, or None if unavailable."""
+        return self._cached("uplink_device_id", self._compute_uplink_device_id)
+
+    def _compute_uplink_device_id(self) -> str | None:
         # Prefer value from overview, then fall back to details if present.
         for src in (self.overview, self.details):
             if not src:
                 continue
-            additional = getattr(src, "additional_properties", None)
-            if isinstance(additional, dict):
-                uplink_device_id = additional.get("uplinkDeviceId")
-                if uplink_device_id is not None and isinstance(uplink_device_id, Unset):
-                    return None
-                if uplink_device_id:
-                    return str(uplink_device_id)
+            if isinstance(src, _NETWORK_CLIENT_MODELS):
+                uplink_device_id = _model_field(src, "uplink_device_id")
+            else:
+                uplink_device_id = _additional_property(src, "uplinkDeviceId")
+            if uplink_device_id is not None and isinstance(uplink_device_id, Unset):
+                return None
+            if uplink_device_id:
+                return str(uplink_device_id)
         return None
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return DeviceInfo for this UniFi client with vendor as manufacturer."""
-        identifiers = {(DOMAIN, self.id)}
-        connections = {(CONNECTION_NETWORK_MAC, self.mac)} if self.mac else set()
-
-        return DeviceInfo(
-            identifiers=identifiers,
-            name=self.name,
-            model=getattr(self.overview, "type_", None),
-            manufacturer=getattr(self, "vendor", None),
-            connections=connections,
+        return self._cached("device_info", self._compute_device_info)
+
+    def _compute_device_info(self) -> DeviceInfo:
+        return _client_device_info(
+            self.id,
+            self.name,
+            self.type_,
+            self.vendor,
+            self.mac,
         )
 
     def update(self, other: "UnifiClient") -> None:
@@ -100,3 +215,83 @@ class UnifiClient:
         self.overview = other.overview
         self.details = other.details
         self.last_seen = other.last_seen
+        self._cache.clear()
+        self._cache_sources = ()
+
+
+@dataclass(slots=True)
+class UnifiClientRecord:
+    """Compact snapshot of a known client that is no longer connected.
+
+    Only the values used by the device tracker and services are kept, so the
+    full API models of offline clients can be released.
+    """
+
+    id: str
+    mac: str | None
+    name: str | None
+    ip: str | None
+    uplink_device_id: str | None
+    type_: str | None
+    last_seen: datetime | None
+    connected_at: datetime | None
+    vendor: str | None = None
+
+    @classmethod
+    def from_client(cls, client: UnifiClient) -> "UnifiClientRecord":
+        """Create a record from the last snapshot of a connected client."""
+        return cls(
+            id=client.id,
+            mac=client.mac,
+            name=client.name,
+            ip=client.ip,
+            uplink_device_id=client.uplink_device_id,
+            type_=client.type_,
+            last_seen=client.last_seen,
+            connected_at=client.connected_at,
+            vendor=client.vendor,
+        )
+
+    @classmethod
+    def from_dict(cls, client_id: str, data: dict[str, Any]) -> "UnifiClientRecord":
+        """Create a record from its stored representation."""
+        last_seen = data.get("last_seen")
+        connected_at = data.get("connected_at")
+        return cls(
+            id=client_id,
+            mac=data.get("mac"),
+            name=data.get("name"),
+            ip=data.get("ip"),
+            uplink_device_id=data.get("uplink_device_id"),
+            type_=data.get("type"),
+            last_seen=datetime.fromisoformat(last_seen) if last_seen else None,
+            connected_at=datetime.fromisoformat(connected_at) if connected_at else None,
+            vendor=data.get("vendor"),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stored representation of this record, omitting empty values."""
+        data = {
+            "mac": self.mac,
+            "name": self.name,
+            "ip": self.ip,
+            "uplink_device_id": self.uplink_device_id,
+            "type": self.type_,
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "connected_at": self.connected_at.isoformat()
+            if self.connected_at
+            else None,
+            "vendor": self.vendor,
+        }
+        return {key: value for key, value in data.items() if value is not None}
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return DeviceInfo for this UniFi client with vendor as manufacturer."""
+        return _client_device_info(
+            self.id, self.name, self.type_, self.vendor, self.mac
+        )
+
+
+# Entries of UnifiClientCoordinator.known_clients
+KnownClient = UnifiClient | UnifiClientRecord
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import DeviceInfo
@@ -7,18 +8,65 @@ from .api_client.models import (
     AdoptedDeviceDetails,
     AdoptedDeviceOverview,
     LatestStatisticsForADevice,
+    PortOverview,
 )
 from .api_client.types import Unset
 from .const import ATTR_MANUFACTURER, DOMAIN
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiDevice:
     """Represents a Unifi device with its overview, statistics, and details."""
 
     overview: AdoptedDeviceOverview
     latest_statistics: LatestStatisticsForADevice | None
     details: AdoptedDeviceDetails | None
+    _ports: dict[int, PortOverview] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _radios: dict[float, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # DeviceInfo only depends on the overview, cached with the overview used
+    _device_info: tuple[AdoptedDeviceOverview, DeviceInfo] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def build_indexes(self) -> None:
+        """Index ports by idx and radios by frequency for constant-time lookups.
+
+        Must be called again whenever ``details`` or ``latest_statistics`` change.
+        """
+        self._ports = {}
+        ports = getattr(getattr(self.details, "interfaces", None), "ports", None)
+        if isinstance(ports, list):
+            for port in ports:
+                port_idx = getattr(port, "idx", None)
+                if port_idx is not None:
+                    # Keep the first port of a given idx, like a linear scan would
+                    self._ports.setdefault(port_idx, port)
+
+        self._radios = {}
+        radios = getattr(
+            getattr(self.latest_statistics, "interfaces", None), "radios", None
+        )
+        if isinstance(radios, list):
+            for radio in radios:
+                frequency_ghz = getattr(radio, "frequency_g_hz", None)
+                if frequency_ghz is not None:
+                    self._radios[frequency_ghz] = radio
+
+    def get_port(self, port_idx: int) -> PortOverview | None:
+        """Return the port with the given idx from the device details, if any."""
+        if self._ports is None:
+            self.build_indexes()
+        return self._ports.get(port_idx)
+
+    def get_radio(self, frequency_ghz: float) -> Any | None:
+        """Return the radio statistics for the given frequency, if any."""
+        if self._radios is None:
+            self.build_indexes()
+        return self._radios.get(frequency_ghz)
 
     @property
     def id(self) -> str:
@@ -69,6 +117,11 @@ class UnifiDevice:
     @property
     def device_info(self) -> DeviceInfo:
         """Return DeviceInfo for this UniFi device with manufacturer set."""
+        if self._device_info is None or self._device_info[0] is not self.overview:
+            self._device_info = (self.overview, self._compute_device_info())
+        return self._device_info[1]
+
+    def _compute_device_info(self) -> DeviceInfo:
         model = getattr(self.overview, "model", None)
         identifiers = {(DOMAIN, self.id)}
         connections = {(CONNECTION_NETWORK_MAC, self.mac)} if self.mac else set()
@@ -65,7 +65,7 @@ class UnifiUpdateEntity(CoordinatorEntity, UpdateEntity):
         device_id: str,
     ) -> None:
         """Initialize the UniFi update entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id)
         self.device_id = device_id
         self._attr_unique_id = f"unifi_device_{device_id}_firmware_update"
         self._attr_translation_key = "firmware_update"
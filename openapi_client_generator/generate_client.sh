@@ -5,13 +5,14 @@ python3 normalize_openapi.py integration.json \
     --output-file integration-fix.json \
     --rename "IP Address selector:IP_Address_selector_2" \
     --filter-tags "Sites" "UniFi Devices" "Clients" \
-    --fix-type "frequencyGHz:number"
+    --fix-type "frequencyGHz:number" \
+    --fix-discriminator "Client overview" "Client details"
 
 # Remove previous client
 rm -rf unifi-network-api-client
 
 # Generate new client with post hooks to fix and format code
-openapi-python-client generate --path integration-fix.json --output-path unifi-network-api-client --config openapi-generator-config.yaml
+openapi-python-client generate --path integration-fix.json --output-path unifi-network-api-client --config openapi-generator-config.yaml --custom-template-path templates
 
 # Remove old copy of client (moved under custom_components for HACS)
 rm -rf ../custom_components/unifi_network/api_client
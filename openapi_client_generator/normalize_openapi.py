@@ -35,9 +35,12 @@ Options:
     --rename OLD_NAME:NEW_NAME    Replace a schema name (case sensitive, can be used multiple times)
     --output-file FILE            Output file path (use '-' for stdout, default: stdout)
     --filter-tags TAG [TAG ...]   Only include endpoints with these tags (can specify multiple tags)
+    --fix-discriminator SCHEMA [SCHEMA ...]
+                                  Decode a discriminated base schema into its typed variants
 """
 
 import argparse
+import copy
 import json
 import re
 import sys
@@ -247,6 +250,101 @@ def fix_x_tags_fields(obj: Any) -> None:
             fix_x_tags_fields(item)
 
 
+def replace_base_references(obj: Any, base_ref: str, union: Dict[str, Any]) -> Any:
+    """
+    Recursively replace references to a base schema with a union schema.
+    
+    References listed directly in an allOf are inheritance rather than usage,
+    so they are left pointing at the base schema.
+    
+    Args:
+        obj: The object to walk (can be dict, list, or primitive)
+        base_ref: The $ref of the base schema, e.g. '#/components/schemas/Client_overview'
+        union: The schema that replaces each reference
+        
+    Returns:
+        The modified object
+    """
+    if isinstance(obj, dict):
+        if obj.get('$ref') == base_ref:
+            return copy.deepcopy(union)
+        for key, value in obj.items():
+            if key == 'allOf' and isinstance(value, list):
+                obj[key] = [
+                    item if isinstance(item, dict) and item.get('$ref') == base_ref
+                    else replace_base_references(item, base_ref, union)
+                    for item in value
+                ]
+            else:
+                obj[key] = replace_base_references(value, base_ref, union)
+    elif isinstance(obj, list):
+        return [replace_base_references(item, base_ref, union) for item in obj]
+    
+    return obj
+
+
+def fix_discriminator(spec: Dict[str, Any], schema_name: str, verbose: bool = True) -> None:
+    """
+    Make a discriminated base schema decode into its typed variants.
+    
+    The API declares the discriminator on a base schema (e.g. "Client overview")
+    that its variants extend with allOf, and references only the base schema.
+    openapi-python-client ignores that form, so responses only ever decode into
+    the untyped base model and variant fields such as macAddress end up in
+    additional_properties. This:
+    
+    - pins the discriminator property of every mapped variant to its value
+      with a single-value enum, so each variant only accepts its own records
+    - removes the discriminator from the base schema, which stays as the allOf
+      parent and as a fallback for values the mapping does not know yet
+    - replaces every other reference to the base schema with a oneOf of the
+      variants followed by the base schema
+    
+    Args:
+        spec: The OpenAPI specification dictionary (modified in place)
+        schema_name: The normalized name of the base schema
+        verbose: Whether to print progress messages
+    """
+    schemas = spec.get('components', {}).get('schemas', {})
+    base = schemas.get(schema_name)
+    if not base or 'discriminator' not in base:
+        print(f"Warning: Schema '{schema_name}' has no discriminator, skipping", file=sys.stderr)
+        return
+    
+    discriminator = base.pop('discriminator')
+    property_name = discriminator['propertyName']
+    base_ref = f'#/components/schemas/{schema_name}'
+    variant_refs = []
+    
+    for value, variant_ref in discriminator.get('mapping', {}).items():
+        variant = schemas.get(variant_ref.replace('#/components/schemas/', ''))
+        if variant is None:
+            continue
+        
+        # Add the property to the inline part of the variant, next to its own fields
+        target = variant
+        if 'properties' not in variant:
+            inline = [item for item in variant.get('allOf', []) if '$ref' not in item]
+            if inline:
+                target = inline[-1]
+            else:
+                target = {'type': 'object'}
+                variant.setdefault('allOf', []).append(target)
+        target.setdefault('properties', {})[property_name] = {'type': 'string', 'enum': [value]}
+        
+        required = variant.setdefault('required', [])
+        if property_name not in required:
+            required.append(property_name)
+        
+        variant_refs.append({'$ref': variant_ref})
+        if verbose:
+            print(f"  {schema_name}: {property_name}={value} -> {variant_ref.split('/')[-1]}")
+    
+    union = {'oneOf': variant_refs + [{'$ref': base_ref}]}
+    for key in list(spec):
+        spec[key] = replace_base_references(spec[key], base_ref, union)
+
+
 def filter_endpoints_by_tags(spec: Dict[str, Any], allowed_tags: List[str], verbose: bool = True) -> None:
     """
     Remove all endpoints that don't have at least one of the allowed tags.
@@ -425,6 +523,7 @@ def add_security_to_operations(spec: Dict[str, Any], verbose: bool = True) -> No
 
 def normalize_openapi_spec(spec: Dict[str, Any], custom_renames: Dict[str, str] = None, 
                           filter_tags: List[str] = None, type_fixes: List[tuple] = None,
+                          discriminator_fixes: List[str] = None,
                           verbose: bool = True) -> Dict[str, Any]:
     """
     Normalize an OpenAPI specification to comply with OpenAPI 3.0+ requirements.
@@ -434,13 +533,14 @@ def normalize_openapi_spec(spec: Dict[str, Any], custom_renames: Dict[str, str]
         custom_renames: Optional dictionary of custom schema name replacements (old_name -> new_name)
         filter_tags: Optional list of tags to filter endpoints by
         type_fixes: Optional list of tuples (property_name, new_type) to fix property types
+        discriminator_fixes: Optional list of base schemas whose discriminator should select
+                             the typed variants
         verbose: Whether to print progress messages
         
     Returns:
         The normalized specification
     """
     # Create a deep copy to avoid modifying the original
-    import copy
     normalized_spec = copy.deepcopy(spec)
     
     if custom_renames is None:
@@ -570,7 +670,18 @@ def normalize_openapi_spec(spec: Dict[str, Any], custom_renames: Dict[str, str]
         print("\nFixing x-tags fields...")
     fix_x_tags_fields(normalized_spec)
     
-    # Fix 8: Add security to operations that are missing it
+    # Fix 8: Decode discriminated base schemas into their typed variants
+    if discriminator_fixes:
+        if verbose:
+            print("\nFixing discriminators...")
+        for schema_name in discriminator_fixes:
+            fix_discriminator(
+                normalized_spec,
+                custom_renames.get(schema_name, normalize_schema_name(schema_name)),
+                verbose,
+            )
+    
+    # Fix 9: Add security to operations that are missing it
     if verbose:
         print("\nAdding security definitions to operations...")
     add_security_to_operations(normalized_spec, verbose)
@@ -602,6 +713,9 @@ Examples:
   
   # Fix property types to match API behavior
   %(prog)s integration.json --fix-type "frequencyGHz:number" --output-file result.json
+  
+  # Decode a discriminated base schema into its typed variants
+  %(prog)s integration.json --fix-discriminator "Client overview" --output-file result.json
         """
     )
     
@@ -630,6 +744,13 @@ Examples:
         help='Fix property type (e.g., "frequencyGHz:number", can be used multiple times)'
     )
     
+    parser.add_argument(
+        '--fix-discriminator',
+        nargs='+',
+        metavar='SCHEMA',
+        help='Decode a base schema with a discriminator into its typed variants (can specify multiple schemas)'
+    )
+    
     args = parser.parse_args()
     
     input_file = Path(args.input_file)
@@ -699,6 +820,7 @@ Examples:
     normalized_spec = normalize_openapi_spec(spec, custom_renames, 
                                             filter_tags=args.filter_tags,
                                             type_fixes=type_fixes if type_fixes else None,
+                                            discriminator_fixes=args.fix_discriminator,
                                             verbose=not output_to_stdout)
     
     # Write output
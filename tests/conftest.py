@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import Mock
 
 # Mock datetime utilities
 dt_util = Mock()
-dt_util.now = lambda: datetime(2023, 1, 1, tzinfo=datetime.UTC)
+dt_util.now = lambda: datetime(2023, 1, 1, tzinfo=UTC)
+dt_util.utcnow = lambda: datetime(2023, 1, 1, tzinfo=UTC)
 
 
 # Mock Home Assistant core classes
@@ -80,21 +81,68 @@ class MockUpdateCoordinator:
         self.name = name
         self.update_interval = update_interval
         self.data = None
+        self.last_update_success = True
+        self._listeners = {}
 
     async def _async_update_data(self):
         """Update data."""
         return {}
 
+    def async_add_listener(self, update_callback, context=None):
+        """Listen for data updates."""
+        remove_listener = object()
+        self._listeners[remove_listener] = (update_callback, context)
+        return lambda: self._listeners.pop(remove_listener, None)
+
+    def async_update_listeners(self):
+        """Update all registered listeners."""
+        for update_callback, _ in list(self._listeners.values()):
+            update_callback()
+
 
 class UpdateFailed(Exception):
     """Mock UpdateFailed exception."""
 
 
+class MockStore:
+    """Mock storage helper keeping data in memory."""
+
+    def __init__(self, hass=None, version=1, key="test", data=None):
+        self.hass = hass
+        self.version = version
+        self.key = key
+        self.data = data
+        self.delayed_save = None
+
+    async def async_load(self):
+        """Return the stored data."""
+        return self.data
+
+    def async_delay_save(self, data_func, delay=0):
+        """Remember the pending save until flush_delayed_save is called."""
+        self.delayed_save = data_func
+
+    def flush_delayed_save(self):
+        """Run the pending delayed save."""
+        self.data = self.delayed_save()
+        self.delayed_save = None
+
+    async def async_save(self, data):
+        """Store data immediately."""
+        self.data = data
+        self.delayed_save = None
+
+    async def async_remove(self):
+        """Remove the stored data."""
+        self.data = None
+
+
 class MockCoordinatorEntity:
     """Mock CoordinatorEntity base class."""
 
-    def __init__(self, coordinator):
+    def __init__(self, coordinator, context=None):
         self.coordinator = coordinator
+        self.coordinator_context = context
 
 
 class MockTrackerEntity:
@@ -107,6 +155,11 @@ class MockSourceType:
     ROUTER = "router"
 
 
+# Mock core module
+core = Mock()
+core.HomeAssistant = MockHomeAssistant
+core.callback = lambda func: func
+
 # Mock config_entries module
 config_entries = Mock()
 config_entries.ConfigFlow = MockConfigFlow
@@ -147,6 +200,27 @@ device_tracker = Mock()
 device_tracker.TrackerEntity = MockTrackerEntity
 device_tracker.SourceType = MockSourceType
 
+# Mock storage helper
+storage = Mock()
+storage.Store = MockStore
+
+
+def _redact_data(data, to_redact):
+    """Redact keys recursively, like homeassistant.components.diagnostics."""
+    if isinstance(data, list):
+        return [_redact_data(item, to_redact) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: "**REDACTED**" if key in to_redact else _redact_data(value, to_redact)
+        for key, value in data.items()
+    }
+
+
+# Mock diagnostics component
+diagnostics = Mock()
+diagnostics.async_redact_data = _redact_data
+
 # Mock httpx_client helper
 httpx_client = Mock()
 httpx_client.get_async_client = Mock()
@@ -168,18 +242,21 @@ homeassistant.util.dt = dt_util
 # Mock homeassistant modules for import patching
 sys.modules["homeassistant"] = homeassistant
 sys.modules["homeassistant.config_entries"] = config_entries
-sys.modules["homeassistant.core"] = Mock()
+sys.modules["homeassistant.core"] = core
 sys.modules["homeassistant.const"] = const
 sys.modules["homeassistant.data_entry_flow"] = data_entry_flow
 sys.modules["homeassistant.components"] = Mock()
 sys.modules["homeassistant.components.sensor"] = sensor
 sys.modules["homeassistant.components.device_tracker"] = device_tracker
+sys.modules["homeassistant.components.diagnostics"] = diagnostics
 sys.modules["homeassistant.helpers"] = Mock()
 sys.modules["homeassistant.helpers.entity"] = entity
 sys.modules["homeassistant.helpers.entity_platform"] = entity_platform
 sys.modules["homeassistant.helpers.httpx_client"] = httpx_client
+sys.modules["homeassistant.helpers.storage"] = storage
 sys.modules["homeassistant.helpers.update_coordinator"] = update_coordinator
 sys.modules["homeassistant.helpers.selector"] = Mock()
 sys.modules["homeassistant.helpers.device_registry"] = Mock()
-sys.modules["homeassistant.util"] = Mock()
+sys.modules["homeassistant.util"] = homeassistant.util
 sys.modules["homeassistant.util.dt"] = dt_util
+sys.modules["homeassistant.util.ssl"] = Mock()
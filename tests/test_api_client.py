@@ -0,0 +1,623 @@
+"""Tests for the behavior added to the generated API client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from copy import deepcopy
+from datetime import UTC, datetime
+from unittest.mock import patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from custom_components.unifi_network.api_client import Client, errors
+from custom_components.unifi_network.api_client.api.clients import (
+    get_connected_client_overview_page,
+)
+from custom_components.unifi_network.api_client.api.sites import (
+    get_site_overview_page,
+)
+from custom_components.unifi_network.api_client.client import default_json_decoder
+from custom_components.unifi_network.api_client.models import (
+    ClientOverview,
+    ClientOverviewPage,
+    PortOverview,
+    VPNClientConnectionOverview,
+    WiredClientOverview,
+    WirelessClientOverview,
+)
+from custom_components.unifi_network.api_client.types import UNSET, parse_datetime
+
+SITE_PAGE = {
+    "offset": 0,
+    "limit": 25,
+    "count": 1,
+    "totalCount": 1,
+    "data": [
+        {
+            "id": "88f7af54-98f8-306a-a1c7-c9349722b1f6",
+            "internalReference": "default",
+            "name": "Default",
+        }
+    ],
+}
+
+
+def _client(handler, **kwargs) -> Client:
+    """Return a Client whose requests are answered by handler."""
+    client = Client(base_url="https://unifi.example.com", **kwargs)
+    client.set_async_httpx_client(
+        httpx.AsyncClient(
+            base_url="https://unifi.example.com",
+            transport=httpx.MockTransport(handler),
+        )
+    )
+    return client
+
+
+def _site_page(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=SITE_PAGE)
+
+
+class TestJsonDecoding:
+    """Test pluggable JSON decoding of responses."""
+
+    def test_default_decoder(self):
+        """Test that the default decoder accepts raw bytes."""
+        assert default_json_decoder(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    async def test_custom_decoder_is_used(self):
+        """Test that endpoints decode bodies with the configured decoder."""
+        decoded: list[bytes] = []
+
+        def decoder(content: bytes):
+            decoded.append(content)
+            return json.loads(content)
+
+        client = _client(_site_page, json_decoder=decoder)
+
+        response = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert len(decoded) == 1
+        assert response.parsed.data[0].id == UUID(
+            "88f7af54-98f8-306a-a1c7-c9349722b1f6"
+        )
+
+    async def test_response_content_retained_by_default(self):
+        """Test that the raw body is kept unless disabled."""
+        client = _client(_site_page)
+
+        response = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert json.loads(response.content) == SITE_PAGE
+
+    async def test_response_content_dropped(self):
+        """Test that the raw body is dropped once parsed when disabled."""
+        client = _client(_site_page, retain_response_content=False)
+
+        response = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert response.content == b""
+        assert response.parsed.total_count == 1
+
+
+CLIENT_PAGE = {
+    "offset": 0,
+    "limit": 25,
+    "count": 1,
+    "totalCount": 1,
+    "data": [
+        {
+            "type": "WIRED",
+            "id": "497f6eca-6276-4993-bfeb-53cbbbba6f08",
+            "name": "Laptop",
+            "connectedAt": "2024-01-01T12:00:00Z",
+            "ipAddress": "192.168.1.10",
+            "macAddress": "aa:bb:cc:dd:ee:ff",
+            "uplinkDeviceId": "9d3a57a5-6a39-4d4d-a2c8-b5b5b0a5f0a0",
+            "access": {"type": "DEFAULT"},
+        }
+    ],
+}
+
+
+class TestLazyModels:
+    """Test lazy hydration of response models."""
+
+    def test_lazy_matches_eager(self):
+        """Test that a lazy model decodes to the same values as from_dict."""
+        lazy = ClientOverviewPage.from_dict_lazy(CLIENT_PAGE)
+        eager = ClientOverviewPage.from_dict(CLIENT_PAGE)
+
+        assert lazy == eager
+        assert lazy.to_dict() == eager.to_dict()
+        assert lazy.data[0].mac_address == "aa:bb:cc:dd:ee:ff"
+
+    def test_fields_decoded_on_first_access(self):
+        """Test that fields are only converted when they are read."""
+        page = deepcopy(CLIENT_PAGE)
+        page["data"][0]["connectedAt"] = "not a timestamp"
+
+        client = ClientOverviewPage.from_dict_lazy(page).data[0]
+
+        assert client.name == "Laptop"
+        assert client.id == UUID("497f6eca-6276-4993-bfeb-53cbbbba6f08")
+        with pytest.raises(ValueError, match="invalid literal"):
+            _ = client.connected_at
+
+    def test_optional_field_missing(self):
+        """Test that absent optional fields decode to UNSET."""
+        client = ClientOverview.from_dict_lazy(
+            {"type": "VPN", "id": str(UUID(int=1)), "name": "VPN", "access": {}}
+        )
+
+        assert client.connected_at is UNSET
+        assert client.additional_properties == {}
+
+    def test_missing_required_key_rejected_on_parse(self):
+        """Test that a missing required key fails parsing, like from_dict."""
+        payload = deepcopy(CLIENT_PAGE["data"][0])
+        del payload["name"]
+
+        with pytest.raises(KeyError, match="name"):
+            ClientOverview.from_dict_lazy(payload)
+        with pytest.raises(KeyError, match="name"):
+            ClientOverview.from_dict(payload)
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes still raise AttributeError."""
+        client = ClientOverview.from_dict_lazy(CLIENT_PAGE["data"][0])
+
+        assert not hasattr(client, "not_a_field")
+        assert not hasattr(ClientOverview.from_dict(CLIENT_PAGE["data"][0]), "x")
+
+    async def test_lazy_models_option(self):
+        """Test that endpoints build lazy models when enabled."""
+        client = _client(
+            lambda request: httpx.Response(200, json=CLIENT_PAGE), lazy_models=True
+        )
+
+        response = await get_connected_client_overview_page.asyncio_detailed(
+            site_id=UUID(int=0), client=client
+        )
+
+        assert response.parsed._source is not None
+        assert response.parsed.data[0].ip_address == "192.168.1.10"
+
+
+class TestParseDatetime:
+    """Test the memoized timestamp parser used by the models."""
+
+    def test_parses_utc_timestamp(self):
+        """Test that a UTC timestamp is parsed."""
+        assert parse_datetime("2024-01-01T12:00:00Z") == datetime(
+            2024, 1, 1, 12, tzinfo=UTC
+        )
+
+    def test_repeated_values_are_memoized(self):
+        """Test that the same string returns the cached datetime."""
+        first = parse_datetime("2024-02-03T04:05:06Z")
+
+        assert parse_datetime("2024-02-03T04:05:06Z") is first
+
+    def test_falls_back_to_isoparse(self):
+        """Test that formats fromisoformat rejects are still accepted."""
+        assert parse_datetime("2024-01-01T24:00:00Z") == datetime(
+            2024, 1, 2, tzinfo=UTC
+        )
+
+
+class TestClientTypeDiscriminator:
+    """Test that client pages decode into the variant matching each type."""
+
+    def _page(self, *clients: dict) -> dict:
+        return {**CLIENT_PAGE, "count": len(clients), "data": list(clients)}
+
+    @pytest.mark.parametrize("from_dict", ["from_dict", "from_dict_lazy"])
+    def test_variants(self, from_dict):
+        """Test that each client type selects its typed model."""
+        wired = CLIENT_PAGE["data"][0]
+        wireless = {**wired, "type": "WIRELESS"}
+        vpn = {
+            "type": "VPN",
+            "id": str(UUID(int=2)),
+            "name": "Remote",
+            "access": {"type": "DEFAULT"},
+        }
+
+        page = getattr(ClientOverviewPage, from_dict)(self._page(wired, wireless, vpn))
+
+        assert [type(client) for client in page.data] == [
+            WiredClientOverview,
+            WirelessClientOverview,
+            VPNClientConnectionOverview,
+        ]
+        assert page.data[0].mac_address == "aa:bb:cc:dd:ee:ff"
+        assert page.data[1].uplink_device_id == UUID(
+            "9d3a57a5-6a39-4d4d-a2c8-b5b5b0a5f0a0"
+        )
+        assert str(page.data[1].type_) == "WIRELESS"
+
+    def test_unknown_type_falls_back(self):
+        """Test that types the spec does not know use the untyped model."""
+        client = {**CLIENT_PAGE["data"][0], "type": "SATELLITE"}
+
+        page = ClientOverviewPage.from_dict(self._page(client))
+
+        assert type(page.data[0]) is ClientOverview
+        assert page.data[0]["macAddress"] == "aa:bb:cc:dd:ee:ff"
+
+    @pytest.mark.parametrize("from_dict", ["from_dict", "from_dict_lazy"])
+    def test_incomplete_typed_record_falls_back(self, from_dict):
+        """Test that a record its typed variant rejects uses the untyped model."""
+        wired = {**CLIENT_PAGE["data"][0]}
+        del wired["uplinkDeviceId"]
+        wireless = {**CLIENT_PAGE["data"][0], "type": "WIRELESS"}
+        del wireless["macAddress"]
+
+        page = getattr(ClientOverviewPage, from_dict)(self._page(wired, wireless))
+
+        assert [type(client) for client in page.data] == [
+            ClientOverview,
+            ClientOverview,
+        ]
+        assert page.data[0]["macAddress"] == "aa:bb:cc:dd:ee:ff"
+        assert page.data[1].name == "Laptop"
+
+
+class TestLeanModels:
+    """Test models that only allocate additional_properties when needed."""
+
+    def test_no_unknown_keys(self):
+        """Test that models without unknown keys share an empty mapping."""
+        port = PortOverview.from_dict(
+            {"idx": 1, "state": "UP", "connector": "RJ45", "maxSpeedMbps": 1000}
+        )
+
+        assert port.additional_properties == {}
+        assert port.additional_keys == []
+        assert "speedMbps" not in port
+        assert port.to_dict() == {
+            "idx": 1,
+            "state": "UP",
+            "connector": "RJ45",
+            "maxSpeedMbps": 1000,
+        }
+
+    def test_unknown_keys_kept(self):
+        """Test that unknown keys are collected without touching the source."""
+        source = deepcopy(CLIENT_PAGE["data"][0])
+
+        client = ClientOverview.from_dict(source)
+
+        assert source == CLIENT_PAGE["data"][0]
+        assert client.additional_properties == {
+            "macAddress": "aa:bb:cc:dd:ee:ff",
+            "uplinkDeviceId": "9d3a57a5-6a39-4d4d-a2c8-b5b5b0a5f0a0",
+        }
+        assert client["macAddress"] == "aa:bb:cc:dd:ee:ff"
+
+    def test_set_and_delete_unknown_keys(self):
+        """Test that item access allocates and releases the storage."""
+        port = PortOverview.from_dict(
+            {"idx": 1, "state": "UP", "connector": "RJ45", "maxSpeedMbps": 1000}
+        )
+
+        port["vlan"] = 10
+        assert port.additional_properties == {"vlan": 10}
+
+        del port["vlan"]
+        assert port.additional_properties == {}
+        with pytest.raises(KeyError):
+            del port["vlan"]
+
+
+class TestReuseSource:
+    """Test returning the decoded mapping instead of rebuilding it."""
+
+    def test_lazy_model_returns_source(self):
+        """Test that a lazy model hands back the mapping it was decoded from."""
+        page = ClientOverviewPage.from_dict_lazy(CLIENT_PAGE)
+
+        assert page.to_dict(reuse_source=True) is CLIENT_PAGE
+        assert page.data[0].to_dict(reuse_source=True) is CLIENT_PAGE["data"][0]
+
+    def test_rebuilt_by_default(self):
+        """Test that to_dict still builds a new dict unless asked not to."""
+        page = ClientOverviewPage.from_dict_lazy(CLIENT_PAGE)
+
+        assert page.to_dict() is not CLIENT_PAGE
+
+    def test_eager_model_is_rebuilt(self):
+        """Test that models built with from_dict have no source to reuse."""
+        port = PortOverview.from_dict(
+            {"idx": 1, "state": "UP", "connector": "RJ45", "maxSpeedMbps": 1000}
+        )
+
+        assert port.to_dict(reuse_source=True) == port.to_dict()
+
+
+class TestCoalesceRequests:
+    """Test sharing identical GET requests that are already in flight."""
+
+    def _client(self, calls: list[httpx.Request], **kwargs) -> Client:
+        """Return a Client whose slow responses record every request sent."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            if request.url.params.get("offset") == "99":
+                return httpx.Response(500)
+            return httpx.Response(200, json=SITE_PAGE)
+
+        client = Client(base_url="https://unifi.example.com", **kwargs)
+        client.set_async_httpx_client(
+            httpx.AsyncClient(
+                base_url="https://unifi.example.com",
+                transport=httpx.MockTransport(handler),
+            )
+        )
+        return client
+
+    async def test_identical_requests_share_one_response(self):
+        """Test that concurrent identical GETs send one request."""
+        calls: list[httpx.Request] = []
+        client = self._client(calls, coalesce_requests=True)
+
+        first, second = await asyncio.gather(
+            get_site_overview_page.asyncio(client=client),
+            get_site_overview_page.asyncio(client=client),
+        )
+
+        assert len(calls) == 1
+        assert first is second
+        assert not client._in_flight
+
+    async def test_different_params_are_sent(self):
+        """Test that requests with different parameters are not shared."""
+        calls: list[httpx.Request] = []
+        client = self._client(calls, coalesce_requests=True)
+
+        await asyncio.gather(
+            get_site_overview_page.asyncio(client=client, offset=0),
+            get_site_overview_page.asyncio(client=client, offset=25),
+        )
+
+        assert len(calls) == 2
+
+    async def test_disabled_by_default(self):
+        """Test that every call is sent unless coalescing is enabled."""
+        calls: list[httpx.Request] = []
+        client = self._client(calls)
+
+        await asyncio.gather(
+            get_site_overview_page.asyncio(client=client),
+            get_site_overview_page.asyncio(client=client),
+        )
+
+        assert len(calls) == 2
+
+    async def test_later_requests_are_sent_again(self):
+        """Test that a finished request is not reused."""
+        calls: list[httpx.Request] = []
+        client = self._client(calls, coalesce_requests=True)
+
+        await get_site_overview_page.asyncio(client=client)
+        await get_site_overview_page.asyncio(client=client)
+
+        assert len(calls) == 2
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that cancelling one waiter leaves the shared request running."""
+        calls: list[httpx.Request] = []
+        client = self._client(calls, coalesce_requests=True)
+
+        first = asyncio.ensure_future(get_site_overview_page.asyncio(client=client))
+        second = asyncio.ensure_future(get_site_overview_page.asyncio(client=client))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).total_count == 1
+        assert len(calls) == 1
+
+    async def test_errors_reach_every_caller(self):
+        """Test that a failed shared request raises for every waiter."""
+        calls: list[httpx.Request] = []
+        client = self._client(
+            calls, coalesce_requests=True, raise_on_unexpected_status=True
+        )
+
+        results = await asyncio.gather(
+            get_site_overview_page.asyncio(client=client, offset=99),
+            get_site_overview_page.asyncio(client=client, offset=99),
+            return_exceptions=True,
+        )
+
+        assert len(calls) == 1
+        assert all(isinstance(result, errors.UnexpectedStatus) for result in results)
+
+
+class TestConditionalRequests:
+    """Test revalidating unchanged responses with ETag and Last-Modified."""
+
+    def _client(self, calls: list[httpx.Request], headers: dict, **kwargs) -> Client:
+        """Return a Client answering 304 when the request's validator matches."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if (
+                headers.get("etag")
+                and request.headers.get("If-None-Match") == (headers["etag"])
+            ):
+                return httpx.Response(304, headers=headers)
+            return httpx.Response(200, json=SITE_PAGE, headers=headers)
+
+        return _client(handler, **kwargs)
+
+    async def test_not_modified_reuses_parsed_response(self):
+        """Test that a 304 answer returns the response parsed before."""
+        calls: list[httpx.Request] = []
+        client = self._client(calls, {"etag": '"v1"'}, conditional_requests=True)
+
+        first = await get_site_overview_page.asyncio_detailed(client=client)
+        second = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert second is first
+        assert "If-None-Match" not in calls[0].headers
+        assert calls[1].headers["If-None-Match"] == '"v1"'
+
+    async def test_modified_response_replaces_cached_one(self):
+        """Test that a changed resource is parsed again and cached."""
+        calls: list[httpx.Request] = []
+        headers = {"etag": '"v1"'}
+        client = self._client(calls, headers, conditional_requests=True)
+
+        first = await get_site_overview_page.asyncio_detailed(client=client)
+        headers["etag"] = '"v2"'
+        second = await get_site_overview_page.asyncio_detailed(client=client)
+        third = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert second is not first
+        assert third is second
+        assert calls[2].headers["If-None-Match"] == '"v2"'
+
+    async def test_last_modified_is_sent_back(self):
+        """Test that Last-Modified is revalidated with If-Modified-Since."""
+        calls: list[httpx.Request] = []
+        modified = "Mon, 01 Jan 2024 12:00:00 GMT"
+        client = self._client(
+            calls, {"last-modified": modified}, conditional_requests=True
+        )
+
+        await get_site_overview_page.asyncio_detailed(client=client)
+        await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert calls[1].headers["If-Modified-Since"] == modified
+
+    async def test_responses_without_validators_are_not_kept(self):
+        """Test that nothing is cached when the API sends no validators."""
+        calls: list[httpx.Request] = []
+        client = self._client(calls, {}, conditional_requests=True)
+
+        await get_site_overview_page.asyncio_detailed(client=client)
+        await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert not client._conditional
+        assert "If-None-Match" not in calls[1].headers
+
+    async def test_disabled_by_default(self):
+        """Test that validators are ignored unless enabled."""
+        calls: list[httpx.Request] = []
+        client = self._client(calls, {"etag": '"v1"'})
+
+        first = await get_site_overview_page.asyncio_detailed(client=client)
+        second = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert second is not first
+        assert "If-None-Match" not in calls[1].headers
+
+
+class TestRetries:
+    """Test retrying failed GET requests with backoff."""
+
+    def _client(self, responses: list, calls: list[httpx.Request], **kwargs):
+        """Return a Client answering with responses in turn."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        return _client(handler, retry_backoff=0, **kwargs)
+
+    async def test_retries_overloaded_controller(self):
+        """Test that 503 and connection errors are retried until success."""
+        calls: list[httpx.Request] = []
+        client = self._client(
+            [
+                httpx.Response(503),
+                httpx.ConnectError("refused"),
+                httpx.Response(200, json=SITE_PAGE),
+            ],
+            calls,
+            max_retries=2,
+        )
+
+        response = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+
+    async def test_gives_up_after_max_retries(self):
+        """Test that the last failed response is returned once retries run out."""
+        calls: list[httpx.Request] = []
+        client = self._client(
+            [httpx.Response(502), httpx.Response(502)], calls, max_retries=1
+        )
+
+        response = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert response.status_code == 502
+        assert len(calls) == 2
+
+    async def test_honors_retry_after(self):
+        """Test that Retry-After sets the delay before the next attempt."""
+        calls: list[httpx.Request] = []
+        client = self._client(
+            [
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json=SITE_PAGE),
+            ],
+            calls,
+            max_retries=1,
+        )
+
+        with patch(
+            "custom_components.unifi_network.api_client.client.asyncio.sleep"
+        ) as mock_sleep:
+            await get_site_overview_page.asyncio_detailed(client=client)
+
+        mock_sleep.assert_awaited_once_with(2.0)
+
+    async def test_retry_after_beyond_max_delay_is_returned(self):
+        """Test that a response asking to wait too long is not retried."""
+        calls: list[httpx.Request] = []
+        client = self._client(
+            [httpx.Response(503, headers={"Retry-After": "120"})],
+            calls,
+            max_retries=3,
+            retry_max_delay=30,
+        )
+
+        response = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert response.status_code == 503
+        assert len(calls) == 1
+
+    def test_backoff_is_jittered_and_bounded(self):
+        """Test that delays are random and capped by the doubling bound."""
+        client = Client(
+            base_url="https://unifi.example.com", retry_backoff=1, retry_max_delay=3
+        )
+
+        with patch(
+            "custom_components.unifi_network.api_client.client.random.uniform",
+            side_effect=lambda low, high: high,
+        ):
+            delays = [client._backoff_delay(attempt) for attempt in range(4)]
+
+        assert delays == [1, 2, 3, 3]
+
+    async def test_disabled_by_default(self):
+        """Test that failures are returned as is unless retries are enabled."""
+        calls: list[httpx.Request] = []
+        client = self._client([httpx.Response(503)], calls)
+
+        response = await get_site_overview_page.asyncio_detailed(client=client)
+
+        assert response.status_code == 503
+        assert len(calls) == 1
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from http import HTTPStatus
 from unittest.mock import AsyncMock, Mock
 
@@ -9,7 +10,10 @@ import pytest
 
 # Import conftest to set up mocks
 import tests.conftest  # noqa: F401
-from custom_components.unifi_network.api_helpers import fetch_all_pages
+from custom_components.unifi_network.api_helpers import (
+    fetch_all_pages,
+    fetch_total_count,
+)
 
 
 class MockResponse:
@@ -151,3 +155,93 @@ class TestFetchAllPages:
 
         assert result == page1_data + page2_data
         assert mock_fetch_func.call_count == 2
+
+    async def test_concurrent_pages_reassembled_in_order(self):
+        """Test that concurrent fetching returns items in offset order."""
+        pages = {
+            0: MockResponse(HTTPStatus.OK, [{"id": "item1"}, {"id": "item2"}], 5),
+            2: MockResponse(HTTPStatus.OK, [{"id": "item3"}, {"id": "item4"}], 5),
+            4: MockResponse(HTTPStatus.OK, [{"id": "item5"}], 5),
+        }
+        delays = {0: 0, 2: 0.02, 4: 0}
+
+        async def fetch(offset, limit, **kwargs):
+            # Later offsets complete first to prove results are reordered
+            await asyncio.sleep(delays[offset])
+            return pages[offset]
+
+        result = await fetch_all_pages(fetch, page_size=2, max_concurrency=4)
+
+        assert [item["id"] for item in result] == [
+            "item1",
+            "item2",
+            "item3",
+            "item4",
+            "item5",
+        ]
+
+    async def test_concurrent_pages_respect_limit(self):
+        """Test that no more than max_concurrency pages are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def fetch(offset, limit, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MockResponse(HTTPStatus.OK, [{"id": offset}], 10)
+
+        result = await fetch_all_pages(fetch, page_size=1, max_concurrency=3)
+
+        assert [item["id"] for item in result] == list(range(10))
+        assert peak == 3
+
+    async def test_concurrent_pages_error_response(self):
+        """Test that a failing page raises the same error as sequential mode."""
+        responses = {
+            0: MockResponse(HTTPStatus.OK, [{"id": "item1"}], 3),
+            1: MockResponse(HTTPStatus.OK, [{"id": "item2"}], 3),
+            2: MockResponse(HTTPStatus.SERVICE_UNAVAILABLE),
+        }
+        mock_fetch_func = AsyncMock(
+            side_effect=lambda offset, limit, **kwargs: responses[offset]
+        )
+
+        with pytest.raises(ValueError, match="API returned status 503"):
+            await fetch_all_pages(mock_fetch_func, page_size=1, max_concurrency=2)
+
+    async def test_concurrent_single_page_makes_one_call(self):
+        """Test that concurrency adds no requests when one page holds everything."""
+        mock_data = [{"id": "item1"}]
+        mock_fetch_func = AsyncMock(
+            return_value=MockResponse(HTTPStatus.OK, mock_data, 1)
+        )
+
+        result = await fetch_all_pages(mock_fetch_func, max_concurrency=4)
+
+        assert result == mock_data
+        mock_fetch_func.assert_called_once_with(offset=0, limit=100)
+
+
+class TestFetchTotalCount:
+    """Test the fetch_total_count helper function."""
+
+    async def test_requests_a_single_item(self):
+        """Test that only one item is requested to read the total count."""
+        mock_fetch_func = AsyncMock(
+            return_value=MockResponse(HTTPStatus.OK, [{"id": "item1"}], 250)
+        )
+
+        assert await fetch_total_count(mock_fetch_func, filter_="x") == 250
+        mock_fetch_func.assert_called_once_with(offset=0, limit=1, filter_="x")
+
+    async def test_error_status(self):
+        """Test that error responses raise like fetch_all_pages."""
+        mock_fetch_func = AsyncMock(
+            return_value=MockResponse(HTTPStatus.SERVICE_UNAVAILABLE)
+        )
+
+        with pytest.raises(ValueError, match="API returned status 503"):
+            await fetch_total_count(mock_fetch_func)
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 # Import conftest to set up mocks
 import tests.conftest
+from custom_components.unifi_network.api_client.models import (
+    ClientOverview,
+    LatestStatisticsForADevice,
+)
 from custom_components.unifi_network.api_client.types import UNSET
 
 # Now import the modules after mocks are set up
@@ -15,6 +21,9 @@ from custom_components.unifi_network.coordinator import (
     UnifiClientCoordinator,
     UnifiDeviceCoordinator,
 )
+from custom_components.unifi_network.scheduler import CircuitBreaker, RequestScheduler
+from custom_components.unifi_network.unifi_client import UnifiClient, UnifiClientRecord
+from custom_components.unifi_network.unifi_device import UnifiDevice
 
 
 @pytest.fixture
@@ -26,7 +35,7 @@ def mock_hass():
 @pytest.fixture
 def mock_api_client():
     """Create a mock API client."""
-    return Mock()
+    return Mock(max_retries=0)
 
 
 @pytest.fixture
@@ -129,6 +138,77 @@ class TestUnifiDeviceCoordinator:
         assert device.latest_statistics == mock_device_statistics
         assert device.details == mock_device_details
 
+    async def test_fetch_devices_interleaves_stats_and_details(
+        self, device_coordinator, mock_device_statistics, mock_device_details
+    ):
+        """Test that stats and details requests are interleaved per device."""
+        overviews = []
+        for index in range(3):
+            overview = Mock()
+            overview.id = f"device-{index}"
+            overviews.append(overview)
+
+        calls: list[tuple[str, str]] = []
+
+        async def fetch_stats(site_id, device_id, client):
+            calls.append(("stats", device_id))
+            return mock_device_statistics
+
+        async def fetch_details(site_id, device_id, client):
+            calls.append(("details", device_id))
+            return mock_device_details
+
+        with (
+            patch(
+                "custom_components.unifi_network.coordinator.fetch_all_pages",
+                return_value=overviews,
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_latest_statistics.asyncio",
+                side_effect=fetch_stats,
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_details.asyncio",
+                side_effect=fetch_details,
+            ),
+        ):
+            result = await device_coordinator._fetch_and_merge()
+
+        assert calls == [
+            ("stats", "device-0"),
+            ("details", "device-0"),
+            ("stats", "device-1"),
+            ("details", "device-1"),
+            ("stats", "device-2"),
+            ("details", "device-2"),
+        ]
+        assert all(
+            device.latest_statistics == mock_device_statistics
+            and device.details == mock_device_details
+            for device in result.values()
+        )
+
+    async def test_fetch_devices_uses_shared_scheduler(
+        self, mock_hass, mock_api_client, mock_device_overview
+    ):
+        """Test that per-device requests go through the provided scheduler."""
+        scheduler = Mock(spec=RequestScheduler)
+        scheduler.run = AsyncMock(return_value=Mock())
+        scheduler.wrap = Mock(side_effect=lambda func: func)
+        coord = UnifiDeviceCoordinator(
+            mock_hass, mock_api_client, "test-site", scheduler=scheduler
+        )
+
+        with patch(
+            "custom_components.unifi_network.coordinator.fetch_all_pages",
+            return_value=[mock_device_overview],
+        ):
+            await coord._fetch_and_merge()
+
+        assert coord.scheduler is scheduler
+        assert scheduler.run.await_count == 2
+        scheduler.wrap.assert_called_once()
+
     async def test_fetch_devices_with_missing_id(self, device_coordinator):
         """Test device fetching when device has no ID."""
         mock_device = Mock()
@@ -194,6 +274,106 @@ class TestUnifiDeviceCoordinator:
         assert device.latest_statistics == mock_device_statistics
         assert device.details is None
 
+    async def _fetch_twice(self, coordinator, overviews, details_mock, now=(0, 0)):
+        """Refresh the coordinator twice and return the second result."""
+        if not isinstance(overviews, tuple):
+            overviews = (overviews, overviews)
+        with (
+            patch(
+                "custom_components.unifi_network.coordinator.fetch_all_pages",
+                side_effect=[[overview] for overview in overviews],
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_latest_statistics.asyncio",
+                return_value=None,
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_details.asyncio",
+                details_mock,
+            ),
+            patch("custom_components.unifi_network.coordinator.time") as mock_time,
+        ):
+            mock_time.monotonic.side_effect = list(now)
+            await coordinator._fetch_and_merge()
+            return await coordinator._fetch_and_merge()
+
+    async def test_fetch_devices_reuses_recent_details(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that details are not refetched before the details interval."""
+        device_coordinator.details_update_interval = 300
+        details_mock = AsyncMock(return_value=mock_device_details)
+        result = await self._fetch_twice(
+            device_coordinator, mock_device_overview, details_mock, now=(0, 10)
+        )
+
+        assert details_mock.await_count == 1
+        assert result["device-123"].details is mock_device_details
+
+    async def test_fetch_devices_refetches_stale_details(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that details are refetched once the details interval elapsed."""
+        details_mock = AsyncMock(return_value=mock_device_details)
+        await self._fetch_twice(
+            device_coordinator,
+            mock_device_overview,
+            details_mock,
+            now=(0, device_coordinator.details_update_interval),
+        )
+
+        assert details_mock.await_count == 2
+
+    async def test_fetch_devices_refetches_details_every_refresh_by_default(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that port and PoE state is current on every refresh by default."""
+        details_mock = AsyncMock(return_value=mock_device_details)
+        await self._fetch_twice(
+            device_coordinator, mock_device_overview, details_mock, now=(0, 10)
+        )
+
+        assert details_mock.await_count == 2
+
+    async def test_fetch_devices_refetches_details_on_state_change(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that an overview state change triggers a details refetch."""
+        device_coordinator.details_update_interval = 300
+        mock_device_overview.state = "ONLINE"
+        mock_device_overview.firmware_version = "1.0.0"
+        mock_device_overview.firmware_updatable = False
+        updating_overview = Mock()
+        updating_overview.id = "device-123"
+        updating_overview.state = "UPDATING"
+        updating_overview.firmware_version = "1.0.0"
+        updating_overview.firmware_updatable = False
+        details_mock = AsyncMock(return_value=mock_device_details)
+        await self._fetch_twice(
+            device_coordinator,
+            (mock_device_overview, updating_overview),
+            details_mock,
+            now=(0, 10),
+        )
+
+        assert details_mock.await_count == 2
+
+    async def test_fetch_devices_refetches_invalidated_details(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that invalidated details are refetched on the next refresh."""
+        device_coordinator.details_update_interval = 300
+        details_mock = AsyncMock(return_value=mock_device_details)
+        await self._fetch_twice(
+            device_coordinator, mock_device_overview, details_mock, now=(0, 10)
+        )
+        device_coordinator.invalidate_details("device-123")
+        await self._fetch_twice(
+            device_coordinator, mock_device_overview, details_mock, now=(20, 30)
+        )
+
+        assert details_mock.await_count == 2
+
     async def test_fetch_devices_api_failure(self, device_coordinator):
         """Test device fetching when main API call fails."""
         with (
@@ -205,6 +385,108 @@ class TestUnifiDeviceCoordinator:
         ):
             await device_coordinator._fetch_and_merge()
 
+    def test_diff_devices_reports_changed_sections(self):
+        """Test that only changed devices and sections are reported."""
+        overview, stats, details = Mock(), Mock(), Mock()
+        previous = {
+            "same": UnifiDevice(overview, stats, details),
+            "stats": UnifiDevice(overview, stats, details),
+            "removed": UnifiDevice(overview, stats, details),
+        }
+        current = {
+            "same": UnifiDevice(overview, stats, details),
+            "stats": UnifiDevice(overview, Mock(), details),
+            "added": UnifiDevice(overview, stats, details),
+        }
+
+        changed = UnifiDeviceCoordinator._diff_devices(previous, current)
+
+        assert "same" not in changed
+        assert ("same", "overview") not in changed
+        assert "stats" in changed
+        assert ("stats", "latest_statistics") in changed
+        assert ("stats", "details") not in changed
+        for device_id in ("removed", "added"):
+            assert device_id in changed
+            assert (device_id, "overview") in changed
+            assert (device_id, "details") in changed
+
+    def test_diff_devices_keeps_lazy_sections_undecoded(self):
+        """Test that lazy sections are compared without decoding their fields."""
+        overview = Mock()
+
+        def _stats(uptime):
+            return LatestStatisticsForADevice.from_dict_lazy(
+                {"uptimeSec": uptime, "interfaces": {"radios": []}}
+            )
+
+        previous = {"same": UnifiDevice(overview, _stats(10), None)}
+        previous["changed"] = UnifiDevice(overview, _stats(10), None)
+        current = {"same": UnifiDevice(overview, _stats(10), None)}
+        current["changed"] = UnifiDevice(overview, _stats(20), None)
+
+        # Fields of a lazy model are decoded through __getattr__ on first access
+        with patch.object(
+            LatestStatisticsForADevice, "__getattr__", autospec=True
+        ) as decode:
+            changed = UnifiDeviceCoordinator._diff_devices(previous, current)
+
+        decode.assert_not_called()
+        assert ("same", "latest_statistics") not in changed
+        assert ("changed", "latest_statistics") in changed
+
+    async def test_update_notifies_only_changed_devices(self, device_coordinator):
+        """Test that listeners of unchanged devices are not called."""
+        overview, stats, details = Mock(), Mock(), Mock()
+        device_coordinator.data = {
+            "device-1": UnifiDevice(overview, stats, details),
+            "device-2": UnifiDevice(overview, stats, details),
+        }
+        new_data = {
+            "device-1": UnifiDevice(overview, Mock(), details),
+            "device-2": UnifiDevice(overview, stats, details),
+        }
+        listeners = {
+            context: Mock()
+            for context in (
+                None,
+                "device-1",
+                ("device-1", "latest_statistics"),
+                ("device-1", "details"),
+                "device-2",
+                ("device-2", "latest_statistics"),
+            )
+        }
+        for context, listener in listeners.items():
+            device_coordinator.async_add_listener(listener, context)
+
+        with patch.object(
+            device_coordinator, "_update_method", AsyncMock(return_value=new_data)
+        ):
+            await device_coordinator._async_update_data()
+        device_coordinator.async_update_listeners()
+
+        called = {context for context, listener in listeners.items() if listener.called}
+        assert called == {None, "device-1", ("device-1", "latest_statistics")}
+
+    async def test_update_notifies_all_after_failed_refresh(self, device_coordinator):
+        """Test that every listener is notified when the previous refresh failed."""
+        device = UnifiDevice(Mock(), Mock(), Mock())
+        device_coordinator.data = {"device-1": device}
+        device_coordinator.last_update_success = False
+        listener = Mock()
+        device_coordinator.async_add_listener(listener, ("device-1", "details"))
+
+        with patch.object(
+            device_coordinator,
+            "_update_method",
+            AsyncMock(return_value={"device-1": device}),
+        ):
+            await device_coordinator._async_update_data()
+        device_coordinator.async_update_listeners()
+
+        listener.assert_called_once()
+
     def test_get_device_existing(self, device_coordinator, mock_device_overview):
         """Test getting an existing device."""
         # Set up coordinator with data
@@ -345,7 +627,7 @@ class TestUnifiClientCoordinator:
     ):
         """Test that known_clients are updated."""
         # Pre-populate known_clients
-        existing_client = Mock()
+        existing_client = Mock(spec=UnifiClient)
         existing_client.id = "client-456"
         client_coordinator.known_clients = {"client-456": existing_client}
 
@@ -366,6 +648,250 @@ class TestUnifiClientCoordinator:
         # Verify update method was called
         existing_client.update.assert_called_once()
 
+    async def test_fetch_clients_compacts_disconnected_clients(
+        self, client_coordinator, mock_client_overview
+    ):
+        """Test that disconnected clients are kept as compact records."""
+        mock_client_overview.connected_at = UNSET
+        mock_client_overview.type_ = "WIRELESS"
+        mock_client_overview.additional_properties = {
+            "macAddress": "ff:ee:dd:cc:bb:aa",
+            "uplinkDeviceId": "device-123",
+        }
+
+        with patch(
+            "custom_components.unifi_network.coordinator.fetch_all_pages",
+            side_effect=[[mock_client_overview], [], [mock_client_overview]],
+        ):
+            client_coordinator.data = await client_coordinator._fetch_and_merge()
+            client_coordinator.data = await client_coordinator._fetch_and_merge()
+
+            record = client_coordinator.get_client("client-456")
+            assert isinstance(record, UnifiClientRecord)
+            assert record.mac == "ff:ee:dd:cc:bb:aa"
+            assert record.name == "Test Client"
+            assert record.ip == "192.168.1.20"
+            assert record.uplink_device_id == "device-123"
+            assert record.type_ == "WIRELESS"
+            assert record.connected_at is None
+            assert record.last_seen is not None
+
+            # Reconnecting restores the full client
+            client_coordinator.data = await client_coordinator._fetch_and_merge()
+
+        client = client_coordinator.get_client("client-456")
+        assert isinstance(client, UnifiClient)
+        assert client.overview is mock_client_overview
+
+    async def test_malformed_client_does_not_wedge_refreshes(
+        self, client_coordinator, mock_client_overview
+    ):
+        """Test that a client whose fields cannot be decoded still disconnects."""
+        malformed = ClientOverview.from_dict_lazy(
+            {
+                "type": "WIRED",
+                "id": "497f6eca-6276-4993-bfeb-53cbbbba6f08",
+                "name": "Desktop",
+                "access": {"type": "DEFAULT"},
+                "connectedAt": "not a timestamp",
+            }
+        )
+
+        with patch(
+            "custom_components.unifi_network.coordinator.fetch_all_pages",
+            side_effect=[[mock_client_overview, malformed], [mock_client_overview]],
+        ):
+            client_coordinator.data = await client_coordinator._fetch_and_merge()
+            result = await client_coordinator._fetch_and_merge()
+
+        assert set(result) == {"client-456"}
+        record = client_coordinator.get_client(str(malformed.id))
+        assert isinstance(record, UnifiClientRecord)
+        assert record.connected_at is None
+
+    @staticmethod
+    def _record(client_id, last_seen):
+        """Create a compact record of an offline client."""
+        return UnifiClientRecord(
+            id=client_id,
+            mac=None,
+            name=None,
+            ip=None,
+            uplink_device_id=None,
+            type_=None,
+            last_seen=last_seen,
+            connected_at=None,
+        )
+
+    def test_evict_known_clients_by_ttl(self, client_coordinator):
+        """Test that offline clients unseen for longer than the TTL are evicted."""
+        now = datetime(2024, 6, 1, tzinfo=UTC)
+        client_coordinator.known_clients_ttl_days = 30
+        client_coordinator.known_clients = {
+            "old": self._record("old", now - timedelta(days=31)),
+            "recent": self._record("recent", now - timedelta(days=29)),
+            "connected": self._record("connected", now),
+        }
+
+        client_coordinator._evict_known_clients(now, {"connected": Mock()})
+
+        assert list(client_coordinator.known_clients) == ["recent", "connected"]
+
+    def test_known_clients_kept_forever_by_default(self, client_coordinator):
+        """Test that offline clients are only evicted once a TTL is configured."""
+        now = datetime(2024, 6, 1, tzinfo=UTC)
+        client_coordinator.known_clients = {
+            "old": self._record("old", now - timedelta(days=3650)),
+        }
+
+        assert client_coordinator._evict_known_clients(now, {}) == 0
+        assert list(client_coordinator.known_clients) == ["old"]
+
+    def test_evict_known_clients_by_size(self, client_coordinator):
+        """Test that the least recently seen clients are evicted beyond max size."""
+        now = datetime(2024, 6, 1, tzinfo=UTC)
+        client_coordinator.known_clients_ttl_days = 0
+        client_coordinator.known_clients_max_size = 2
+        client_coordinator.known_clients = {
+            client_id: self._record(client_id, now) for client_id in "abcd"
+        }
+
+        client_coordinator._evict_known_clients(now, {})
+
+        assert list(client_coordinator.known_clients) == ["c", "d"]
+
+    def test_evict_known_clients_keeps_connected(self, client_coordinator):
+        """Test that connected clients are never evicted, even beyond max size."""
+        now = datetime(2024, 6, 1, tzinfo=UTC)
+        client_coordinator.known_clients_max_size = 1
+        client_coordinator.known_clients = {
+            "a": self._record("a", now),
+            "b": self._record("b", now),
+        }
+
+        client_coordinator._evict_known_clients(now, {"a": Mock(), "b": Mock()})
+
+        assert list(client_coordinator.known_clients) == ["a", "b"]
+
+    def test_evict_known_clients_is_incremental(self, client_coordinator):
+        """Test that a single refresh evicts at most one batch of clients."""
+        now = datetime(2024, 6, 1, tzinfo=UTC)
+        client_coordinator.known_clients_ttl_days = 30
+        client_coordinator.known_clients = {
+            str(index): self._record(str(index), now - timedelta(days=365))
+            for index in range(5)
+        }
+
+        with patch(
+            "custom_components.unifi_network.coordinator.KNOWN_CLIENTS_EVICTION_BATCH",
+            2,
+        ):
+            client_coordinator._evict_known_clients(now, {})
+
+        assert list(client_coordinator.known_clients) == ["2", "3", "4"]
+
+    async def test_fetch_clients_moves_seen_clients_to_recent_end(
+        self, client_coordinator, mock_client_overview
+    ):
+        """Test that clients seen in a refresh become the most recently seen."""
+        client_coordinator.known_clients = {
+            "client-456": self._record("client-456", None),
+            "offline": self._record("offline", datetime(2023, 1, 1, tzinfo=UTC)),
+        }
+
+        with patch(
+            "custom_components.unifi_network.coordinator.fetch_all_pages",
+            return_value=[mock_client_overview],
+        ):
+            await client_coordinator._fetch_and_merge()
+
+        assert list(client_coordinator.known_clients) == ["offline", "client-456"]
+
+    async def test_fetch_clients_restores_stored_known_clients(
+        self, mock_hass, mock_api_client, mock_client_overview
+    ):
+        """Test that known clients saved before a restart are restored."""
+        store = tests.conftest.MockStore(
+            data={
+                "clients": {
+                    "offline": {
+                        "mac": "00:11:22:33:44:55",
+                        "name": "Offline Client",
+                        "last_seen": "2023-01-01T00:00:00+00:00",
+                    },
+                    "client-456": {"name": "Old Name"},
+                }
+            }
+        )
+        coord = UnifiClientCoordinator(
+            mock_hass, mock_api_client, "test-site", store=store
+        )
+
+        with patch(
+            "custom_components.unifi_network.coordinator.fetch_all_pages",
+            return_value=[mock_client_overview],
+        ):
+            await coord._fetch_and_merge()
+
+        record = coord.get_client("offline")
+        assert isinstance(record, UnifiClientRecord)
+        assert record.mac == "00:11:22:33:44:55"
+        assert record.last_seen == datetime(2023, 1, 1, tzinfo=UTC)
+        assert isinstance(coord.get_client("client-456"), UnifiClient)
+        assert list(coord.known_clients) == ["offline", "client-456"]
+
+    async def test_fetch_clients_saves_changed_known_clients(
+        self, mock_hass, mock_api_client, mock_client_overview
+    ):
+        """Test that new and disconnected clients are saved, debounced."""
+        mock_client_overview.additional_properties = {}
+        store = tests.conftest.MockStore()
+        coord = UnifiClientCoordinator(
+            mock_hass, mock_api_client, "test-site", store=store
+        )
+
+        with patch(
+            "custom_components.unifi_network.coordinator.fetch_all_pages",
+            side_effect=[[mock_client_overview], [mock_client_overview], []],
+        ):
+            coord.data = await coord._fetch_and_merge()
+            store.flush_delayed_save()
+            assert store.data["clients"]["client-456"]["name"] == "Test Client"
+
+            # Nothing changed, no save scheduled
+            coord.data = await coord._fetch_and_merge()
+            assert store.delayed_save is None
+
+            coord.data = await coord._fetch_and_merge()
+            store.flush_delayed_save()
+
+        assert (
+            store.data["clients"]["client-456"] == coord._stored_clients["client-456"]
+        )
+
+    async def test_save_known_clients_writes_immediately(
+        self, mock_hass, mock_api_client, mock_client_overview
+    ):
+        """Test that known clients can be flushed on unload."""
+        mock_client_overview.additional_properties = {}
+        store = tests.conftest.MockStore()
+        coord = UnifiClientCoordinator(
+            mock_hass, mock_api_client, "test-site", store=store
+        )
+
+        await coord.async_save_known_clients()
+        assert store.data is None
+
+        with patch(
+            "custom_components.unifi_network.coordinator.fetch_all_pages",
+            return_value=[mock_client_overview],
+        ):
+            await coord._fetch_and_merge()
+        await coord.async_save_known_clients()
+
+        assert list(store.data["clients"]) == ["client-456"]
+        assert store.delayed_save is None
+
     def test_get_client_existing(self, client_coordinator, mock_client_overview):
         """Test getting an existing client."""
         # Set up coordinator with known clients
@@ -425,3 +951,581 @@ class TestUnifiClientCoordinator:
         assert (
             mock_fetch.call_args.kwargs["filter_"] == "not(ipAddress.eq('192.168.1.1'))"
         )
+
+    async def test_keep_raw_payloads(self, mock_hass, mock_api_client):
+        """Test that the decoded page items are kept as is when enabled."""
+        source = {
+            "type": "WIRED",
+            "id": "497f6eca-6276-4993-bfeb-53cbbbba6f08",
+            "name": "Laptop",
+            "access": {"type": "DEFAULT"},
+        }
+        coord = UnifiClientCoordinator(
+            mock_hass, mock_api_client, "test-site", keep_raw_payloads=True
+        )
+
+        with patch(
+            "custom_components.unifi_network.coordinator.fetch_all_pages",
+            return_value=[ClientOverview.from_dict_lazy(source)],
+        ):
+            await coord._fetch_and_merge()
+
+        assert coord.raw_payloads == {source["id"]: source}
+        assert coord.raw_payloads[source["id"]] is source
+
+    async def test_raw_payloads_not_kept_by_default(
+        self, client_coordinator, mock_client_overview
+    ):
+        """Test that raw payloads are only kept when enabled."""
+        with patch(
+            "custom_components.unifi_network.coordinator.fetch_all_pages",
+            return_value=[mock_client_overview],
+        ):
+            await client_coordinator._fetch_and_merge()
+
+        assert client_coordinator.raw_payloads == {}
+        mock_client_overview.to_dict.assert_not_called()
+
+
+def _connected_client(client_id: str, connected_at: datetime) -> Mock:
+    """Return a mock client overview connected at connected_at."""
+    client = Mock()
+    client.id = client_id
+    client.connected_at = connected_at
+    return client
+
+
+class TestIncrementalClientPolling:
+    """Test fetching only newly connected clients between full sweeps."""
+
+    @pytest.fixture
+    def coordinator(self, mock_hass, mock_api_client):
+        """Create a client coordinator polling incrementally."""
+        return UnifiClientCoordinator(
+            mock_hass,
+            mock_api_client,
+            "test-site",
+            filter_="type.eq('WIRED')",
+            incremental_polling=True,
+            reconciliation_interval=300,
+        )
+
+    async def _refresh(self, coordinator, pages, total_count=None):
+        """Run a refresh returning pages and store the result as data."""
+        with (
+            patch(
+                "custom_components.unifi_network.coordinator.fetch_all_pages",
+                side_effect=pages,
+            ) as mock_fetch,
+            patch(
+                "custom_components.unifi_network.coordinator.fetch_total_count",
+                return_value=total_count,
+            ) as mock_count,
+        ):
+            coordinator.data = await coordinator._fetch_and_merge()
+        return mock_fetch, mock_count
+
+    async def test_fetches_only_new_connections(self, coordinator):
+        """Test that a matching count keeps clients fetched before."""
+        first = _connected_client("a", datetime(2024, 1, 1, 12, tzinfo=UTC))
+        second = _connected_client("b", datetime(2024, 1, 1, 12, 5, tzinfo=UTC))
+        await self._refresh(coordinator, [[first]])
+
+        mock_fetch, mock_count = await self._refresh(
+            coordinator, [[second]], total_count=2
+        )
+
+        assert mock_fetch.call_args.kwargs["filter_"] == (
+            "and(type.eq('WIRED'), connectedAt.ge(2024-01-01T12:00:00Z))"
+        )
+        assert mock_count.call_args.kwargs["filter_"] == "type.eq('WIRED')"
+        assert coordinator.data.keys() == {"a", "b"}
+        assert coordinator.data["a"].overview is first
+        assert coordinator._connected_watermark == second.connected_at
+
+    async def test_count_mismatch_reconciles(self, coordinator):
+        """Test that a disconnect detected by the count triggers a full sweep."""
+        first = _connected_client("a", datetime(2024, 1, 1, 12, tzinfo=UTC))
+        second = _connected_client("b", datetime(2024, 1, 1, 12, 5, tzinfo=UTC))
+        await self._refresh(coordinator, [[first, second]])
+
+        mock_fetch, _ = await self._refresh(coordinator, [[], [second]], total_count=1)
+
+        assert mock_fetch.call_count == 2
+        assert mock_fetch.call_args.kwargs["filter_"] == "type.eq('WIRED')"
+        assert coordinator.data.keys() == {"b"}
+        assert isinstance(coordinator.known_clients["a"], UnifiClientRecord)
+
+    async def test_repeated_mismatch_pauses_incremental_polling(self, coordinator):
+        """Test that clients missed on every incremental refresh pause it."""
+        first = _connected_client("a", datetime(2024, 1, 1, 12, tzinfo=UTC))
+        await self._refresh(coordinator, [[first]])
+
+        # Each refresh a client without connectedAt connects
+        connected = [first]
+        for client_id in ("b", "c"):
+            connected.append(_connected_client(client_id, None))
+            mock_fetch, _ = await self._refresh(
+                coordinator, [[], list(connected)], total_count=len(connected)
+            )
+            assert mock_fetch.call_count == 2
+
+        mock_fetch, mock_count = await self._refresh(coordinator, [[first]])
+
+        mock_count.assert_not_called()
+        assert mock_fetch.call_args.kwargs["filter_"] == "type.eq('WIRED')"
+
+        coordinator._incremental_resume_at -= 300
+        _, mock_count = await self._refresh(coordinator, [[]], total_count=1)
+
+        mock_count.assert_called_once()
+
+    async def test_reconciles_after_interval(self, coordinator):
+        """Test that a full sweep runs once the reconciliation interval passed."""
+        first = _connected_client("a", datetime(2024, 1, 1, 12, tzinfo=UTC))
+        await self._refresh(coordinator, [[first]])
+        coordinator._last_full_sweep -= 300
+
+        mock_fetch, mock_count = await self._refresh(coordinator, [[first]])
+
+        mock_count.assert_not_called()
+        assert mock_fetch.call_args.kwargs["filter_"] == "type.eq('WIRED')"
+
+    async def test_disabled_by_default(self, client_coordinator):
+        """Test that every refresh is a full sweep unless enabled."""
+        first = _connected_client("a", datetime(2024, 1, 1, 12, tzinfo=UTC))
+        await self._refresh(client_coordinator, [[first]])
+
+        mock_fetch, mock_count = await self._refresh(client_coordinator, [[first]])
+
+        mock_count.assert_not_called()
+        assert mock_fetch.call_args.kwargs["filter_"] is UNSET
+
+
+class TestAdaptiveUpdateInterval:
+    """Test adapting the refresh interval to the change rate."""
+
+    async def test_fixed_interval_by_default(self, device_coordinator):
+        """Test that equal bounds keep the default interval."""
+        device_coordinator._update_method = AsyncMock(return_value={})
+
+        await device_coordinator._async_update_data()
+
+        assert device_coordinator.update_interval == timedelta(seconds=30)
+
+    async def test_client_churn_shortens_interval(self, mock_hass, mock_api_client):
+        """Test that connects and disconnects shorten the interval."""
+        coord = UnifiClientCoordinator(
+            mock_hass,
+            mock_api_client,
+            "test-site",
+            min_update_interval=10,
+            max_update_interval=120,
+        )
+        coord.data = {"a": Mock(), "b": Mock()}
+        coord._update_method = AsyncMock(return_value={"a": Mock(), "c": Mock()})
+
+        await coord._async_update_data()
+
+        assert coord.update_interval == timedelta(seconds=15)
+
+    async def test_quiet_devices_lengthen_interval(self, mock_hass, mock_api_client):
+        """Test that changing statistics alone do not count as churn."""
+        coord = UnifiDeviceCoordinator(
+            mock_hass,
+            mock_api_client,
+            "test-site",
+            min_update_interval=10,
+            max_update_interval=120,
+        )
+        overview = Mock()
+        coord.data = {"a": UnifiDevice(overview, Mock(), None)}
+        coord._update_method = AsyncMock(
+            return_value={"a": UnifiDevice(overview, Mock(), None)}
+        )
+
+        await coord._async_update_data()
+
+        assert coord.update_interval == timedelta(seconds=37.5)
+        assert ("a", "latest_statistics") in coord._changed_contexts
+
+    async def test_failure_backs_off(self, mock_hass, mock_api_client):
+        """Test that a failed refresh lengthens the interval."""
+        coord = UnifiClientCoordinator(
+            mock_hass,
+            mock_api_client,
+            "test-site",
+            min_update_interval=10,
+            max_update_interval=120,
+        )
+        coord._update_method = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            await coord._async_update_data()
+
+        assert coord.update_interval == timedelta(seconds=60)
+
+
+class TestCircuitBreaker:
+    """Test pausing the coordinators of an entry while the controller fails."""
+
+    async def test_open_breaker_skips_refresh(self, mock_hass, mock_api_client):
+        """Test that no request is sent while the shared breaker is open."""
+        breaker = CircuitBreaker(threshold=1)
+        devices = UnifiDeviceCoordinator(
+            mock_hass, mock_api_client, "test-site", circuit_breaker=breaker
+        )
+        clients = UnifiClientCoordinator(
+            mock_hass, mock_api_client, "test-site", circuit_breaker=breaker
+        )
+        devices._update_method = AsyncMock(side_effect=RuntimeError("boom"))
+        clients._update_method = AsyncMock(return_value={})
+
+        with pytest.raises(RuntimeError):
+            await devices._async_update_data()
+        with pytest.raises(tests.conftest.UpdateFailed):
+            await clients._async_update_data()
+
+        assert breaker.is_open
+        clients._update_method.assert_not_awaited()
+
+    async def test_cancelled_probe_allows_another(self, mock_hass, mock_api_client):
+        """Test that polling resumes when the probing refresh is cancelled."""
+        breaker = CircuitBreaker(threshold=1, cooldown=0)
+        coord = UnifiClientCoordinator(
+            mock_hass, mock_api_client, "test-site", circuit_breaker=breaker
+        )
+        coord._update_method = AsyncMock(
+            side_effect=[RuntimeError("boom"), asyncio.CancelledError(), {}]
+        )
+
+        with pytest.raises(RuntimeError):
+            await coord._async_update_data()
+        with pytest.raises(asyncio.CancelledError):
+            await coord._async_update_data()
+        await coord._async_update_data()
+
+        assert coord._update_method.await_count == 3
+        assert not breaker.is_open
+
+    async def test_success_closes_breaker(self, mock_hass, mock_api_client):
+        """Test that a successful refresh resets the failure count."""
+        breaker = CircuitBreaker(threshold=2)
+        coord = UnifiClientCoordinator(
+            mock_hass, mock_api_client, "test-site", circuit_breaker=breaker
+        )
+        coord._update_method = AsyncMock(side_effect=[RuntimeError("boom"), {}])
+
+        with pytest.raises(RuntimeError):
+            await coord._async_update_data()
+        await coord._async_update_data()
+
+        assert breaker.failures == 0
+        assert not breaker.is_open
+
+    @pytest.mark.parametrize(
+        ("details", "opened"), [(None, True), (Mock(), False)], ids=["all", "half"]
+    )
+    async def test_mostly_failed_device_requests_count_as_failure(
+        self, mock_hass, mock_api_client, mock_device_overview, details, opened
+    ):
+        """Test that a refresh with most device requests failing opens the breaker."""
+        breaker = CircuitBreaker(threshold=1)
+        coord = UnifiDeviceCoordinator(
+            mock_hass, mock_api_client, "test-site", circuit_breaker=breaker
+        )
+
+        with (
+            patch(
+                "custom_components.unifi_network.coordinator.fetch_all_pages",
+                return_value=[mock_device_overview],
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_latest_statistics.asyncio",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_details.asyncio",
+                AsyncMock(return_value=details),
+            ),
+        ):
+            result = await coord._async_update_data()
+
+        assert "device-123" in result
+        assert breaker.is_open is opened
+
+
+class TestHeartbeatStatistics:
+    """Test fetching statistics only once a new heartbeat is due."""
+
+    NOW = datetime(2023, 1, 1, tzinfo=UTC)
+
+    def _statistics(self, next_heartbeat_in: float) -> Mock:
+        """Return statistics announcing the next heartbeat in the given seconds."""
+        stats = Mock()
+        stats.next_heartbeat_at = self.NOW + timedelta(seconds=next_heartbeat_in)
+        return stats
+
+    async def _fetch_twice(self, coordinator, overviews, stats_mock, now=(0, 10)):
+        """Refresh the coordinator twice and return the second result."""
+        if not isinstance(overviews, tuple):
+            overviews = (overviews, overviews)
+        with (
+            patch(
+                "custom_components.unifi_network.coordinator.fetch_all_pages",
+                side_effect=[[overview] for overview in overviews],
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_latest_statistics.asyncio",
+                stats_mock,
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_details.asyncio",
+                return_value=None,
+            ),
+            patch("custom_components.unifi_network.coordinator.time") as mock_time,
+        ):
+            mock_time.monotonic.side_effect = list(now)
+            await coordinator._fetch_and_merge()
+            return await coordinator._fetch_and_merge()
+
+    async def test_reuses_statistics_until_heartbeat(
+        self, device_coordinator, mock_device_overview
+    ):
+        """Test that statistics are not refetched before the next heartbeat."""
+        stats = self._statistics(30)
+        stats_mock = AsyncMock(return_value=stats)
+
+        result = await self._fetch_twice(
+            device_coordinator, mock_device_overview, stats_mock
+        )
+
+        assert stats_mock.await_count == 1
+        assert result["device-123"].latest_statistics is stats
+
+    async def test_heartbeat_without_offset_is_utc(
+        self, device_coordinator, mock_device_overview
+    ):
+        """Test that a heartbeat timestamp without an offset is read as UTC."""
+        stats = Mock()
+        stats.next_heartbeat_at = (self.NOW + timedelta(seconds=30)).replace(
+            tzinfo=None
+        )
+        stats_mock = AsyncMock(return_value=stats)
+
+        result = await self._fetch_twice(
+            device_coordinator, mock_device_overview, stats_mock
+        )
+
+        assert stats_mock.await_count == 1
+        assert result["device-123"].latest_statistics is stats
+
+    async def test_refetches_after_heartbeat(
+        self, device_coordinator, mock_device_overview
+    ):
+        """Test that statistics are refetched once the heartbeat has passed."""
+        stats_mock = AsyncMock(return_value=self._statistics(0))
+
+        await self._fetch_twice(device_coordinator, mock_device_overview, stats_mock)
+
+        assert stats_mock.await_count == 2
+
+    async def test_refetches_after_max_age(
+        self, device_coordinator, mock_device_overview
+    ):
+        """Test that a heartbeat announced far ahead does not freeze statistics."""
+        stats_mock = AsyncMock(return_value=self._statistics(3600))
+
+        await self._fetch_twice(
+            device_coordinator, mock_device_overview, stats_mock, now=(0, 300)
+        )
+
+        assert stats_mock.await_count == 2
+
+    async def test_refetches_on_state_change(
+        self, device_coordinator, mock_device_overview
+    ):
+        """Test that an overview state change triggers a statistics refetch."""
+        mock_device_overview.state = "ONLINE"
+        offline_overview = Mock()
+        offline_overview.id = "device-123"
+        offline_overview.state = "OFFLINE"
+        offline_overview.firmware_version = mock_device_overview.firmware_version
+        offline_overview.firmware_updatable = mock_device_overview.firmware_updatable
+        stats_mock = AsyncMock(return_value=self._statistics(30))
+
+        await self._fetch_twice(
+            device_coordinator,
+            (mock_device_overview, offline_overview),
+            stats_mock,
+        )
+
+        assert stats_mock.await_count == 2
+
+    async def test_failed_statistics_are_refetched(
+        self, device_coordinator, mock_device_overview
+    ):
+        """Test that a failed statistics request is retried on the next refresh."""
+        stats_mock = AsyncMock(side_effect=[RuntimeError("boom"), self._statistics(30)])
+
+        result = await self._fetch_twice(
+            device_coordinator, mock_device_overview, stats_mock
+        )
+
+        assert stats_mock.await_count == 2
+        assert result["device-123"].latest_statistics is not None
+
+
+class TestPartialFailureRetention:
+    """Test keeping the last fetched sections of devices whose requests fail."""
+
+    async def _refresh(self, coordinator, overview, stats_mock, details_mock, now):
+        """Refresh the coordinator once at the given monotonic time."""
+        with (
+            patch(
+                "custom_components.unifi_network.coordinator.fetch_all_pages",
+                return_value=[overview],
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_latest_statistics.asyncio",
+                stats_mock,
+            ),
+            patch(
+                "custom_components.unifi_network.coordinator.get_adopted_device_details.asyncio",
+                details_mock,
+            ),
+            patch("custom_components.unifi_network.coordinator.time") as mock_time,
+        ):
+            mock_time.monotonic.return_value = now
+            return await coordinator._fetch_and_merge()
+
+    async def test_failed_request_is_retried_in_same_refresh(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that only the failed request is retried before merging."""
+        stats = Mock()
+        stats_mock = AsyncMock(side_effect=[RuntimeError("boom"), stats])
+        details_mock = AsyncMock(return_value=mock_device_details)
+
+        result = await self._refresh(
+            device_coordinator, mock_device_overview, stats_mock, details_mock, 0
+        )
+
+        assert stats_mock.await_count == 2
+        assert details_mock.await_count == 1
+        assert result["device-123"].latest_statistics is stats
+
+    async def test_failed_request_not_retried_when_client_retries(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that requests the client already retried are not repeated."""
+        device_coordinator.client.max_retries = 2
+        stats_mock = AsyncMock(side_effect=[RuntimeError("boom"), Mock()])
+        details_mock = AsyncMock(return_value=None)
+
+        result = await self._refresh(
+            device_coordinator, mock_device_overview, stats_mock, details_mock, 0
+        )
+
+        assert stats_mock.await_count == 1
+        assert details_mock.await_count == 1
+        assert result["device-123"].latest_statistics is None
+
+    async def test_keeps_last_statistics_when_retry_fails(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that statistics fetched before are kept and reported as stale."""
+        stats = Mock()
+        details_mock = AsyncMock(return_value=mock_device_details)
+        await self._refresh(
+            device_coordinator,
+            mock_device_overview,
+            AsyncMock(return_value=stats),
+            details_mock,
+            0,
+        )
+
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        result = await self._refresh(
+            device_coordinator, mock_device_overview, failing, details_mock, 400
+        )
+
+        assert failing.await_count == 2
+        assert result["device-123"].latest_statistics is stats
+        assert device_coordinator._stats_cache["device-123"][1] == 0
+
+    async def test_keeps_last_sections_on_error_status(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that an error status, returned as None, counts as a failure."""
+        stats = Mock()
+        await self._refresh(
+            device_coordinator,
+            mock_device_overview,
+            AsyncMock(return_value=stats),
+            AsyncMock(return_value=mock_device_details),
+            0,
+        )
+
+        stats_mock = AsyncMock(return_value=None)
+        details_mock = AsyncMock(return_value=None)
+        result = await self._refresh(
+            device_coordinator,
+            mock_device_overview,
+            stats_mock,
+            details_mock,
+            device_coordinator.details_update_interval,
+        )
+
+        assert stats_mock.await_count == 2
+        assert details_mock.await_count == 2
+        assert result["device-123"].latest_statistics is stats
+        assert result["device-123"].details is mock_device_details
+
+    async def test_stale_statistics_expire(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that statistics are dropped once kept for too long."""
+        details_mock = AsyncMock(return_value=mock_device_details)
+        await self._refresh(
+            device_coordinator,
+            mock_device_overview,
+            AsyncMock(return_value=Mock()),
+            details_mock,
+            0,
+        )
+
+        result = await self._refresh(
+            device_coordinator,
+            mock_device_overview,
+            AsyncMock(side_effect=RuntimeError("boom")),
+            details_mock,
+            1300,
+        )
+
+        assert result["device-123"].latest_statistics is None
+        assert "device-123" not in device_coordinator._stats_cache
+
+    async def test_keeps_last_details_when_retry_fails(
+        self, device_coordinator, mock_device_overview, mock_device_details
+    ):
+        """Test that details fetched before are kept when refetching fails."""
+        stats_mock = AsyncMock(return_value=None)
+        await self._refresh(
+            device_coordinator,
+            mock_device_overview,
+            stats_mock,
+            AsyncMock(return_value=mock_device_details),
+            0,
+        )
+
+        result = await self._refresh(
+            device_coordinator,
+            mock_device_overview,
+            stats_mock,
+            AsyncMock(side_effect=RuntimeError("boom")),
+            device_coordinator.details_update_interval,
+        )
+
+        assert result["device-123"].details is mock_device_details
+        assert "device-123" in device_coordinator._details_cache
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 
-from custom_components.unifi_network.core import UnifiNetworkCore
+from custom_components.unifi_network.const import (
+    REQUEST_MAX_RETRIES,
+    REQUEST_RETRY_BACKOFF,
+    REQUEST_RETRY_MAX_DELAY,
+)
+from custom_components.unifi_network.core import UnifiNetworkCore, create_transport
 
 
 @pytest.fixture
@@ -62,13 +67,23 @@ async def test_init_creates_client_and_async_init_refreshes_coordinators(
         mock_hass,
         verify_ssl=True,
         base_url="https://unifi.example.com",
+        transport=ANY,
     )
 
     # Verify headers were added to the httpx client during __init__
     mock_httpx_client.headers.update.assert_called_once_with({"X-API-Key": "test-key"})
 
     # Verify Client was called with correct parameters during __init__
-    mock_client_class.assert_called_once_with(base_url="https://unifi.example.com")
+    mock_client_class.assert_called_once_with(
+        base_url="https://unifi.example.com",
+        retain_response_content=False,
+        lazy_models=True,
+        coalesce_requests=True,
+        conditional_requests=True,
+        max_retries=REQUEST_MAX_RETRIES,
+        retry_backoff=REQUEST_RETRY_BACKOFF,
+        retry_max_delay=REQUEST_RETRY_MAX_DELAY,
+    )
 
     # Verify set_async_httpx_client was called during __init__
     mock_client.set_async_httpx_client.assert_called_once_with(mock_httpx_client)
@@ -123,13 +138,23 @@ async def test_init_respects_verify_ssl_false(
         mock_hass,
         verify_ssl=False,
         base_url="https://unifi.example.com",
+        transport=ANY,
     )
 
     # Verify headers were added to the httpx client during __init__
     mock_httpx_client.headers.update.assert_called_once_with({"X-API-Key": "test-key"})
 
     # Verify Client was called with correct parameters during __init__
-    mock_client_class.assert_called_once_with(base_url="https://unifi.example.com")
+    mock_client_class.assert_called_once_with(
+        base_url="https://unifi.example.com",
+        retain_response_content=False,
+        lazy_models=True,
+        coalesce_requests=True,
+        conditional_requests=True,
+        max_retries=REQUEST_MAX_RETRIES,
+        retry_backoff=REQUEST_RETRY_BACKOFF,
+        retry_max_delay=REQUEST_RETRY_MAX_DELAY,
+    )
 
     # Verify set_async_httpx_client was called during __init__
     mock_client.set_async_httpx_client.assert_called_once_with(mock_httpx_client)
@@ -177,13 +202,23 @@ async def test_init_without_coordinators(
         mock_hass,
         verify_ssl=True,
         base_url="https://unifi.example.com",
+        transport=ANY,
     )
 
     # Verify headers were added to the httpx client during __init__
     mock_httpx_client.headers.update.assert_called_once_with({"X-API-Key": "test-key"})
 
     # Verify Client was called with correct parameters during __init__
-    mock_client_class.assert_called_once_with(base_url="https://unifi.example.com")
+    mock_client_class.assert_called_once_with(
+        base_url="https://unifi.example.com",
+        retain_response_content=False,
+        lazy_models=True,
+        coalesce_requests=True,
+        conditional_requests=True,
+        max_retries=REQUEST_MAX_RETRIES,
+        retry_backoff=REQUEST_RETRY_BACKOFF,
+        retry_max_delay=REQUEST_RETRY_MAX_DELAY,
+    )
 
     # Verify set_async_httpx_client was called during __init__
     mock_client.set_async_httpx_client.assert_called_once_with(mock_httpx_client)
@@ -318,13 +353,23 @@ async def test_init_without_api_key(
         mock_hass,
         verify_ssl=True,
         base_url="https://unifi.example.com",
+        transport=ANY,
     )
 
     # Verify headers were NOT updated when api_key is None
     mock_httpx_client.headers.update.assert_not_called()
 
     # Verify Client was called with correct parameters during __init__
-    mock_client_class.assert_called_once_with(base_url="https://unifi.example.com")
+    mock_client_class.assert_called_once_with(
+        base_url="https://unifi.example.com",
+        retain_response_content=False,
+        lazy_models=True,
+        coalesce_requests=True,
+        conditional_requests=True,
+        max_retries=REQUEST_MAX_RETRIES,
+        retry_backoff=REQUEST_RETRY_BACKOFF,
+        retry_max_delay=REQUEST_RETRY_MAX_DELAY,
+    )
 
     # Verify set_async_httpx_client was called during __init__
     mock_client.set_async_httpx_client.assert_called_once_with(mock_httpx_client)
@@ -339,3 +384,75 @@ async def test_init_without_api_key(
 
     # Since coordinators are disabled, no refresh calls should be made
     # This completes successfully without any coordinator operations
+
+
+@patch("custom_components.unifi_network.core.create_async_httpx_client")
+@patch("custom_components.unifi_network.core.Client")
+@patch("custom_components.unifi_network.core.UnifiDeviceCoordinator")
+@patch("custom_components.unifi_network.core.UnifiClientCoordinator")
+@pytest.mark.asyncio
+async def test_init_shares_scheduler_between_coordinators(
+    mock_client_coordinator,
+    mock_device_coordinator,
+    mock_client_class,
+    mock_create_client,
+    mock_hass,
+):
+    """Test that both coordinators route requests through one scheduler."""
+    mock_httpx_client = Mock()
+    mock_httpx_client.headers = Mock()
+    mock_client_class.return_value = Mock()
+    mock_create_client.return_value = mock_httpx_client
+
+    core = UnifiNetworkCore(
+        hass=mock_hass,
+        base_url="https://unifi.example.com",
+        site_id="default",
+        api_key="test-key",
+        max_concurrent_requests=4,
+        max_requests_per_second=2.5,
+    )
+
+    assert core.scheduler.max_concurrent_requests == 4
+    assert core.scheduler.max_requests_per_second == 2.5
+    assert mock_device_coordinator.call_args.kwargs["scheduler"] is core.scheduler
+    assert mock_client_coordinator.call_args.kwargs["scheduler"] is core.scheduler
+    breaker = core.circuit_breaker
+    assert mock_device_coordinator.call_args.kwargs["circuit_breaker"] is breaker
+    assert mock_client_coordinator.call_args.kwargs["circuit_breaker"] is breaker
+
+
+@patch("custom_components.unifi_network.core.create_no_verify_ssl_context")
+@patch("custom_components.unifi_network.core.client_context")
+@patch("custom_components.unifi_network.core.httpx")
+def test_create_transport_pool_limits(mock_httpx, mock_client_context, mock_no_verify):
+    """Test that the transport pools connections with the configured limits."""
+    create_transport(True, max_connections=4, keepalive_expiry=90)
+
+    mock_httpx.Limits.assert_called_once_with(
+        max_connections=4, max_keepalive_connections=4, keepalive_expiry=90
+    )
+    mock_httpx.AsyncHTTPTransport.assert_called_once_with(
+        verify=mock_client_context.return_value,
+        http2=False,
+        limits=mock_httpx.Limits.return_value,
+    )
+
+    create_transport(False)
+    assert (
+        mock_httpx.AsyncHTTPTransport.call_args.kwargs["verify"]
+        is mock_no_verify.return_value
+    )
+
+
+@pytest.mark.parametrize(("h2_spec", "http2"), [(Mock(), True), (None, False)])
+@patch("custom_components.unifi_network.core.httpx")
+def test_create_transport_http2(mock_httpx, h2_spec, http2):
+    """Test that HTTP/2 is only enabled when the h2 package is installed."""
+    with patch(
+        "custom_components.unifi_network.core.importlib.util.find_spec",
+        return_value=h2_spec,
+    ):
+        create_transport(True, http2=True)
+
+    assert mock_httpx.AsyncHTTPTransport.call_args.kwargs["http2"] is http2
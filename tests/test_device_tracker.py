@@ -5,7 +5,14 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from unittest.mock import Mock
 
-from custom_components.unifi_network.device_tracker import UnifiClientTracker
+# Import conftest to set up mocks
+import tests.conftest
+from custom_components.unifi_network.const import DOMAIN
+from custom_components.unifi_network.coordinator import UnifiClientCoordinator
+from custom_components.unifi_network.device_tracker import (
+    UnifiClientTracker,
+    async_setup_entry,
+)
 
 
 class TestUnifiClientTracker:
@@ -21,8 +28,7 @@ class TestUnifiClientTracker:
         client.ip = "192.168.1.10"
         client.last_seen = now
         client.uplink_device_id = "device_1"
-        client.overview = Mock()
-        client.overview.connected_at = "2026-01-01T00:00:00+00:00"
+        client.connected_at = "2026-01-01T00:00:00+00:00"
 
         client_coordinator = Mock()
         client_coordinator.data = {client_id: client}
@@ -57,8 +63,7 @@ class TestUnifiClientTracker:
         client.ip = "192.168.1.10"
         client.last_seen = None
         client.uplink_device_id = "device_1"
-        client.overview = Mock()
-        client.overview.connected_at = None
+        client.connected_at = None
 
         client_coordinator = Mock()
         client_coordinator.data = {client_id: client}
@@ -81,8 +86,7 @@ class TestUnifiClientTracker:
         client.ip = "192.168.1.10"
         client.last_seen = None
         client.uplink_device_id = "missing-device"
-        client.overview = Mock()
-        client.overview.connected_at = None
+        client.connected_at = None
 
         client_coordinator = Mock()
         client_coordinator.data = {client_id: client}
@@ -109,8 +113,7 @@ class TestUnifiClientTracker:
         client.ip = "192.168.1.10"
         client.last_seen = None
         client.uplink_device_id = None
-        client.overview = Mock()
-        client.overview.connected_at = None
+        client.connected_at = None
 
         client_coordinator = Mock()
         client_coordinator.data = {client_id: client}
@@ -138,3 +141,44 @@ class TestUnifiClientTracker:
         tracker = UnifiClientTracker(client_coordinator, client_id, None)
 
         assert tracker.extra_state_attributes is None
+
+
+async def test_setup_adds_trackers_for_restored_clients():
+    """Test that known clients restored from storage get an offline tracker."""
+    hass = tests.conftest.MockHomeAssistant()
+    store = tests.conftest.MockStore(
+        data={
+            "clients": {
+                "client-1": {
+                    "mac": "aa:bb:cc:dd:ee:ff",
+                    "name": "Laptop",
+                    "ip": "192.168.1.10",
+                    "last_seen": "2026-01-01T00:00:00+00:00",
+                }
+            }
+        }
+    )
+    coordinator = UnifiClientCoordinator(hass, Mock(), "test-site", store=store)
+    await coordinator._async_load_known_clients()
+    coordinator.data = {}
+    hass.data = {
+        DOMAIN: {
+            "entry-1": Mock(client_coordinator=coordinator, device_coordinator=None)
+        }
+    }
+    added: list[UnifiClientTracker] = []
+
+    await async_setup_entry(hass, Mock(entry_id="entry-1"), added.extend)
+
+    assert [tracker.client_id for tracker in added] == ["client-1"]
+    tracker = added[0]
+    assert tracker.state == "not_home"
+    assert tracker.device_info is not None
+    attrs = tracker.extra_state_attributes
+    assert attrs["mac"] == "aa:bb:cc:dd:ee:ff"
+    assert attrs["ip"] == "192.168.1.10"
+    assert attrs["last_seen"] == datetime(2026, 1, 1, tzinfo=UTC)
+
+    # Later refreshes do not add the restored client again
+    coordinator.async_update_listeners()
+    assert len(added) == 1
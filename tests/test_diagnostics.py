@@ -0,0 +1,78 @@
+"""Tests for the diagnostics platform."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+# Import conftest to set up mocks
+import tests.conftest
+from custom_components.unifi_network.const import DOMAIN
+from custom_components.unifi_network.coordinator import UnifiDeviceCoordinator
+from custom_components.unifi_network.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+async def test_config_entry_diagnostics():
+    """Test that kept payloads are included with personal data redacted."""
+    hass = tests.conftest.MockHomeAssistant()
+    coordinator = UnifiDeviceCoordinator(
+        hass, Mock(), "test-site", keep_raw_payloads=True
+    )
+    payload = {"id": "device-123", "macAddress": "aa:bb:cc:dd:ee:ff", "model": "U7"}
+    coordinator.raw_payloads = {"device-123": payload}
+    coordinator.data = {"device-123": Mock()}
+    hass.data = {
+        DOMAIN: {
+            "entry-1": Mock(device_coordinator=coordinator, client_coordinator=None)
+        }
+    }
+    entry = Mock(
+        entry_id="entry-1",
+        data={"base_url": "https://unifi.example.com", "api_key": "secret"},
+        options={
+            "keep_raw_payloads": True,
+            "clients_filter": "macAddress.eq('aa:bb:cc:dd:ee:ff')",
+            "devices_models": ["U7"],
+        },
+    )
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert result["entry"]["data"] == {
+        "base_url": "**REDACTED**",
+        "api_key": "**REDACTED**",
+    }
+    assert result["entry"]["options"] == {
+        "keep_raw_payloads": True,
+        "clients_filter": "**REDACTED**",
+        "devices_models": "**REDACTED**",
+    }
+    assert result["clients"] is None
+    assert result["devices"]["items"] == 1
+    assert result["devices"]["raw_payloads"] == {
+        "device-123": {
+            "id": "device-123",
+            "macAddress": "**REDACTED**",
+            "model": "U7",
+        }
+    }
+    # The kept payloads themselves are not modified
+    assert payload["macAddress"] == "aa:bb:cc:dd:ee:ff"
+
+
+async def test_config_entry_diagnostics_without_payloads():
+    """Test that payloads are omitted unless the option keeps them."""
+    hass = tests.conftest.MockHomeAssistant()
+    coordinator = UnifiDeviceCoordinator(hass, Mock(), "test-site")
+    hass.data = {
+        DOMAIN: {
+            "entry-1": Mock(device_coordinator=coordinator, client_coordinator=None)
+        }
+    }
+    entry = Mock(entry_id="entry-1", data={}, options={})
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert result["devices"]["raw_payloads"] is None
+    assert result["devices"]["items"] == 0
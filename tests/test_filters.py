@@ -0,0 +1,160 @@
+"""Tests for the server-side filter builder."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from custom_components.unifi_network.filters import (
+    CLIENT_FILTER_PROPERTIES,
+    DEVICE_FILTER_PROPERTIES,
+    FilterError,
+    all_of,
+    any_of,
+    clients_filter_from_options,
+    condition,
+    devices_filter_from_options,
+    negate,
+    validate_filter,
+)
+
+
+class TestCondition:
+    """Test building single property conditions."""
+
+    def test_string_values_are_quoted(self):
+        """Test that string values are quoted and listed for in."""
+        assert (
+            condition(CLIENT_FILTER_PROPERTIES, "type", "in", "WIRED", "WIRELESS")
+            == "type.in('WIRED', 'WIRELESS')"
+        )
+
+    def test_mac_address_is_lowercased(self):
+        """Test that MAC addresses are written the way the controller stores them."""
+        assert (
+            condition(CLIENT_FILTER_PROPERTIES, "macAddress", "eq", "AA:BB:CC:DD:EE:FF")
+            == "macAddress.eq('aa:bb:cc:dd:ee:ff')"
+        )
+
+    def test_typed_values(self):
+        """Test that booleans and timestamps are written unquoted."""
+        assert (
+            condition(CLIENT_FILTER_PROPERTIES, "access.authorized", "eq", True)
+            == "access.authorized.eq(true)"
+        )
+        assert (
+            condition(
+                CLIENT_FILTER_PROPERTIES,
+                "connectedAt",
+                "gt",
+                datetime(2024, 1, 1, 12, tzinfo=UTC),
+            )
+            == "connectedAt.gt(2024-01-01T12:00:00Z)"
+        )
+        assert (
+            condition(CLIENT_FILTER_PROPERTIES, "macAddress", "isNull")
+            == "macAddress.isNull()"
+        )
+
+    def test_quotes_are_escaped(self):
+        """Test that quotes inside values do not end the string."""
+        assert (
+            condition(DEVICE_FILTER_PROPERTIES, "name", "like", "Bob's*")
+            == "name.like('Bob\\'s*')"
+        )
+
+    @pytest.mark.parametrize(
+        ("prop", "function", "values", "match"),
+        [
+            ("model", "eq", ("U6",), "not a filterable property"),
+            ("type", "like", ("W*",), "does not support like"),
+            ("type", "eq", (), "exactly one value"),
+            ("type", "in", (), "at least one value"),
+            ("access.authorized", "eq", ("yes",), "expects a boolean"),
+        ],
+    )
+    def test_invalid(self, prop, function, values, match):
+        """Test that conditions the endpoint does not support are rejected."""
+        with pytest.raises(FilterError, match=match):
+            condition(CLIENT_FILTER_PROPERTIES, prop, function, *values)
+
+
+class TestCombine:
+    """Test combining expressions."""
+
+    def test_all_of(self):
+        """Test that empty expressions are dropped and one is not wrapped."""
+        assert all_of(None, "") is None
+        assert all_of("type.eq('WIRED')", None) == "type.eq('WIRED')"
+        assert (
+            all_of("type.eq('WIRED')", negate("ipAddress.eq('10.0.0.1')"))
+            == "and(type.eq('WIRED'), not(ipAddress.eq('10.0.0.1')))"
+        )
+
+    def test_any_of(self):
+        """Test that alternatives are joined with or."""
+        assert any_of("a.eq(1)", "b.eq(2)") == "or(a.eq(1), b.eq(2))"
+
+
+class TestValidateFilter:
+    """Test validation of free-text filters."""
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "macAddress.eq('00:1a:2b:3c:4d:5e')",
+            "and(not(ipAddress.eq('192.168.1.5')), not(ipAddress.eq('192.168.1.10')))",
+            "or(type.in('WIRED', 'VPN'), access.type.eq('GUEST'))",
+            "connectedAt.ge(2024-01-01T00:00:00Z)",
+            "ipAddress.isNotNull()",
+            "access.authorized.eq(true)",
+        ],
+    )
+    def test_valid(self, expression):
+        """Test that documented expressions are accepted."""
+        validate_filter(expression, CLIENT_FILTER_PROPERTIES)
+
+    @pytest.mark.parametrize(
+        ("expression", "match"),
+        [
+            ("model.eq('U6')", "not a filterable property"),
+            ("macAddress.like('aa*')", "does not support like"),
+            ("type.eq('WIRED'", "Expected ',' or '\\)'"),
+            ("type.eq('WIRED'))", "Unexpected"),
+            ("and(type.eq('WIRED'))", "at least two"),
+            ("not(type.eq('WIRED'), type.eq('VPN'))", "exactly one"),
+            ("type.eq()", "exactly one value"),
+            ("type = 'WIRED'", "Expected '\\('"),
+            ("", "Expected a condition"),
+        ],
+    )
+    def test_invalid(self, expression, match):
+        """Test that malformed or unsupported expressions are rejected."""
+        with pytest.raises(FilterError, match=match):
+            validate_filter(expression, CLIENT_FILTER_PROPERTIES)
+
+    def test_device_properties(self):
+        """Test that device filters are checked against device properties."""
+        validate_filter("features.contains('switching')", DEVICE_FILTER_PROPERTIES)
+        with pytest.raises(FilterError):
+            validate_filter("type.eq('WIRED')", DEVICE_FILTER_PROPERTIES)
+
+
+class TestFiltersFromOptions:
+    """Test composing the filters sent by the coordinators."""
+
+    def test_empty_options(self):
+        """Test that no filter is sent without options."""
+        assert devices_filter_from_options({}) is None
+        assert clients_filter_from_options({"clients_types": []}) is None
+
+    def test_structured_and_free_text(self):
+        """Test that selections are combined with the free-text filter."""
+        assert clients_filter_from_options(
+            {"clients_types": ["WIRED"], "clients_filter": "ipAddress.isNotNull()"}
+        ) == ("and(type.in('WIRED'), ipAddress.isNotNull())")
+        assert (
+            devices_filter_from_options({"devices_models": ["U6-Pro", "USW-24"]})
+            == "model.in('U6-Pro', 'USW-24')"
+        )
@@ -0,0 +1,225 @@
+"""Tests for the shared request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+# Import conftest to set up mocks
+import tests.conftest  # noqa: F401
+from custom_components.unifi_network.scheduler import (
+    AdaptiveInterval,
+    CircuitBreaker,
+    RequestScheduler,
+)
+
+
+class TestRequestScheduler:
+    """Test the RequestScheduler class."""
+
+    async def test_run_returns_result(self):
+        """Test that run awaits the call and returns its result."""
+        scheduler = RequestScheduler()
+
+        async def call(value, *, suffix):
+            return f"{value}{suffix}"
+
+        assert await scheduler.run(call, "a", suffix="b") == "ab"
+
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrent_requests calls run at once."""
+        scheduler = RequestScheduler(max_concurrent_requests=2)
+        in_flight = 0
+        peak = 0
+
+        async def call():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await asyncio.gather(*(scheduler.run(call) for _ in range(6)))
+
+        assert peak == 2
+
+    async def test_requests_start_in_submission_order(self):
+        """Test that queued calls are started first-in first-out."""
+        scheduler = RequestScheduler(max_concurrent_requests=1)
+        started: list[int] = []
+
+        async def call(index):
+            started.append(index)
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*(scheduler.run(call, index) for index in range(5)))
+
+        assert started == [0, 1, 2, 3, 4]
+
+    async def test_rate_limit_spaces_out_requests(self):
+        """Test that the token bucket delays requests beyond the burst."""
+        scheduler = RequestScheduler(
+            max_concurrent_requests=10, max_requests_per_second=50
+        )
+        loop = asyncio.get_running_loop()
+
+        async def call():
+            return loop.time()
+
+        # Drain the initial burst, then time the next few requests
+        await asyncio.gather(*(scheduler.run(call) for _ in range(50)))
+        times = await asyncio.gather(*(scheduler.run(call) for _ in range(5)))
+
+        assert max(times) - min(times) >= 0.06
+
+    async def test_wrap_routes_through_scheduler(self):
+        """Test that wrapped calls share the scheduler's concurrency limit."""
+        scheduler = RequestScheduler(max_concurrent_requests=1)
+        in_flight = 0
+        peak = 0
+
+        async def call(offset):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return offset
+
+        wrapped = scheduler.wrap(call)
+        results = await asyncio.gather(*(wrapped(offset=i) for i in range(3)))
+
+        assert results == [0, 1, 2]
+        assert peak == 1
+        assert wrapped.__wrapped__ is call
+
+    def test_invalid_limits_are_clamped(self):
+        """Test that out-of-range option values fall back to safe limits."""
+        scheduler = RequestScheduler(
+            max_concurrent_requests=0, max_requests_per_second=-1
+        )
+
+        assert scheduler.max_concurrent_requests == 1
+        assert scheduler.max_requests_per_second == 0
+
+
+class TestAdaptiveInterval:
+    """Test the AdaptiveInterval class."""
+
+    def test_initial_interval_is_clamped(self):
+        """Test that the starting interval respects the bounds."""
+        assert AdaptiveInterval(30, 60, 120).interval == 60
+        assert AdaptiveInterval(30, 10, 20).interval == 20
+        assert not AdaptiveInterval(30, 30, 30).adaptive
+
+    def test_churn_shortens_interval(self):
+        """Test that many changes halve the interval down to the minimum."""
+        interval = AdaptiveInterval(30, 10, 120)
+
+        assert interval.record(0.1, changed_fraction=0.5) == 15
+        assert interval.record(0.1, changed_fraction=0.5) == 10
+
+    def test_quiet_lengthens_interval(self):
+        """Test that unchanged snapshots grow the interval up to the maximum."""
+        interval = AdaptiveInterval(30, 10, 40)
+
+        assert interval.record(0.1, changed_fraction=0) == 37.5
+        assert interval.record(0.1, changed_fraction=0) == 40
+
+    def test_small_change_and_first_refresh_hold(self):
+        """Test that few changes or no previous snapshot keep the interval."""
+        interval = AdaptiveInterval(30, 10, 120)
+
+        assert interval.record(0.1) == 30
+        assert interval.record(0.1, changed_fraction=0.01) == 30
+
+    def test_failure_backs_off(self):
+        """Test that failed refreshes double the interval."""
+        interval = AdaptiveInterval(30, 10, 120)
+
+        assert interval.record(5, failed=True, changed_fraction=1) == 60
+        assert interval.latency is None
+
+    def test_recovers_from_failure_backoff(self):
+        """Test that small changes after a failure bring back the prior interval."""
+        interval = AdaptiveInterval(30, 10, 120)
+        interval.record(0.1, failed=True)
+        interval.record(0.1, failed=True)
+
+        assert interval.interval == 120
+        assert interval.record(0.1, changed_fraction=0.01) == 60
+        assert interval.record(0.1, changed_fraction=0.01) == 30
+        assert interval.record(0.1, changed_fraction=0.01) == 30
+
+    def test_rising_latency_backs_off(self):
+        """Test that latency well above the best seen lengthens the interval."""
+        interval = AdaptiveInterval(30, 10, 120)
+        interval.record(1.0, changed_fraction=0.01)
+
+        assert interval.record(2.0, changed_fraction=0.5) == 15
+        assert interval.record(10.0, changed_fraction=0.5) == 22.5
+
+    def test_fast_latency_never_slow(self):
+        """Test that sub-second latency changes are not treated as slowness."""
+        interval = AdaptiveInterval(30, 10, 120)
+        interval.record(0.01, changed_fraction=0.01)
+
+        assert interval.record(0.5, changed_fraction=0.5) == 15
+
+
+class TestCircuitBreaker:
+    """Test pausing refreshes while the controller keeps failing."""
+
+    def _breaker(self, mock_time, now=0.0) -> CircuitBreaker:
+        """Return a breaker opening after two failures for 30 to 120 seconds."""
+        mock_time.monotonic.return_value = now
+        return CircuitBreaker(threshold=2, cooldown=30, max_cooldown=120)
+
+    def test_opens_after_threshold(self):
+        """Test that refreshes are skipped once enough failed in a row."""
+        with patch("custom_components.unifi_network.scheduler.time") as mock_time:
+            breaker = self._breaker(mock_time)
+            breaker.record_failure()
+            assert breaker.allow()
+            breaker.record_failure()
+
+            assert breaker.is_open
+            assert not breaker.allow()
+            mock_time.monotonic.return_value = 10
+            assert breaker.retry_in() == 20
+
+    def test_success_resets_failure_count(self):
+        """Test that failures must be consecutive to open the breaker."""
+        with patch("custom_components.unifi_network.scheduler.time") as mock_time:
+            breaker = self._breaker(mock_time)
+            breaker.record_failure()
+            breaker.record_success()
+            breaker.record_failure()
+
+            assert not breaker.is_open
+
+    def test_single_probe_after_cooldown(self):
+        """Test that only one refresh is let through once the cooldown ends."""
+        with patch("custom_components.unifi_network.scheduler.time") as mock_time:
+            breaker = self._breaker(mock_time)
+            breaker.record_failure()
+            breaker.record_failure()
+            mock_time.monotonic.return_value = 30
+
+            assert breaker.allow()
+            assert not breaker.allow()
+            breaker.record_success()
+            assert not breaker.is_open
+            assert breaker.allow()
+
+    def test_failed_probe_doubles_cooldown(self):
+        """Test that the pause grows while probes fail, up to max_cooldown."""
+        with patch("custom_components.unifi_network.scheduler.time") as mock_time:
+            breaker = self._breaker(mock_time)
+            breaker.record_failure()
+            breaker.record_failure()
+            for now, cooldown in ((30, 60), (90, 120), (210, 120)):
+                mock_time.monotonic.return_value = now
+                assert breaker.allow()
+                breaker.record_failure()
+                assert breaker.retry_in() == cooldown
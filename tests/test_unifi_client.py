@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from custom_components.unifi_network.api_client.models import WiredClientOverview
 from custom_components.unifi_network.api_client.types import Unset
-from custom_components.unifi_network.unifi_client import UnifiClient
+from custom_components.unifi_network.unifi_client import (
+    UnifiClient,
+    UnifiClientRecord,
+)
 
 
 class TestUnifiClient:
@@ -203,6 +207,48 @@ class TestUnifiClient:
 
         assert client.uplink_device_id is None
 
+    def test_typed_client_fields(self):
+        """Test that wired and wireless models provide MAC and uplink directly."""
+        overview = WiredClientOverview.from_dict(
+            {
+                "type": "WIRED",
+                "id": "497f6eca-6276-4993-bfeb-53cbbbba6f08",
+                "name": "Desktop",
+                "access": {"type": "DEFAULT"},
+                "macAddress": "aa:bb:cc:dd:ee:ff",
+                "uplinkDeviceId": "9d3a57a5-6a39-4d4d-a2c8-b5b5b0a5f0a0",
+            }
+        )
+
+        client = UnifiClient(overview=overview, details=None)
+
+        assert client.mac == "aa:bb:cc:dd:ee:ff"
+        assert client.uplink_device_id == "9d3a57a5-6a39-4d4d-a2c8-b5b5b0a5f0a0"
+        assert client.type_ == "WIRED"
+        assert type(client.type_) is str
+
+    def test_malformed_lazy_fields_read_as_none(self):
+        """Test that fields a lazy model cannot decode read as None."""
+        overview = WiredClientOverview.from_dict_lazy(
+            {
+                "type": "WIRED",
+                "id": "497f6eca-6276-4993-bfeb-53cbbbba6f08",
+                "name": "Desktop",
+                "access": {"type": "DEFAULT"},
+                "macAddress": "aa:bb:cc:dd:ee:ff",
+                "uplinkDeviceId": "not-a-uuid",
+                "connectedAt": "not a timestamp",
+            }
+        )
+        client = UnifiClient(overview=overview, details=None)
+
+        record = UnifiClientRecord.from_client(client)
+
+        assert record.uplink_device_id is None
+        assert record.connected_at is None
+        assert record.name == "Desktop"
+        assert record.mac == "aa:bb:cc:dd:ee:ff"
+
     def test_device_info_with_complete_data(self):
         """Test DeviceInfo generation with complete client data."""
         mock_overview = MagicMock()
@@ -320,3 +366,70 @@ class TestUnifiClient:
 
         # Should prefer overview MAC
         assert client.mac == "overview:mac:addr"
+
+    def test_derived_values_are_cached_per_snapshot(self):
+        """Test that derived values are computed once and refreshed on update."""
+        mock_overview = MagicMock()
+        mock_overview.id = "client_123"
+        mock_overview.additional_properties = {"macAddress": "aa:bb:cc:dd:ee:ff"}
+
+        client = UnifiClient(overview=mock_overview, details=None)
+
+        with patch(
+            "custom_components.unifi_network.unifi_client.DeviceInfo", side_effect=dict
+        ):
+            device_info = client.device_info
+            assert client.device_info is device_info
+        assert client.mac == "aa:bb:cc:dd:ee:ff"
+
+        # In-place changes to the same snapshot are not picked up
+        mock_overview.additional_properties = {"macAddress": "11:22:33:44:55:66"}
+        assert client.mac == "aa:bb:cc:dd:ee:ff"
+
+        new_overview = MagicMock()
+        new_overview.id = "client_123"
+        new_overview.additional_properties = {"macAddress": "11:22:33:44:55:66"}
+        client.update(UnifiClient(overview=new_overview, details=None))
+
+        assert client.mac == "11:22:33:44:55:66"
+        with patch(
+            "custom_components.unifi_network.unifi_client.DeviceInfo", side_effect=dict
+        ):
+            assert client.device_info is not device_info
+
+    def test_vendor_change_refreshes_device_info(self):
+        """Test that setting the vendor invalidates the cached DeviceInfo."""
+        mock_overview = MagicMock()
+        mock_overview.id = "client_123"
+        mock_overview.additional_properties = {}
+
+        client = UnifiClient(overview=mock_overview, details=None)
+        with patch(
+            "custom_components.unifi_network.unifi_client.DeviceInfo", side_effect=dict
+        ):
+            device_info = client.device_info
+            client.vendor = "Apple"
+
+            assert client.device_info is not device_info
+            assert client.device_info["manufacturer"] == "Apple"
+
+    def test_record_round_trip(self):
+        """Test that a record survives storing and loading."""
+        connected_at = datetime(2023, 6, 15, 9, 0, 0, tzinfo=UTC)
+        last_seen = datetime(2023, 6, 15, 10, 30, 0, tzinfo=UTC)
+        record = UnifiClientRecord(
+            id="client_123",
+            mac="aa:bb:cc:dd:ee:ff",
+            name="My iPhone",
+            ip=None,
+            uplink_device_id="device_1",
+            type_="WIRELESS",
+            last_seen=last_seen,
+            connected_at=connected_at,
+        )
+
+        stored = record.as_dict()
+
+        assert "ip" not in stored
+        assert "vendor" not in stored
+        assert UnifiClientRecord.from_dict("client_123", stored) == record
@@ -192,3 +192,51 @@ class TestUnifiDevice:
 
             assert device.firmware_version is None
             assert device.firmware_updatable is False
+
+    def test_get_port_and_radio_use_index(self, basic_device_overview):
+        """Test that ports and radios are looked up by idx and frequency."""
+        port_1 = Mock(idx=1)
+        port_2 = Mock(idx=2)
+        duplicate_port_1 = Mock(idx=1)
+        details = Mock()
+        details.interfaces.ports = [port_1, port_2, duplicate_port_1]
+        radio_2g = Mock(frequency_g_hz=2.4)
+        radio_5g = Mock(frequency_g_hz=5)
+        stats = Mock()
+        stats.interfaces.radios = [radio_2g, radio_5g]
+
+        device = UnifiDevice(
+            overview=basic_device_overview, latest_statistics=stats, details=details
+        )
+        device.build_indexes()
+
+        assert device.get_port(1) is port_1
+        assert device.get_port(2) is port_2
+        assert device.get_port(3) is None
+        assert device.get_radio(2.4) is radio_2g
+        assert device.get_radio(5) is radio_5g
+        assert device.get_radio(6) is None
+
+    def test_get_port_without_details(self, basic_device_overview):
+        """Test that lookups build the index lazily and tolerate missing data."""
+        device = UnifiDevice(
+            overview=basic_device_overview, latest_statistics=None, details=None
+        )
+
+        assert device.get_port(1) is None
+        assert device.get_radio(2.4) is None
+
+    def test_device_info_is_cached_per_overview(self, basic_device_overview):
+        """Test that DeviceInfo is built once per overview object."""
+        device = UnifiDevice(
+            overview=basic_device_overview, latest_statistics=None, details=None
+        )
+
+        with patch(
+            "custom_components.unifi_network.unifi_device.DeviceInfo", side_effect=dict
+        ):
+            device_info = device.device_info
+            assert device.device_info is device_info
+
+            device.overview = Mock(id="device-123", mac_address=None)
+            assert device.device_info is not device_info